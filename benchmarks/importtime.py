@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+"""
+Import time benchmark
+
+Imports parts of the package in a fresh interpreter with
+`python -X importtime` and fails if a module that should be loaded
+lazily was imported, or if the import took longer than the budget.
+
+Usage: python3 benchmarks/importtime.py [--budget MS] [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECKS = {
+    "wordsearch.Game": [
+        "tkinter",
+        "wordsearch.GUI",
+        "wordsearch.Settings",
+        "wordsearch.App",
+        "json",
+        "pkgutil",
+        "pickle",
+        "concurrent.futures"
+    ],
+    "wordsearch.cli": [
+        "tkinter",
+        "wordsearch.GUI",
+        "wordsearch.Settings",
+        "wordsearch.App",
+        "concurrent.futures",
+        "multiprocessing"
+    ]
+}
+"""Module to import mapped to modules it must not load"""
+
+
+def importTimes(module: str) -> dict[str, int]:
+    """
+    importTimes Import a module in a fresh interpreter
+
+    :param module: Module to import
+    :type module: str
+    :return: Cumulative import time in microseconds of every module
+        loaded
+    :rtype: dict[str, int]
+    """
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check package import time")
+    parser.add_argument("--budget", type=float, default=100, help="Maximum median import time in ms (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs per module (default: %(default)s)")
+    args = parser.parse_args()
+
+    failed = False
+    for module, forbidden in CHECKS.items():
+        runs = [importTimes(module) for i in range(args.runs)]
+
+        loaded = [i for i in forbidden if i in runs[0]]
+        if loaded:
+            print(f"FAIL {module} imported {', '.join(loaded)}")
+            failed = True
+
+        median = statistics.median(i[module] for i in runs) / 1000
+        status = "ok" if median <= args.budget else "FAIL"
+        print(f"{status} {module} {median:.1f} ms (budget {args.budget} ms)")
+        failed = failed or median > args.budget
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
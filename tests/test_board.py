@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+
+from wordsearch.Game import Board
+
+WORDS = ["apple", "pear", "plum", "kiwi", "melon", "grape", "lemon", "lime"]
+
+
+class TestReference(unittest.TestCase):
+    def testRegenerate(self) -> None:
+        board = Board()
+        board.generate(12, 12, WORDS, 5, seed=1)
+        copy = Board.fromReference(board.reference(), WORDS)
+        self.assertEqual(copy.dumps(), board.dumps())
+
+    def testLoaded(self) -> None:
+        small = Board()
+        small.generate(8, 8, WORDS, 2, seed=2)
+
+        board = Board()
+        board.generate(12, 12, WORDS, 5, seed=1, unique=True)
+        board.loads(small.dumps())
+        self.assertIsNone(board.seed)
+        self.assertIsNone(board.reference())
+        self.assertEqual(board.repair_rounds, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
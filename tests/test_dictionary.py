@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+import unittest
+
+from wordsearch.Game import Dictionary
+from wordsearch.Game.Dictionary import Sampler
+from wordsearch.Game.Errors import OutOfWordsError
+
+WORDS = [
+    "a", "be", "at", "cat", "dog", "fish", "bird", "frog", "horse",
+    "mouse", "tiger", "zebra", "monkey", "rabbit", "giraffe", "elephant"
+]
+
+
+class TestSampler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(7)
+        self.dictionary = Dictionary(WORDS)
+
+    def _drain(self, sampler: Sampler, max_length: int, min_length: int = 1) -> list[str]:
+        words = []
+        while True:
+            try:
+                words.append(sampler.pick(max_length, self.rng, min_length))
+            except OutOfWordsError:
+                return words
+
+    def testWithoutReplacement(self) -> None:
+        for i in range(20):
+            sampler = self.dictionary.sampler(6)
+            words = self._drain(sampler, 6)
+            self.assertCountEqual(words, [i for i in WORDS if len(i) <= 6])
+            self.assertEqual(sampler.remaining(6), 0)
+
+    def testLengths(self) -> None:
+        sampler = self.dictionary.sampler(8)
+        words = self._drain(sampler, 5, 3)
+        self.assertCountEqual(words, [i for i in WORDS if 3 <= len(i) <= 5])
+        # Other buckets are untouched
+        self.assertCountEqual(self._drain(sampler, 8), [i for i in WORDS if not 3 <= len(i) <= 5])
+
+    def testPutBack(self) -> None:
+        for i in range(20):
+            sampler = self.dictionary.sampler(8)
+            drawn: set[str] = set()
+            for j in range(30):
+                if drawn and self.rng.random() < 0.4:
+                    word = self.rng.choice(sorted(drawn))
+                    sampler.putBack(word)
+                    drawn.remove(word)
+                elif sampler.remaining(8) > 0:
+                    word = sampler.pick(8, self.rng)
+                    self.assertNotIn(word, drawn)
+                    drawn.add(word)
+            self.assertEqual(sampler.remaining(8), len(WORDS) - len(drawn))
+            self.assertCountEqual(self._drain(sampler, 8), set(WORDS) - drawn)
+
+
+if __name__ == "__main__":
+    unittest.main()
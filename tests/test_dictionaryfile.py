@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import wordsearch.Game.DictionaryFile
+from wordsearch.Game import Board
+
+# Lengths first appear out of order so a cached dictionary buckets them
+# in a different order to a fresh one
+WORDS = ["apple", "banana", "pear", "fig", "cherry", "plum", "kiwi", "melon"]
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "words.txt")
+        self._cache = os.path.join(self._dir, "cache")
+        with open(self._path, "w") as f:
+            f.write("\n".join(WORDS))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._dir)
+
+    def testSameBoard(self) -> None:
+        fresh = wordsearch.Game.DictionaryFile.load(self._path, self._cache)
+        cached = wordsearch.Game.DictionaryFile.load(self._path, self._cache)
+        self.assertEqual(fresh.digest(), cached.digest())
+
+        boards = []
+        for dictionary in (fresh, cached):
+            board = Board()
+            board.generate(10, 10, dictionary, 4, seed=3)
+            boards.append(board.dumps())
+        self.assertEqual(boards[0], boards[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
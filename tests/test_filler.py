@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+import unittest
+from collections import Counter
+
+from wordsearch.constants import ALPHABET, LETTER_FREQUENCIES
+from wordsearch.Game import Filler
+
+DRAWS = 100000
+
+
+class TestFiller(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(3)
+
+    def _assertFrequencies(self, filler: Filler, frequencies: dict[str, float]) -> None:
+        total = sum(frequencies.values())
+        counts = Counter(filler.sample(DRAWS, self.rng))
+        self.assertLessEqual(set(counts), {i for i in frequencies if frequencies[i] > 0})
+        for letter, frequency in frequencies.items():
+            self.assertAlmostEqual(counts[letter]/DRAWS, frequency/total, delta=0.01, msg=letter)
+
+    def testFrequencies(self) -> None:
+        frequencies = {"a": 5, "b": 3, "c": 1.5, "d": 0.5, "e": 0}
+        self._assertFrequencies(Filler(frequencies), frequencies)
+
+    def testEnglish(self) -> None:
+        frequencies = {i: LETTER_FREQUENCIES.get(i, 0) for i in ALPHABET}
+        self._assertFrequencies(Filler.english(), frequencies)
+
+    def testFromWords(self) -> None:
+        words = ["banana", "apple", "cherry"]
+        self._assertFrequencies(Filler.fromWords(words), Counter("".join(words)))
+
+    def testOrder(self) -> None:
+        frequencies = {"x": 1, "y": 2, "z": 3}
+        first = Filler(frequencies).sample(100, random.Random(1))
+        second = Filler(dict(reversed(frequencies.items()))).sample(100, random.Random(1))
+        self.assertEqual(first, second)
+
+    def testEmpty(self) -> None:
+        with self.assertRaises(ValueError):
+            Filler({"a": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import wordsearch.Game.PuzzleFile
+from wordsearch.Game import Board, Journal
+from wordsearch.Game.Errors import PuzzleFileError
+
+WORDS = ["apple", "pear", "plum", "kiwi", "melon", "grape"]
+
+
+class TestLoad(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "test.puzzle")
+        board = Board()
+        board.generate(8, 8, WORDS, 3, seed=1)
+        board.save(self._path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._dir)
+
+    def testMismatchLeavesBoard(self) -> None:
+        size, checksum = wordsearch.Game.PuzzleFile.checksum(self._path)
+        Journal.append(
+            Journal.journalPath(self._path),
+            [Journal.Record(Journal.FOUND, 0, 99, 0)],
+            size,
+            checksum
+        )
+
+        board = Board()
+        board.generate(30, 30, WORDS, 4, seed=2)
+        data = board.dumps()
+        changes = []
+        board.listen(lambda change, items: changes.append(change))
+        with self.assertRaises(PuzzleFileError):
+            board.load(self._path)
+        self.assertEqual(board.dumps(), data)
+        self.assertEqual(board.width, 30)
+        self.assertEqual(changes, [])
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "test.puzzle")
+        self._journal = Journal.journalPath(self._path)
+        self._board = Board()
+        self._board.generate(8, 8, WORDS, 3, seed=1)
+        self._board.save(self._path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._dir)
+
+    def _records(self) -> list[Journal.Record]|None:
+        size, checksum = wordsearch.Game.PuzzleFile.checksum(self._path)
+        return Journal.read(self._journal, size, checksum)
+
+    def testFullSave(self) -> None:
+        self.assertFalse(os.path.exists(self._journal))
+
+    def testReplay(self) -> None:
+        self._board.select(1, 2)
+        self._board.select(2, 2)
+        self._board.save(self._path)
+        self._board.undoSelect()
+        self._board.markFound(2)
+        self._board.save(self._path)
+        self.assertEqual(
+            [i.action for i in self._records()],
+            [Journal.SELECT, Journal.SELECT, Journal.UNDO, Journal.FOUND]
+        )
+
+        board = Board()
+        board.load(self._path)
+        self.assertEqual(board.selection, [(1, 2)])
+        self.assertEqual(board.found_words, [2])
+        self.assertEqual(board.dumps(), self._board.dumps())
+
+    def testTruncatedTail(self) -> None:
+        self._board.select(1, 2)
+        self._board.select(2, 2)
+        self._board.save(self._path)
+        size = os.path.getsize(self._journal)
+        with open(self._journal, "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        self.assertEqual(len(self._records()), 2)
+        self.assertEqual(os.path.getsize(self._journal), size)
+        board = Board()
+        board.load(self._path)
+        self.assertEqual(board.selection, [(1, 2), (2, 2)])
+
+    def testOtherPuzzle(self) -> None:
+        self._board.select(1, 2)
+        self._board.save(self._path)
+        with open(self._journal, "r+b") as f:
+            f.seek(len(Journal.MAGIC) + 2)
+            f.write(b"\xff")
+
+        self.assertIsNone(self._records())
+        board = Board()
+        board.load(self._path)
+        self.assertEqual(board.selection, [])
+
+        # The next append starts a journal for this puzzle again
+        board.select(3, 3)
+        board.save(self._path)
+        self.assertEqual(len(self._records()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+import unittest
+
+from wordsearch.Game.Placer import Placer
+
+DIRECTIONS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+
+
+def _recount(cells: list[str], width: int, height: int, direction: tuple[int, int]) -> dict[int, int]:
+    """Free runs in one direction, found by walking every empty cell"""
+
+    dx, dy = direction
+    runs = {}
+    for y in range(height):
+        for x in range(width):
+            if cells[y*width + x] != "\0":
+                continue
+            px = x - dx
+            py = y - dy
+            if 0 <= px < width and 0 <= py < height and cells[py*width + px] == "\0":
+                continue
+            length = 0
+            cx = x
+            cy = y
+            while 0 <= cx < width and 0 <= cy < height and cells[cy*width + cx] == "\0":
+                length += 1
+                cx += dx
+                cy += dy
+            runs[y*width + x] = length
+    return runs
+
+
+class TestPlacer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(5)
+
+    def testRuns(self) -> None:
+        for i in range(100):
+            width = self.rng.randint(1, 9)
+            height = self.rng.randint(1, 9)
+            placer = Placer(width, height, DIRECTIONS)
+            for step in range(40):
+                x = self.rng.randrange(width)
+                y = self.rng.randrange(height)
+                if self.rng.random() < 0.6:
+                    placer.fill(x, y, self.rng.choice("ab"))
+                else:
+                    placer.clear(x, y)
+                cells = placer.cells()
+                for d, direction in enumerate(DIRECTIONS):
+                    self.assertEqual(placer.runs(d), _recount(cells, width, height, direction))
+
+    def testChoose(self) -> None:
+        for i in range(100):
+            width = self.rng.randint(1, 9)
+            height = self.rng.randint(1, 9)
+            placer = Placer(width, height, DIRECTIONS)
+            for step in range(width*height):
+                placer.fill(self.rng.randrange(width), self.rng.randrange(height), "a")
+                cells = placer.cells()
+                longest = max(
+                    max(_recount(cells, width, height, direction).values(), default=0)
+                    for direction in DIRECTIONS
+                )
+                for length in range(1, 6):
+                    position = placer.choose(length, self.rng)
+                    if position is None:
+                        self.assertLess(longest, length)
+                        continue
+                    x, y, (dx, dy) = position
+                    for j in range(length):
+                        self.assertTrue(0 <= x + j*dx < width and 0 <= y + j*dy < height)
+                        self.assertEqual(cells[(y + j*dy)*width + x + j*dx], "\0")
+
+    def testChooseCrossing(self) -> None:
+        placer = Placer(10, 10, DIRECTIONS)
+        placer.place("cat", 2, 2, (1, 0))
+        for i in range(50):
+            position = placer.chooseCrossing("tea", self.rng)
+            self.assertIsNotNone(position)
+            self.assertIn(placer.shared("tea", *position), (1, 2))
+        self.assertIsNone(placer.chooseCrossing("dog", self.rng))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import wordsearch.Game.PuzzleFile
+from wordsearch.Game import Board
+from wordsearch.Game.Errors import PuzzleFileError
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+# legacy.puzzle was pickled by version 0.2.1 from a 12x12 board with the
+# words kiwi, apple and grape. apple is found and the top left cell is
+# selected.
+LEGACY = os.path.join(DATA, "legacy.puzzle")
+
+
+class TestSelection(unittest.TestCase):
+    def testOrderKept(self) -> None:
+        board = Board()
+        board.generate(6, 6, ["apple", "pear", "plum"], 2, seed=1)
+        # Right to left and bottom to top
+        for x, y in ((5, 5), (4, 5), (3, 4), (0, 0)):
+            board.select(x, y)
+
+        copy = Board()
+        copy.loads(board.dumps())
+        self.assertEqual(copy.selection, [(5, 5), (4, 5), (3, 4), (0, 0)])
+
+        copy.undoSelect()
+        self.assertEqual(copy.selection, [(5, 5), (4, 5), (3, 4)])
+
+
+class TestLegacy(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "legacy.puzzle")
+        shutil.copyfile(LEGACY, self._path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._dir)
+
+    def _check(self, board: Board) -> None:
+        self.assertEqual([i.word for i in board.word_list], ["kiwi", "apple", "grape"])
+        self.assertEqual(board.found_words, [1])
+        self.assertEqual(board.selection, [(0, 0)])
+        self.assertEqual((board.width, board.height), (12, 12))
+
+    def testConvert(self) -> None:
+        self.assertTrue(wordsearch.Game.PuzzleFile.convert(self._path))
+        self.assertTrue(wordsearch.Game.PuzzleFile.isPuzzle(self._path))
+        board = Board()
+        board.load(self._path)
+        self._check(board)
+
+    def testLoadRefused(self) -> None:
+        board = Board()
+        with self.assertRaises(PuzzleFileError):
+            board.load(self._path)
+        self.assertFalse(board.loaded)
+
+    def testLoadLegacy(self) -> None:
+        board = Board()
+        board.load(self._path, legacy=True)
+        self._check(board)
+
+    def testRoundTrip(self) -> None:
+        wordsearch.Game.PuzzleFile.convert(self._path)
+        board = Board()
+        board.load(self._path)
+        path = os.path.join(self._dir, "copy.puzzle")
+        board.save(path)
+
+        copy = Board()
+        copy.load(path)
+        self._check(copy)
+        self.assertEqual(copy.dumps(), board.dumps())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from wordsearch.Game import Board, PackWriter, PuzzlePack
+from wordsearch.Game.Errors import PuzzleFileError
+
+WORDS = ["apple", "pear", "plum", "kiwi", "melon", "grape", "lemon", "lime"]
+
+
+def _boards(count: int, first: int = 0) -> list[Board]:
+    boards = []
+    for i in range(first, first + count):
+        board = Board()
+        board.generate(8, 8, WORDS, 3, seed=i)
+        boards.append(board)
+    return boards
+
+
+class TestPack(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, "test.pack")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self._dir)
+
+    def _write(self, boards: list[Board], compression: str|None = None, append: bool = False) -> None:
+        with PackWriter(self._path, compression, append=append) as writer:
+            for board in boards:
+                writer.add(board)
+
+    def _assertPack(self, boards: list[Board]) -> None:
+        with PuzzlePack(self._path) as pack:
+            self.assertEqual(len(pack), len(boards))
+            self.assertEqual([i.dumps() for i in pack], [i.dumps() for i in boards])
+
+    def testRandomAccess(self) -> None:
+        boards = _boards(5)
+        self._write(boards, "zlib")
+        with PuzzlePack(self._path) as pack:
+            self.assertEqual(pack[3].dumps(), boards[3].dumps())
+            self.assertEqual(pack[0].dumps(), boards[0].dumps())
+            self.assertEqual(pack[-1].dumps(), boards[4].dumps())
+            self.assertEqual(pack[-5].dumps(), boards[0].dumps())
+            with self.assertRaises(IndexError):
+                pack[5]
+            with self.assertRaises(IndexError):
+                pack[-6]
+
+    def testAppend(self) -> None:
+        boards = _boards(5)
+        self._write(boards[:3])
+        self._write(boards[3:], "lzma", append=True)
+        self._assertPack(boards)
+
+    def testInterruptedAppend(self) -> None:
+        boards = _boards(4)
+        self._write(boards[:2])
+        # An append that died before writing its index and trailer
+        with open(self._path, "ab") as f:
+            f.write(boards[2].dumps())
+        self._assertPack(boards[:2])
+
+        self._write(boards[2:], append=True)
+        self._assertPack(boards)
+
+    def testNotPack(self) -> None:
+        with open(self._path, "wb") as f:
+            f.write(b"\0"*64)
+        with self.assertRaises(PuzzleFileError):
+            PuzzlePack(self._path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+import unittest
+
+from wordsearch.Game import Solver
+from wordsearch.Game.Solver import Occurrence
+
+DIRECTIONS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+
+
+def _grid(rows: list[str]) -> list[list[str]]:
+    return [list(row) for row in rows]
+
+
+def _key(occurrence: Occurrence) -> tuple:
+    # Palindromes may be reported in either direction
+    word, x, y, (dx, dy) = occurrence
+    ends = ((x, y), (x + (len(word)-1)*dx, y + (len(word)-1)*dy))
+    if word.upper() == word.upper()[::-1]:
+        return (word, frozenset(ends))
+    return (word, ends)
+
+
+def _bruteForce(grid: list[list[str]], words: set[str]) -> set[tuple]:
+    height = len(grid)
+    width = len(grid[0])
+    found = set()
+    for word in words:
+        for y in range(height):
+            for x in range(width):
+                for dx, dy in DIRECTIONS:
+                    cells = [(x + i*dx, y + i*dy) for i in range(len(word))]
+                    if not all(0 <= i < width and 0 <= j < height for i, j in cells):
+                        continue
+                    if "".join(grid[j][i] for i, j in cells).upper() == word.upper():
+                        found.add(_key(Occurrence(word, x, y, (dx, dy))))
+    return found
+
+
+class TestSolver(unittest.TestCase):
+    def testAllDirections(self) -> None:
+        rows = [["#"]*9 for i in range(9)]
+        for dx, dy in DIRECTIONS:
+            for i, letter in enumerate("CAT"):
+                rows[4 + i*dy][4 + i*dx] = letter
+
+        found = set(Solver(["cat"]).solve(rows))
+        self.assertEqual(found, {Occurrence("cat", 4, 4, i) for i in DIRECTIONS})
+
+    def testOverlapping(self) -> None:
+        found = set(Solver(["ana", "nan", "banana"]).solve(_grid(["BANANA"])))
+        self.assertEqual(found, {
+            Occurrence("banana", 0, 0, (1, 0)),
+            Occurrence("ana", 1, 0, (1, 0)),
+            Occurrence("ana", 3, 0, (1, 0)),
+            Occurrence("nan", 2, 0, (1, 0))
+        })
+
+    def testMatchesBruteForce(self) -> None:
+        rng = random.Random(1)
+        for i in range(50):
+            width = rng.randint(1, 8)
+            height = rng.randint(1, 8)
+            grid = [[rng.choice("ABC") for x in range(width)] for y in range(height)]
+            words = ["".join(rng.choice("abc") for j in range(rng.randint(1, 4))) for k in range(4)]
+            found = [_key(i) for i in Solver(words).solve(grid)]
+            self.assertEqual(len(found), len(set(found)))
+            self.assertEqual(set(found), _bruteForce(grid, set(words)))
+
+
+if __name__ == "__main__":
+    unittest.main()
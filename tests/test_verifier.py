@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import itertools
+import random
+import unittest
+
+from wordsearch.Game import Board, Solver
+from wordsearch.Game.Solver import Occurrence, gridRows
+from wordsearch.Game.Verifier import Verifier
+
+DIRECTIONS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+
+# Few letters so filler often spells copies of placed words
+WORDS = ["".join(i) for i in itertools.product("abcd", repeat=4)]
+
+
+def _key(occurrence: Occurrence) -> tuple:
+    # Palindromes may be reported in either direction
+    word, x, y, (dx, dy) = occurrence
+    return (word, frozenset(((x, y), (x + (len(word)-1)*dx, y + (len(word)-1)*dy))))
+
+
+def _copies(rows: list[str], word: str) -> int:
+    """Number of distinct sets of cells spelling word"""
+
+    height = len(rows)
+    width = len(rows[0])
+    found = set()
+    for y in range(height):
+        for x in range(width):
+            for dx, dy in DIRECTIONS:
+                cells = [(x + i*dx, y + i*dy) for i in range(len(word))]
+                if not all(0 <= i < width and 0 <= j < height for i, j in cells):
+                    continue
+                if "".join(rows[j][i] for i, j in cells) == word.upper():
+                    found.add(frozenset(cells))
+    return len(found)
+
+
+class TestVerifier(unittest.TestCase):
+    def testMatchesSolver(self) -> None:
+        rng = random.Random(2)
+        for i in range(50):
+            width = rng.randint(1, 8)
+            height = rng.randint(1, 8)
+            grid = [[rng.choice("ABC") for x in range(width)] for y in range(height)]
+            words = ["".join(rng.choice("abc") for j in range(rng.randint(1, 4))) for k in range(4)]
+            found = Verifier(words).occurrences(grid)
+            self.assertEqual(len(found), len(set(map(_key, found))))
+            self.assertEqual(set(map(_key, found)), set(map(_key, Solver(words).solve(grid))))
+
+
+class TestUnique(unittest.TestCase):
+    def testOneCopy(self) -> None:
+        repaired = 0
+        for seed in range(10):
+            board = Board()
+            board.generate(10, 10, WORDS, 6, seed=seed, unique=True)
+            repaired += board.repair_rounds
+            rows = gridRows(board.board)
+            for word in board.word_list:
+                self.assertEqual(_copies(rows, word.word), 1, f"{word.word} with seed {seed}")
+        # Otherwise nothing was tested
+        self.assertGreater(repaired, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
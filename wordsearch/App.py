@@ -33,12 +33,16 @@ class App:
         """
 
         self._root.bind("<<Quit>>", self._quit)
+        self._root.protocol("WM_DELETE_WINDOW", self._quit)
 
     def _quit(self, *args) -> None:
         """
         _quit Destroy all windows and quit the application
+
+        Progress is saved before the windows are destroyed.
         """
 
+        self._ui.close()
         self._root.destroy()
 
     def run(self) -> None:
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import queue
+import threading
+import time
+from tkinter import Misc
+from typing import Any
+
+import wordsearch.Game
+from wordsearch.constants import AUTOSAVE_INTERVAL, AUTOSAVE_POLL
+from wordsearch.Game.Board import BOARD
+from wordsearch.Game.SaveJob import SaveJob
+
+SAVED = "<<Saved>>"
+"""Event generated when a save finishes"""
+
+SAVE_FAILED = "<<SaveFailed>>"
+"""Event generated when a save fails. The error is in Autosave.error"""
+
+
+class Autosave:
+    def __init__(self, widget: Misc, game: wordsearch.Game.Board) -> None:
+        """
+        __init__ Create instance of Autosave
+
+        Autosave saves the game from a worker thread so the main loop
+        never waits for the disk. A snapshot is taken on the main loop
+        and written by the worker. Boards that have been saved or loaded
+        are saved at most once every AUTOSAVE_INTERVAL and changes made
+        while a save is being written are saved together afterwards.
+
+        :param widget: Any widget, used to schedule saves and generate
+            events
+        :type widget: tkinter.Misc
+        :param game: Instance of game to save
+        :type game: wordsearch.Game.Board
+        """
+
+        self._widget = widget
+        self._game = game
+        self._jobs: queue.Queue[SaveJob|None] = queue.Queue()
+        self._results: queue.Queue[tuple[SaveJob, Exception|None]] = queue.Queue()
+        self._dirty = False
+        self._busy = False
+        self._requested: str|None = None
+        self._timer: str|None = None
+        self._last = 0.0
+        self.error: Exception|None = None
+
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        self._game.listen(self._onChange)
+
+    def _run(self) -> None:
+        """
+        _run Write jobs until told to stop
+
+        Runs in the worker thread.
+        """
+
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                job.write()
+            except Exception as e:
+                self._results.put((job, e))
+            else:
+                self._results.put((job, None))
+
+    def _onChange(self, change: str, items: list[Any]) -> None:
+        """
+        _onChange Schedule a save when the game changes
+
+        :param change: What changed
+        :type change: str
+        :param items: Items that changed
+        :type items: list[Any]
+        """
+
+        # A new board has nothing to save until it is saved by the user.
+        # A save requested for the old board can no longer be made.
+        if change == BOARD:
+            self._dirty = False
+            self._requested = None
+            self._cancel()
+            return
+        self._dirty = True
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """
+        _schedule Save once AUTOSAVE_INTERVAL has passed since the last
+        save
+        """
+
+        if self._timer is not None or self._busy:
+            return
+        elapsed = int((time.monotonic() - self._last)*1000)
+        self._timer = self._widget.after(max(0, AUTOSAVE_INTERVAL - elapsed), self._autosave)
+
+    def _cancel(self) -> None:
+        """
+        _cancel Cancel a scheduled save
+        """
+
+        if self._timer is not None:
+            self._widget.after_cancel(self._timer)
+            self._timer = None
+
+    def _autosave(self) -> None:
+        """
+        _autosave Save the game to the file it was loaded from or last
+        saved to
+        """
+
+        self._timer = None
+        if self._dirty and not self._busy and self._game.path != "":
+            self._submit(self._game.path)
+
+    def saveNow(self, path: str) -> None:
+        """
+        saveNow Save the game as soon as possible
+
+        If a save is being written, this save is started once it
+        finishes, unless a new board is generated or loaded first.
+        SAVED or SAVE_FAILED is generated when done.
+
+        :param path: Path to save to
+        :type path: str
+        """
+
+        self._cancel()
+        if self._busy:
+            self._requested = path
+        else:
+            self._submit(path)
+
+    def _submit(self, path: str) -> None:
+        """
+        _submit Take a snapshot and pass it to the worker
+
+        :param path: Path to save to
+        :type path: str
+        """
+
+        self._dirty = False
+        self._busy = True
+        self._last = time.monotonic()
+        self._jobs.put(self._game.prepareSave(path))
+        self._widget.after(AUTOSAVE_POLL, self._poll)
+
+    def _poll(self) -> None:
+        """
+        _poll Check if the worker has finished
+        """
+
+        try:
+            job, error = self._results.get_nowait()
+        except queue.Empty:
+            self._widget.after(AUTOSAVE_POLL, self._poll)
+            return
+
+        self._busy = False
+        saved = self._game.finishSave(job, error)
+        if job.stale and self._requested is None and job.path == self._game.path:
+            # The file was changed by something else so is rewritten.
+            # Not if the board has moved to another file since, as the
+            # file now belongs to a different board.
+            self._submit(self._game.path)
+            return
+
+        if error is not None:
+            # Saved again on the next change rather than retried now
+            self.error = error
+            self._dirty = True
+            self._widget.event_generate(SAVE_FAILED)
+        elif saved:
+            self._widget.event_generate(SAVED)
+
+        if self._requested is not None:
+            path = self._requested
+            self._requested = None
+            self._submit(path)
+        elif self._dirty and error is None:
+            self._schedule()
+
+    def close(self) -> None:
+        """
+        close Finish any save and stop the worker
+
+        Blocks until everything is on disk so should only be called on
+        quit.
+
+        :raises OSError: Failed to save progress made since the last
+            save
+        """
+
+        self._cancel()
+        self._jobs.put(None)
+        self._thread.join()
+        while not self._results.empty():
+            if not self._game.finishSave(*self._results.get_nowait()):
+                self._dirty = True
+
+        path = self._requested or self._game.path
+        if path != "" and (self._dirty or self._requested is not None):
+            self._game.save(path)
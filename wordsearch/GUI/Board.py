@@ -6,11 +6,13 @@ from tkinter import ttk
 from tkinter import messagebox
 
 from wordsearch.GUI.Grid import Grid
+from wordsearch.GUI.Scheduler import Scheduler
+from wordsearch.Game.Board import WORDS
 from wordsearch.Settings import Settings
 import wordsearch.Game
 
 class Board:
-    def __init__(self, parent: ttk.Frame, settings: Settings, board: wordsearch.Game.Board) -> None:
+    def __init__(self, parent: ttk.Frame, settings: Settings, board: wordsearch.Game.Board, scheduler: Scheduler) -> None:
         """
         __init__ Create the board
 
@@ -22,21 +24,33 @@ class Board:
         :type settings: wordsearch.Settings.Settings
         :param board: Board class
         :type board: wordsearch.Game.Board
+        :param scheduler: Scheduler passing on changes to the board
+        :type scheduler: wordsearch.GUI.Scheduler.Scheduler
         """
 
         self._settings = settings
         self._board = board
+        self._scheduler = scheduler
 
         self._frame = ttk.Frame(parent)
         self._frame.grid(column=1, row=0, sticky=(N, W, S, E))
         self._frame.columnconfigure(0, weight=1)
+        self._frame.columnconfigure(1, weight=0)
         self._frame.rowconfigure(0, weight=1)
         self._frame.rowconfigure(1, weight=0)
+        self._frame.rowconfigure(2, weight=0)
 
-        self._canvas = Grid(self._frame, self._settings, self._board, background="white")
-        self._canvas.grid(column=0, row=0, padx=5, pady=5, sticky=(N, W, S, E))
+        self._canvas = Grid(self._frame, self._settings, self._board, self._scheduler, background="white")
+        self._canvas.grid(column=0, row=0, padx=(5, 0), pady=(5, 0), sticky=(N, W, S, E))
 
-        ttk.Button(self._frame, text="Clear Selection", command=self._clear).grid(column=0, row=1, sticky=(E, W))
+        # Boards larger than the window scroll
+        xscroll = ttk.Scrollbar(self._frame, orient=HORIZONTAL, command=self._canvas.xview)
+        xscroll.grid(column=0, row=1, padx=(5, 0), sticky=(E, W))
+        yscroll = ttk.Scrollbar(self._frame, orient=VERTICAL, command=self._canvas.yview)
+        yscroll.grid(column=1, row=0, pady=(5, 0), sticky=(N, S))
+        self._canvas.configure(xscrollcommand=xscroll.set, yscrollcommand=yscroll.set)
+
+        ttk.Button(self._frame, text="Clear Selection", command=self._clear).grid(column=0, row=2, columnspan=2, sticky=(E, W))
 
         self._registerEvents()
 
@@ -45,20 +59,7 @@ class Board:
         _registerEvents Register event handlers
         """
 
-        self._frame.bind_all("<<LOADED_GAMEBOARD>>", self._drawBoard, add='+')
-        self._frame.bind_all("<<FOUND_WORD>>", self._checkWin, add="+")
-
-    def _drawBoard(self, event: Event) -> None:
-        """
-        _drawBoard Draw the board
-
-        Draws board on canvas
-
-        :param event: Event
-        :type event: tkinter.Event
-        """
-
-        self._canvas.draw()
+        self._scheduler.register(WORDS, self._checkWin)
 
     def _clear(self) -> None:
         """
@@ -68,22 +69,18 @@ class Board:
         string.
         """
 
-        for i in self._board.board:
-            for j in i:
-                j.deselect()
-
+        self._board.clearSelection()
         self._canvas.clear()
-        self._canvas.draw()
 
-    def _checkWin(self, event: Event) -> None:
+    def _checkWin(self, changes: list[int]) -> None:
         """
         _checkWin Check if player has won
 
         Checks if the player has won. If so, show a message box with
         congratulations.
 
-        :param event: Unused tkinter event
-        :type event: tkinter.Event
+        :param changes: Unused indices of newly found words
+        :type changes: list[int]
         """
         
         if self._board.checkWin():
@@ -6,11 +6,12 @@ from tkinter import *
 from tkinter import messagebox, ttk
 from tkinter.filedialog import askopenfilename
 
-from wordsearch.constants import HOME
-from wordsearch.Game import Board
+from wordsearch.constants import COMPACT_THRESHOLD, HOME
+from wordsearch.Game import Board, Dictionary
 from wordsearch.Game.Errors import (OutOfWordsError, PuzzleSizeError,
                                     RetriesExceededError)
 from wordsearch.Settings import Settings
+from wordsearch.utils import loadFile
 
 
 class ControlSideBar:
@@ -36,7 +37,10 @@ class ControlSideBar:
         self._width = IntVar(value=5)
         self._height = IntVar(value=5)
         self._words = IntVar(value=5)
+        self._overlap = BooleanVar(value=False)
         self._word_list = StringVar()
+        self._dictionary: Dictionary|None = None
+        self._dictionary_key: tuple[str, int, int]|None = None
 
         # Interface settings
         self._interface_address = StringVar(
@@ -134,19 +138,21 @@ class ControlSideBar:
         self._puzzle_settings.columnconfigure(1, weight=1)
         
         ttk.Label(self._puzzle_settings, text="Width").grid(column=0, row=0, sticky=(W))
-        ttk.Spinbox(self._puzzle_settings, textvariable=self._width, from_=5, to=20).grid(column=1, row=0, padx=5, pady=5, sticky=(E))
+        ttk.Spinbox(self._puzzle_settings, textvariable=self._width, from_=5, to=1000).grid(column=1, row=0, padx=5, pady=5, sticky=(E))
 
         ttk.Label(self._puzzle_settings, text="Height").grid(column=0, row=1, sticky=(W))
-        ttk.Spinbox(self._puzzle_settings, textvariable=self._height, from_=5, to=20).grid(column=1, row=1, padx=5, pady=5, sticky=(E))
+        ttk.Spinbox(self._puzzle_settings, textvariable=self._height, from_=5, to=1000).grid(column=1, row=1, padx=5, pady=5, sticky=(E))
 
         ttk.Label(self._puzzle_settings, text="Number of Words").grid(column=0, row=2, sticky=(W))
-        ttk.Spinbox(self._puzzle_settings, textvariable=self._words, from_=1, to=100).grid(column=1, row=2, padx=5, pady=5, sticky=(E))
+        ttk.Spinbox(self._puzzle_settings, textvariable=self._words, from_=1, to=10000).grid(column=1, row=2, padx=5, pady=5, sticky=(E))
 
         ttk.Label(self._puzzle_settings, text="Word List").grid(column=0, row=3, sticky=(W))
         ttk.Entry(self._puzzle_settings, textvariable=self._word_list).grid(column=0, row=4, padx=5, pady=5, sticky=(E,W))
         ttk.Button(self._puzzle_settings, text="Select", command=self._selectWordList).grid(column=1, row=4, sticky=(E, W))
 
-        ttk.Button(self._puzzle_settings, text="Generate", command=self._generate).grid(column=0, row=5, columnspan=2, sticky=(E, W))
+        ttk.Checkbutton(self._puzzle_settings, text="Allow overlapping words", variable=self._overlap).grid(column=0, row=5, columnspan=2, padx=5, pady=5, sticky=(W))
+
+        ttk.Button(self._puzzle_settings, text="Generate", command=self._generate).grid(column=0, row=6, columnspan=2, sticky=(E, W))
 
         # Seperator for some visual aid
         # ttk.Separator(self._frame, orient=HORIZONTAL).grid(column=1, row=1, columnspan=2, sticky=(E, W))
@@ -228,17 +234,35 @@ class ControlSideBar:
         Validates game settings before generating the game board.
         """
 
-        word_list = self._loadWords(self._word_list.get())
-        if word_list == []:
-            # An error occured
+        # Dictionary is not modified by generation so only reload it if
+        # the file has changed
+        path = self._word_list.get()
+        try:
+            stat = os.stat(path)
+            key = (path, stat.st_size, stat.st_mtime_ns)
+            if self._dictionary is None or self._dictionary_key != key:
+                self._dictionary = loadFile(path)
+                self._dictionary_key = key
+        except FileNotFoundError:
+            messagebox.showerror(title="File not found", message="Word list file not found")
+            return
+        except OSError:
+            messagebox.showerror(title="Failed to load word list", message="Word list could not be read")
+            return
+        if len(self._dictionary) == 0:
+            messagebox.showerror(title="Failed to load word list", message="Word list contains no words")
             return
 
+        width = self._width.get()
+        height = self._height.get()
         try:
             self._game.generate(
-                self._width.get(),
-                self._height.get(),
-                word_list,
-                self._words.get()
+                width,
+                height,
+                self._dictionary,
+                self._words.get(),
+                self._overlap.get(),
+                compact=width*height > COMPACT_THRESHOLD
             )
         except PuzzleSizeError:
             messagebox.showerror(
@@ -255,8 +279,6 @@ class ControlSideBar:
                 title="Failed to generate puzzle",
                 message="Failed to place words"
             )
-        else:
-            self._frame.event_generate("<<LOADED_GAMEBOARD>>")
 
     @staticmethod
     def _selectFile(path: str) -> str:
@@ -282,34 +304,3 @@ class ControlSideBar:
         )
 
         return filename
-
-    @staticmethod
-    def _loadWords(path: str) -> list[str]:
-        """
-        _loadWords Load the word list
-
-        Loads the word list from file, splitting by new lines and only
-        reading non blank lines. Also strips all white space
-
-        :param path: Path to dict file
-        :type path: str
-        :return: Word list
-        :rtype: list[str]
-        """
-
-        words: list[str] = []
-        try:
-            f = open(path, "r")
-        except FileNotFoundError:
-            messagebox.showerror(title="File not found", message="Word list file not found")
-            return []
-        else:
-            with f:
-                for line in f:
-                    line = line.replace(" ", "")
-                    line = line.replace("\n", "")
-                    line = line.replace("\r", "")
-                    if line != "":
-                        words.append(line)
-
-        return words
@@ -3,8 +3,14 @@
 
 from tkinter import *
 from tkinter import ttk
+from tkinter import font
 
+from wordsearch.constants import MAX_ZOOM, MIN_CELL_SIZE, VIEW_MARGIN
 from wordsearch.Settings import Settings
+from wordsearch.GUI.Scheduler import Scheduler
+from wordsearch.Game.Board import BOARD, CELLS
+from wordsearch.Game.Trie import ROOT
+from wordsearch.Game.Char import Char
 import wordsearch.Game
 
 
@@ -14,12 +20,15 @@ class Grid(Canvas):
         parent,
         settings: Settings,
         board: wordsearch.Game.Board,
+        scheduler: Scheduler,
         **kwargs
     ) -> None:
         """
         __init__ Create instance of Grid
 
         Grid represents the canvas on which to draw the game board.
+        Only the cells in view are drawn, so boards larger than the
+        window can be scrolled and zoomed.
 
         :param parent: Parent widget
         :type parent: any
@@ -27,6 +36,8 @@ class Grid(Canvas):
         :type settings: wordsearch.Settings.Settings
         :param board: Current game board
         :type board: wordsearch.Game.Board
+        :param scheduler: Scheduler passing on changes to the board
+        :type scheduler: wordsearch.GUI.Scheduler.Scheduler
         """ 
         super().__init__(parent, **kwargs)
 
@@ -35,49 +46,208 @@ class Grid(Canvas):
         self._width = self.winfo_width()
         self._height = self.winfo_height()
         self._selected_text = ""
+        self._nodes = [ROOT]
+        # Canvas item ids of the rectangle and text of each drawn cell
+        self._items: dict[tuple[int, int], tuple[int, int]] = {}
+        # Hidden items left by cells that scrolled out of view
+        self._free: list[tuple[int, int]] = []
+        # Columns and rows drawn as (left, top, right, bottom), with
+        # right and bottom exclusive
+        self._visible = (0, 0, 0, 0)
+        # Position of the top left corner and side length of the cells
+        # the items were drawn with
+        self._origin = (0, 0)
+        self._side = 0
+        self._zoom = 1.0
+        self._fonts: dict[int, font.Font] = {}
+        self._pending_resize: str|None = None
+        self._pending_view: str|None = None
+
+        scheduler.register(BOARD, self._onBoard)
+        scheduler.register(CELLS, self.paint)
 
         self.bind("<Configure>", self._resize)
         self.bind("<Button-1>", self._onMouseClick)
+        self.bind("<Button-3>", self._onUndo)
+        # Windows and macOS send MouseWheel, X11 sends buttons 4 and 5
+        self.bind("<MouseWheel>", self._onScroll)
+        self.bind("<Button-4>", self._onScroll)
+        self.bind("<Button-5>", self._onScroll)
 
     def draw(self) -> None:
         """
         draw Draw the board to the screen
 
-        Draws and scales the current game board onto the canvas
+        Lays out the current game board on the canvas, scaled to fit if
+        possible, and draws the cells in view
         """
 
         # Clear the canvas
         self.delete("all")
+        self._items = {}
+        self._free = []
+        self._visible = (0, 0, 0, 0)
+        self._zoom = 1.0
 
-        width = self.winfo_width()
-        height = self.winfo_height()
+        self._width = self.winfo_width()
+        self._height = self.winfo_height()
+        side_length, org_x, org_y = self._layout()
+        self._origin = (org_x, org_y)
+        self._side = side_length
+        self._setScrollRegion()
+        super().xview_moveto(0)
+        super().yview_moveto(0)
 
-        bwidth = self._board.width
-        bheight = self._board.height
+        self._updateView()
+
+    def _layout(self) -> tuple[int, int, int]:
+        """
+        _layout Size and position of the grid on the canvas
+
+        :return: Side length of a cell and the x and y coordinates of
+            the top left corner of the grid
+        :rtype: tuple[int, int, int]
+        """
 
         # 10px padding on all sides of grid
-        width -= 20
-        height -= 20
+        width = self._width - 20
+        height = self._height - 20
+
+        bwidth = self._board.width
+        bheight = self._board.height
 
-        # Get smallest scale factor
+        # Get smallest scale factor. Cells stop shrinking at a readable
+        # size and the board scrolls instead
         side_length = min(width // bwidth, height // bheight)
-        # Center grid
-        org_x = ((width - (side_length*bwidth)) // 2) + 10
-        y = ((height - (side_length*bheight)) // 2) + 10
-
-        for i in range(len(self._board.board)):
-            x = org_x
-            for j in range(len(self._board.board[i])):
-                if self._board.board[i][j].found:
-                    self._drawSquare(self._board.board[i][j], x, y, side_length, "light green", f"{j},{i}")
-                elif self._board.board[i][j].selected:
-                    self._drawSquare(self._board.board[i][j], x, y, side_length, "yellow", f"{j},{i}")
-                else:
-                    self._drawSquare(self._board.board[i][j], x, y, side_length, "white", f"{j},{i}")    
-                x += side_length
-            y += side_length
-
-    def _drawSquare(self, letter: str, x: int, y: int, length: int, fill: str, index: str) -> None:
+        side_length = int(max(MIN_CELL_SIZE, side_length) * self._zoom)
+        # Center grid if it fits
+        org_x = max(0, (width - (side_length*bwidth)) // 2) + 10
+        org_y = max(0, (height - (side_length*bheight)) // 2) + 10
+        return (side_length, org_x, org_y)
+
+    def _setScrollRegion(self) -> None:
+        """
+        _setScrollRegion Make the whole grid reachable by scrolling
+        """
+
+        width = max(self._width, self._side*self._board.width + 20)
+        height = max(self._height, self._side*self._board.height + 20)
+        self.configure(scrollregion=(0, 0, width, height))
+
+    def _scheduleView(self) -> None:
+        """
+        _scheduleView Update the drawn cells once pending events are
+        handled
+        """
+
+        if self._pending_view is None:
+            self._pending_view = self.after_idle(self._updateView)
+
+    def _updateView(self) -> None:
+        """
+        _updateView Draw the cells in view
+
+        Cells that have left the view are hidden and their items reused
+        for cells that have come into view, so the number of items
+        depends on the size of the window rather than the board.
+        """
+
+        self._pending_view = None
+        if self._side <= 0 or len(self._board.board) == 0:
+            return
+
+        side_length = self._side
+        org_x, org_y = self._origin
+        left = self.canvasx(0) - org_x
+        top = self.canvasy(0) - org_y
+        x0 = max(0, int(left // side_length) - VIEW_MARGIN)
+        y0 = max(0, int(top // side_length) - VIEW_MARGIN)
+        x1 = min(self._board.width, int((left + self._width) // side_length) + 1 + VIEW_MARGIN)
+        y1 = min(self._board.height, int((top + self._height) // side_length) + 1 + VIEW_MARGIN)
+        if (x0, y0, x1, y1) == self._visible:
+            return
+
+        for cell in [i for i in self._items if not (x0 <= i[0] < x1 and y0 <= i[1] < y1)]:
+            items = self._items.pop(cell)
+            self.itemconfigure(items[0], state="hidden")
+            self.itemconfigure(items[1], state="hidden")
+            self._free.append(items)
+
+        letter_font = self._font(side_length)
+        for row in range(y0, y1):
+            line = self._board.board[row]
+            y = org_y + row*side_length
+            for col in range(x0, x1):
+                if (col, row) in self._items:
+                    continue
+                char = line[col]
+                x = org_x + col*side_length
+                if not self._free:
+                    self._items[(col, row)] = self._drawSquare(char, x, y, side_length, self._colour(char))
+                    continue
+                rect, text = self._free.pop()
+                self.coords(rect, x, y, x+side_length, y+side_length)
+                self.itemconfigure(rect, fill=self._colour(char), state="normal")
+                self.coords(text, x + (side_length//2), y + (side_length//2))
+                self.itemconfigure(text, text=char.upper(), font=letter_font, state="normal")
+                self._items[(col, row)] = (rect, text)
+
+        self._visible = (x0, y0, x1, y1)
+
+    def _font(self, side_length: int) -> font.Font:
+        """
+        _font Font for letters in cells of the given size
+
+        Fonts are cached so resizing back and forth reuses them.
+
+        :param side_length: Side length of a cell in pixels
+        :type side_length: int
+        :return: Font
+        :rtype: tkinter.font.Font
+        """
+
+        letter_font = self._fonts.get(side_length)
+        if letter_font is None:
+            # Negative sizes are in pixels rather than points
+            letter_font = font.Font(self, family="TkDefaultFont", size=-max(1, side_length // 2))
+            self._fonts[side_length] = letter_font
+        return letter_font
+
+    def paint(self, cells: list[tuple[int, int]]) -> None:
+        """
+        paint Update the colour of individual cells
+
+        Only the given cells are touched so the cost does not depend on
+        the size of the board. Cells out of view are coloured when they
+        are next drawn.
+
+        :param cells: Coordinates of cells that have changed
+        :type cells: list[tuple[int, int]]
+        """
+
+        for x, y in cells:
+            items = self._items.get((x, y))
+            if items is not None:
+                self.itemconfigure(items[0], fill=self._colour(self._board.board[y][x]))
+
+    @staticmethod
+    def _colour(char: Char) -> str:
+        """
+        _colour Fill colour of a character
+
+        :param char: Character to colour
+        :type char: wordsearch.Game.Char.Char
+        :return: Colour of the square
+        :rtype: str
+        """
+
+        if char.found:
+            return "light green"
+        elif char.selected:
+            return "yellow"
+        return "white"
+
+    def _drawSquare(self, letter: str, x: int, y: int, length: int, fill: str) -> tuple[int, int]:
         """
         _drawSquare Draw individual grid square
 
@@ -93,18 +263,105 @@ class Grid(Canvas):
         :type length: int
         :param fill: Colour to fill rectangle with
         :type fill: str
-        :param index: Index of char in board
-        :type index: str
+        :return: Ids of the rectangle and text items
+        :rtype: tuple[int, int]
         """
 
-        self.create_rectangle(x, y, x+length, y+length, outline="black", fill=fill, tags=index)
-        self.create_text(x + (length//2), y + (length//2), text=letter.upper(), tags=index)
+        rect = self.create_rectangle(x, y, x+length, y+length, outline="black", fill=fill)
+        text = self.create_text(x + (length//2), y + (length//2), text=letter.upper(), font=self._font(length), tags="letter")
+        return (rect, text)
+
+    def xview(self, *args) -> tuple[float, float]|None:
+        """
+        xview Query or change the horizontal view
+
+        Used by the horizontal scrollbar. Cells that come into view are
+        drawn once the scrollbar events are handled.
+        """
+
+        result = super().xview(*args)
+        if args:
+            self._scheduleView()
+        return result
+
+    def yview(self, *args) -> tuple[float, float]|None:
+        """
+        yview Query or change the vertical view
+
+        Used by the vertical scrollbar. Cells that come into view are
+        drawn once the scrollbar events are handled.
+        """
+
+        result = super().yview(*args)
+        if args:
+            self._scheduleView()
+        return result
+
+    def _onScroll(self, event: Event) -> None:
+        """
+        _onScroll Callback for mouse wheel events
+
+        Scrolls vertically, or horizontally while shift is held. Zooms
+        around the pointer while control is held.
+
+        :param event: Tkinter event
+        :type event: tkinter.Event
+        """
+
+        if event.num == 4 or event.delta > 0:
+            step = -1
+        else:
+            step = 1
+
+        if event.state & 0x4:
+            self.zoom(1.25 if step < 0 else 0.8, event.x, event.y)
+        elif event.state & 0x1:
+            self.xview_scroll(step, "units")
+            self._scheduleView()
+        else:
+            self.yview_scroll(step, "units")
+            self._scheduleView()
+
+    def zoom(self, factor: float, x: int = 0, y: int = 0) -> None:
+        """
+        zoom Zoom the board
+
+        The zoom is limited to between fitting the window and MAX_ZOOM
+        times that size.
+
+        :param factor: Amount to multiply the current zoom by
+        :type factor: float
+        :param x: X coordinate in the window to zoom around, defaults
+            to 0
+        :type x: int, optional
+        :param y: Y coordinate in the window to zoom around, defaults
+            to 0
+        :type y: int, optional
+        """
+
+        zoom = min(MAX_ZOOM, max(1.0, self._zoom * factor))
+        if zoom == self._zoom or self._side <= 0:
+            return
+
+        # Position on the board under the pointer, in cells
+        col = (self.canvasx(x) - self._origin[0]) / self._side
+        row = (self.canvasy(y) - self._origin[1]) / self._side
+        self._zoom = zoom
+        self._rescale()
+
+        # Keep the same position under the pointer
+        width = max(self._width, self._side*self._board.width + 20)
+        height = max(self._height, self._side*self._board.height + 20)
+        super().xview_moveto((self._origin[0] + col*self._side - x) / width)
+        super().yview_moveto((self._origin[1] + row*self._side - y) / height)
 
     def _resize(self, event: Event) -> None:
         """
         _resize Callback for resize event
 
-        Check if we have actually resized before handling event
+        Check if we have actually resized before handling event. A
+        window being dragged sends a stream of events so the grid is
+        only rescaled once they have all been handled.
 
         :param event: Tkinter event
         :type event: tkinter.Event
@@ -113,8 +370,58 @@ class Grid(Canvas):
         changed = self._width != event.width or self._height != event.height
         if not changed:
             return
-        
-        self.draw()
+
+        self._width = event.width
+        self._height = event.height
+        if self._pending_resize is None:
+            self._pending_resize = self.after_idle(self._rescale)
+
+    def _rescale(self) -> None:
+        """
+        _rescale Fit the existing grid to the canvas
+
+        Moves and scales the items already on the canvas rather than
+        creating them again.
+        """
+
+        self._pending_resize = None
+        side_length, org_x, org_y = self._layout()
+        if self._side <= 0:
+            self.draw()
+            return
+
+        if side_length != self._side or (org_x, org_y) != self._origin:
+            old_x, old_y = self._origin
+            factor = side_length / self._side
+            self.scale("all", old_x, old_y, factor, factor)
+            self.move("all", org_x - old_x, org_y - old_y)
+            self.itemconfigure("letter", font=self._font(side_length))
+            self._origin = (org_x, org_y)
+            self._side = side_length
+
+        self._setScrollRegion()
+        self._scheduleView()
+
+    def cellAt(self, x: float, y: float) -> tuple[int, int]|None:
+        """
+        cellAt Find the cell under a point on the canvas
+
+        :param x: X coordinate on the canvas
+        :type x: float
+        :param y: Y coordinate on the canvas
+        :type y: float
+        :return: Column and row of the cell or None if the point is not
+            on the grid
+        :rtype: tuple[int, int]|None
+        """
+
+        if self._side <= 0 or len(self._board.board) == 0:
+            return None
+        col = int((x - self._origin[0]) // self._side)
+        row = int((y - self._origin[1]) // self._side)
+        if 0 <= col < self._board.width and 0 <= row < self._board.height:
+            return (col, row)
+        return None
 
     def _onMouseClick(self, event: Event) -> None:
         """
@@ -126,17 +433,11 @@ class Grid(Canvas):
         :type event: tkinter.Event
         """
 
-        target = self.find_closest(event.x, event.y)
-
-        if target == ():
-            # User didn't click on anything
+        cell = self.cellAt(self.canvasx(event.x), self.canvasy(event.y))
+        if cell is None:
+            # User didn't click on the grid
             return
-        else: 
-            id = target[0]
-
-        x_str, y_str = self.gettags(id)[0].split(",")
-        x = int(x_str)
-        y = int(y_str)
+        x, y = cell
 
         if len(self._selected_text) != 0:
             border_present = False
@@ -170,26 +471,69 @@ class Grid(Canvas):
             if not border_present:
                 return
 
-        self._board.board[y][x].select()
+        # Walk one letter down the word trie rather than comparing the
+        # selection against every word
+        node = self._board.trie.child(self._nodes[-1], str(self._board.board[y][x]))
+        if node is None:
+            # No word starts with the selection so it can't be extended
+            self._deselect()
+            return
+
+        self._board.select(x, y)
         self._selected_text += self._board.board[y][x]
+        self._nodes.append(node)
 
         # Check if user found a word
-        found = False
-        for i in self._board.word_list:
-            if self._selected_text == i.word:
-                i.found = True
-                found = True
-                self.clear()
-                for i in self._board.board:
-                    for j in i:
-                        if j.selected:
-                            j.found = True
-                
-        self.draw()
+        words = self._board.trie.values(node)
+        for i in words:
+            self._board.markFound(i)
+        if len(words) != 0:
+            self.clear()
+            self._board.confirmSelection()
+
+    def _onUndo(self, event: Event) -> None:
+        """
+        _onUndo Callback for right mouse button event
+
+        Removes the last selected character from the selection
 
-        # Must emit event after draw
-        if found:
-            self.event_generate("<<FOUND_WORD>>")
+        :param event: Tkinter event
+        :type event: tkinter.Event
+        """
+
+        if self._board.undoSelect() is None:
+            return
+        self._selected_text = self._selected_text[:-1]
+        self._nodes.pop()
+
+    def _deselect(self) -> None:
+        """
+        _deselect Deselect all characters and reset the selection
+        """
+
+        self.clear()
+        self._board.clearSelection()
+
+    def _onBoard(self, changes: list) -> None:
+        """
+        _onBoard Handler for a new board
+
+        Carries on from any selection the board was loaded with.
+
+        :param changes: Unused
+        :type changes: list
+        """
+
+        self.clear()
+        for x, y in self._board.selection:
+            node = self._board.trie.child(self._nodes[-1], str(self._board.board[y][x]))
+            if node is None:
+                # Selection no longer leads to a word
+                self._deselect()
+                break
+            self._selected_text += self._board.board[y][x]
+            self._nodes.append(node)
+        self.draw()
 
     def clear(self) -> None:
         """
@@ -197,4 +541,5 @@ class Grid(Canvas):
         """
         
         self._selected_text = ""
+        self._nodes = [ROOT]
     
\ No newline at end of file
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import time
+from tkinter import Misc
+from typing import Any, Callable
+
+from wordsearch.Game.Board import BOARD, CELLS, WORDS
+
+FLAGS = (BOARD, CELLS, WORDS)
+"""Changes in the order their handlers are run"""
+
+
+class Scheduler:
+    def __init__(self, widget: Misc) -> None:
+        """
+        __init__ Create instance of Scheduler
+
+        Scheduler collects changes to the game board and passes them to
+        the views once per idle tick. However many changes are made
+        while handling an event, each view only updates once.
+
+        :param widget: Any widget, used to schedule flushes
+        :type widget: tkinter.Misc
+        """
+
+        self._widget = widget
+        self._handlers: dict[str, list[Callable[[list[Any]], None]]] = {i: [] for i in FLAGS}
+        self._dirty: dict[str, list[Any]] = {}
+        self._pending: str|None = None
+
+        self._frames = 0
+        self._flush_time = 0.0
+        self._last_flush = 0.0
+        self._max_flush = 0.0
+
+    def register(self, flag: str, handler: Callable[[list[Any]], None]) -> None:
+        """
+        register Call a handler when a change is flushed
+
+        :param flag: Change to handle. One of BOARD, CELLS or WORDS
+        :type flag: str
+        :param handler: Function called with everything that changed
+            since the last flush
+        :type handler: Callable[[list[Any]], None]
+        """
+
+        self._handlers[flag].append(handler)
+
+    def mark(self, flag: str, changes: list[Any]) -> None:
+        """
+        mark Record a change
+
+        :param flag: What changed. One of BOARD, CELLS or WORDS
+        :type flag: str
+        :param changes: Items that changed
+        :type changes: list[Any]
+        """
+
+        self._dirty.setdefault(flag, []).extend(changes)
+        if self._pending is None:
+            self._pending = self._widget.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """
+        flush Pass the recorded changes to the views
+        """
+
+        self._pending = None
+        if not self._dirty:
+            return
+
+        start = time.perf_counter()
+        dirty = self._dirty
+        self._dirty = {}
+        # A new board is redrawn in full so other changes are covered
+        if BOARD in dirty:
+            dirty = {BOARD: dirty[BOARD]}
+        for flag in FLAGS:
+            if flag in dirty:
+                for handler in self._handlers[flag]:
+                    handler(dirty[flag])
+
+        self._last_flush = time.perf_counter() - start
+        self._flush_time += self._last_flush
+        self._max_flush = max(self._max_flush, self._last_flush)
+        self._frames += 1
+
+    @property
+    def frames(self) -> int:
+        """
+        frames Number of flushes
+
+        :return: Frame count
+        :rtype: int
+        """
+
+        return self._frames
+
+    @property
+    def flush_time(self) -> float:
+        """
+        flush_time Total time spent flushing changes
+
+        :return: Time in seconds
+        :rtype: float
+        """
+
+        return self._flush_time
+
+    @property
+    def last_flush(self) -> float:
+        """
+        last_flush Time taken by the last flush
+
+        :return: Time in seconds
+        :rtype: float
+        """
+
+        return self._last_flush
+
+    @property
+    def max_flush(self) -> float:
+        """
+        max_flush Time taken by the slowest flush
+
+        :return: Time in seconds
+        :rtype: float
+        """
+
+        return self._max_flush
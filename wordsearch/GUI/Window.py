@@ -10,8 +10,11 @@ from typing import Any
 
 import wordsearch.Game
 from wordsearch.__version__ import __copyright__, __license__, __version__
+from wordsearch.Game.Errors import PuzzleFileError
+from wordsearch.GUI.Autosave import SAVE_FAILED, Autosave
 from wordsearch.GUI.Board import Board
 from wordsearch.GUI.ControlSideBar import ControlSideBar
+from wordsearch.GUI.Scheduler import Scheduler
 from wordsearch.GUI.WordList import WordList
 from wordsearch.Settings import Settings
 from wordsearch.constants import HOME
@@ -51,9 +54,19 @@ class Window:
         self._mainframe.columnconfigure(1, weight=1)
         self._mainframe.columnconfigure(2, weight=0)
         self._mainframe.rowconfigure(0, weight=1)
+
+        # Views are updated from changes to the game, at most once per
+        # idle tick
+        self._scheduler = Scheduler(self._root)
+        self._game.listen(self._scheduler.mark)
+
+        # Saves are written from a worker thread
+        self._autosave = Autosave(self._root, self._game)
+        self._root.bind(SAVE_FAILED, self._saveFailed)
+
         self._control_sidebar = ControlSideBar(self._mainframe, self._settings, self._game)
-        self._word_list = WordList(self._mainframe, self._settings, self._game)
-        self._board = Board(self._mainframe, self._settings, self._game)
+        self._word_list = WordList(self._mainframe, self._settings, self._game, self._scheduler)
+        self._board = Board(self._mainframe, self._settings, self._game, self._scheduler)
 
         self._dark_theme = StringVar(
             value=self._settings.settings["display"]["theme"]
@@ -172,7 +185,7 @@ class Window:
             self._saveAs()
             return
 
-        self._game.save(self._game.path)
+        self._autosave.saveNow(self._game.path)
 
     def _saveAs(self) -> None:
         """
@@ -196,7 +209,14 @@ class Window:
         if not isinstance(path, str):
             return
 
-        self._game.save(path)
+        self._autosave.saveNow(path)
+
+    def _saveFailed(self, *args: Any) -> None:
+        """
+        _saveFailed Tell the user a save failed
+        """
+
+        messagebox.showerror("Error", f"Failed to save puzzle: {self._autosave.error}")
 
     def _load(self) -> None:
         """
@@ -237,10 +257,22 @@ class Window:
             self._game.load(path)
         except FileNotFoundError:
             messagebox.showerror("Error", "File not found")
+        except PuzzleFileError as e:
+            messagebox.showerror("Error", str(e))
         except:
             messagebox.showerror("Error", "Failed to load save file")
-        else:
-            self._mainframe.event_generate("<<LOADED_GAMEBOARD>>")
+
+    def close(self) -> None:
+        """
+        close Finish saving before the window is destroyed
+
+        Waits for any save being written and saves progress made since.
+        """
+
+        try:
+            self._autosave.close()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save puzzle: {e}")
 
     def mainloop(self) -> None:
         """
@@ -3,13 +3,16 @@
 
 from tkinter import *
 from tkinter import ttk
+from tkinter import font
 
 from wordsearch.Settings import Settings
+from wordsearch.GUI.Scheduler import Scheduler
+from wordsearch.Game.Board import BOARD, WORDS
 import wordsearch.Game
 
 
 class WordList:
-    def __init__(self, parent: ttk.Frame, settings: Settings, board: wordsearch.Game.Board) -> None:
+    def __init__(self, parent: ttk.Frame, settings: Settings, board: wordsearch.Game.Board, scheduler: Scheduler) -> None:
         """
         __init__ Create the word list
 
@@ -21,23 +24,35 @@ class WordList:
         :type settings: wordsearch.Settings.Settings
         :param board: Instance of game board
         :type board: wordsearch.Game.Board
+        :param scheduler: Scheduler passing on changes to the board
+        :type scheduler: wordsearch.GUI.Scheduler.Scheduler
         """
 
         self._settings = settings
         self._board = board
+        self._scheduler = scheduler
+
+        # Only the words in view are put in the text widget
+        self._first = 0
+        self._rows = 1
 
         self._frame = ttk.Frame(parent)
         self._frame.grid(column=0, row=0, sticky=(N, W, E, S))
         self._frame.columnconfigure(0, weight=1)
         self._frame.columnconfigure(1, weight=0)
+        self._frame.columnconfigure(2, weight=0)
         self._frame.rowconfigure(0, weight=0)
         self._frame.rowconfigure(1, weight=1)
-        ttk.Separator(self._frame, orient=VERTICAL).grid(column=1, row=0, rowspan=2, padx=5, sticky=(N, S))
+        ttk.Separator(self._frame, orient=VERTICAL).grid(column=2, row=0, rowspan=2, padx=5, sticky=(N, S))
 
-        ttk.Label(self._frame, text="Words to find").grid(column=0, row=0, padx=5, pady=5, sticky=(W))
-        self._word_list = Text(self._frame, width=30, state=DISABLED)
-        self._word_list.grid(column=0, row=1, padx=5, pady=5, sticky=(N, W, S, E))
+        ttk.Label(self._frame, text="Words to find").grid(column=0, row=0, columnspan=2, padx=5, pady=5, sticky=(W))
+        self._word_list = Text(self._frame, width=30, wrap=NONE, state=DISABLED)
+        self._word_list.grid(column=0, row=1, padx=(5, 0), pady=5, sticky=(N, W, S, E))
         self._word_list.tag_config("strikethrough", overstrike=1)
+        self._scrollbar = ttk.Scrollbar(self._frame, orient=VERTICAL, command=self._onScrollbar)
+        self._scrollbar.grid(column=1, row=1, pady=5, sticky=(N, S))
+
+        self._line_height = font.Font(self._word_list, font=self._word_list.cget("font")).metrics("linespace")
 
         self._registerEvents()
 
@@ -46,26 +61,128 @@ class WordList:
         _registerEvents Register event handlers
         """
 
-        self._frame.bind_all("<<LOADED_GAMEBOARD>>", self._loadWords, add='+')
-        self._frame.bind_all("<<FOUND_WORD>>", self._loadWords, add="+")
+        self._scheduler.register(BOARD, self._loadWords)
+        self._scheduler.register(WORDS, self._strikeFound)
+        self._word_list.bind("<Configure>", self._resize)
+        # Windows and macOS send MouseWheel, X11 sends buttons 4 and 5
+        self._word_list.bind("<MouseWheel>", self._onScroll)
+        self._word_list.bind("<Button-4>", self._onScroll)
+        self._word_list.bind("<Button-5>", self._onScroll)
 
-    def _loadWords(self, event: Event) -> None:
+    def _loadWords(self, changes: list) -> None:
         """
         _loadWords Load words
 
         Load the words into the word list
 
-        :param event: Tkinter event
-        :type event: tkinter.Event
+        :param changes: Unused
+        :type changes: list
+        """
+
+        self._first = 0
+        self._render()
+
+    def _render(self) -> None:
         """
+        _render Show the words in view
 
+        Replaces the contents of the text widget with the words that
+        fit in it, starting from the first word in view.
+        """
+
+        words = self._board.word_list
         self._word_list.config(state=NORMAL)
         self._word_list.delete(1.0, END)
 
-        for i in self._board.word_list:
+        for i in words[self._first:self._first + self._rows]:
             if i.found:
                 self._word_list.insert(END, i.word, ("strikethrough"))
             else:
                 self._word_list.insert(END, i.word)
             self._word_list.insert(END, "\n")
         self._word_list.config(state=DISABLED)
+
+        if len(words) == 0:
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._first / len(words), min(1, (self._first + self._rows) / len(words)))
+
+    def _strikeFound(self, changes: list[int]) -> None:
+        """
+        _strikeFound Strike through newly found words
+
+        Only the lines of the newly found words are changed.
+
+        :param changes: Indices of newly found words
+        :type changes: list[int]
+        """
+
+        for i in changes:
+            if self._first <= i < self._first + self._rows:
+                line = i - self._first + 1
+                self._word_list.tag_add("strikethrough", f"{line}.0", f"{line}.end")
+
+    def _scrollTo(self, first: int) -> None:
+        """
+        _scrollTo Scroll so the given word is the first in view
+
+        :param first: Index of word
+        :type first: int
+        """
+
+        first = max(0, min(first, len(self._board.word_list) - self._rows))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _onScrollbar(self, *args: str) -> None:
+        """
+        _onScrollbar Callback for the scrollbar
+
+        :param args: Either "moveto" and a fraction or "scroll", a count
+            and "units" or "pages"
+        :type args: str
+        """
+
+        if args[0] == "moveto":
+            self._scrollTo(int(float(args[1]) * len(self._board.word_list)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._rows
+            self._scrollTo(self._first + step)
+
+    def _onScroll(self, event: Event) -> str:
+        """
+        _onScroll Callback for mouse wheel events
+
+        :param event: Tkinter event
+        :type event: tkinter.Event
+        :return: "break" to stop the text widget scrolling itself
+        :rtype: str
+        """
+
+        if event.num == 4 or event.delta > 0:
+            self._scrollTo(self._first - 3)
+        else:
+            self._scrollTo(self._first + 3)
+        return "break"
+
+    def _resize(self, event: Event) -> None:
+        """
+        _resize Callback for resize event
+
+        :param event: Tkinter event
+        :type event: tkinter.Event
+        """
+
+        padding = 2 * (
+            int(self._word_list.cget("borderwidth"))
+            + int(self._word_list.cget("highlightthickness"))
+            + int(self._word_list.cget("pady"))
+        )
+        rows = max(1, (event.height - padding) // self._line_height)
+        if rows != self._rows:
+            self._rows = rows
+            self._first = max(0, min(self._first, len(self._board.word_list) - rows))
+            self._render()
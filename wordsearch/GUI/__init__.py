@@ -1,4 +1,12 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
-from wordsearch.GUI.Window import Window as GUI
+
+def __getattr__(name: str) -> object:
+    # Importing the window loads tkinter and every widget so it is
+    # deferred until the GUI is actually started.
+    if name == "GUI":
+        from wordsearch.GUI.Window import Window
+        globals()["GUI"] = Window
+        return Window
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
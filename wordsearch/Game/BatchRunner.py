@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import os
+import random
+from typing import Iterator
+
+from wordsearch.Game.Board import Board
+from wordsearch.Game.Dictionary import Dictionary
+
+# State of each worker process. Set once by _initWorker so the
+# dictionary is only sent to each worker a single time.
+_worker_dictionary: Dictionary|None = None
+_worker_options: dict = {}
+
+
+def _initWorker(dictionary: Dictionary, options: dict) -> None:
+    """
+    _initWorker Initialise a worker process
+
+    :param dictionary: Dictionary to generate from
+    :type dictionary: wordsearch.Game.Dictionary
+    :param options: Keyword arguments for Board.generate
+    :type options: dict
+    """
+
+    global _worker_dictionary, _worker_options
+    _worker_dictionary = dictionary
+    _worker_options = options
+
+
+def _generateOne(index: int, seed: int) -> tuple[int, Board]:
+    """
+    _generateOne Generate a single puzzle in a worker
+
+    :param index: Index of puzzle in batch
+    :type index: int
+    :param seed: Seed for this puzzle
+    :type seed: int
+    :return: Tuple of index and generated board
+    :rtype: tuple[int, Board]
+    """
+
+    board = Board()
+    board.generate(dict=_worker_dictionary, seed=seed, **_worker_options)
+    return index, board
+
+
+class Batch:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        dictionary: list[str]|Dictionary,
+        words: int,
+        count: int,
+        seed: int|None = None,
+        overlap: bool = False,
+        compact: bool = False,
+        unique: bool = False
+    ) -> None:
+        """
+        __init__ Create instance of Batch
+
+        Batch describes a set of puzzles to generate with the same
+        settings. Each puzzle gets its own seed derived from the batch
+        seed so a batch can be reproduced no matter how the work is
+        spread over processes.
+
+        :param width: Width of each board
+        :type width: int
+        :param height: Height of each board
+        :type height: int
+        :param dictionary: Dictionary to use for words
+        :type dictionary: list[str]|wordsearch.Game.Dictionary
+        :param words: Number of words in each puzzle
+        :type words: int
+        :param count: Number of puzzles to generate
+        :type count: int
+        :param seed: Seed for the batch, defaults to a random seed
+        :type seed: int|None, optional
+        :param overlap: Allow words to cross, defaults to False
+        :type overlap: bool, optional
+        :param compact: Use compact grids, defaults to False
+        :type compact: bool, optional
+        :param unique: Make every word appear exactly once, defaults to
+            False
+        :type unique: bool, optional
+        """
+
+        if not isinstance(dictionary, Dictionary):
+            dictionary = Dictionary(dictionary)
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        self._dictionary = dictionary
+        self._count = count
+        self._seed = seed
+        self._options = {
+            "width": width,
+            "height": height,
+            "words": words,
+            "overlap": overlap,
+            "compact": compact,
+            "unique": unique
+        }
+
+    @property
+    def seed(self) -> int:
+        """
+        seed Seed of the batch
+
+        :return: Seed
+        :rtype: int
+        """
+
+        return self._seed
+
+    def seeds(self) -> list[int]:
+        """
+        seeds Seed of each puzzle in the batch
+
+        :return: List of seeds, one per puzzle
+        :rtype: list[int]
+        """
+
+        rng = random.Random(self._seed)
+        return [rng.getrandbits(64) for i in range(self._count)]
+
+    def run(self, workers: int|None = None) -> Iterator[tuple[int, Board]]:
+        """
+        run Generate the puzzles
+
+        Spreads generation over a pool of processes and yields each
+        puzzle as soon as it is complete, so results are not in order.
+        Only a few puzzles per worker are in flight at a time to keep
+        memory bounded for large batches.
+
+        :param workers: Number of processes, defaults to the number of
+            CPUs
+        :type workers: int|None, optional
+        :return: Iterator of (index, board) tuples
+        :rtype: Iterator[tuple[int, wordsearch.Game.Board]]
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        seeds = iter(enumerate(self.seeds()))
+        pending: set[Future] = set()
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initWorker,
+            initargs=(self._dictionary, self._options)
+        ) as executor:
+            while True:
+                for index, seed in seeds:
+                    pending.add(executor.submit(_generateOne, index, seed))
+                    if len(pending) >= workers*4:
+                        break
+                if len(pending) == 0:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
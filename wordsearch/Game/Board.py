@@ -1,13 +1,35 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
-import pickle
+import os
 import random
+import time
+from typing import Any, Callable
 
-from wordsearch.constants import RETRIES, ALPHABET
+from wordsearch.constants import CHECK_FILL_LIMIT, JOURNAL_LIMIT, RETRIES
+from wordsearch.Game.Solver import AXES, gridLines, gridRows
 import wordsearch.Game.Errors
+import wordsearch.Game.PuzzleFile
+from wordsearch.Game import Journal
 from wordsearch.Game.Word import Word
 from wordsearch.Game.Char import Char
+from wordsearch.Game.Placer import Placer
+from wordsearch.Game.SaveJob import SaveJob
+from wordsearch.Game.Dictionary import Dictionary
+from wordsearch.Game.CompactGrid import CompactGrid
+from wordsearch.Game.Filler import Filler
+from wordsearch.Game.Verifier import Verifier
+from wordsearch.Game.Trie import Trie
+
+BOARD = "board"
+"""Change sent to listeners when a new board is generated or loaded"""
+
+CELLS = "cells"
+"""Change sent to listeners with the coordinates of characters whose
+selected or found state changed"""
+
+WORDS = "words"
+"""Change sent to listeners with the indices of newly found words"""
 
 
 class Board:
@@ -21,13 +43,92 @@ class Board:
         self._width: int = 1
         self._height: int = 1
         self._word_count: int = 0
-        self._dict: list[str] = []
-        self._board: list[list[Char|None]] = []
+        self._dict = Dictionary([])
+        self._sampler = self._dict.sampler(0)
+        self._board: list[list[Char|None]]|CompactGrid = []
         self._word_list: list[Word] = []
+        self._trie: Trie|None = None
+        self._selection: list[tuple[int, int]] = []
+        self._found: list[int] = []
+        self._listeners: list[Callable[[str, list[Any]], None]] = []
+        # Progress not yet written to the journal, the number of records
+        # already in it and the size, modification time and CRC-32 of
+        # the puzzle file it belongs to
+        self._journal: list[Journal.Record] = []
+        self._journal_size = 0
+        self._file: tuple[int, int, int]|None = None
+        self._replaying = False
+        # Changed whenever the board is replaced so saves that finish
+        # afterwards are not applied to the wrong board
+        self._revision = 0
+        self._placer = Placer(1, 1)
+        self._overlap = False
+        self._compact = False
+        self._check_fill = True
+        self._unique = False
+        self._repair_rounds = 0
+        self._fill_conflicts = 0
+        self._shared_cells = 0
+        self._cells: list[str] = []
+        self._seed: int|None = None
+        self._dict_digest = ""
+        self._rng = random.Random()
         self.path: str = ""
         self.loaded = False
 
-    def generate(self, width: int, height: int, dict: list[str], words: int) -> None:
+    def __getstate__(self) -> dict:
+        """
+        __getstate__ State used when pickling
+
+        The dictionary, placement state and random number generator are
+        only needed during generation so are left out, as are listeners
+        and the word trie which is rebuilt on demand. This keeps boards
+        cheap to send between processes.
+
+        :return: State of board
+        :rtype: dict
+        """
+
+        state = self.__dict__.copy()
+        del state["_dict"]
+        del state["_sampler"]
+        del state["_placer"]
+        del state["_rng"]
+        del state["_cells"]
+        del state["_trie"]
+        del state["_listeners"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        __setstate__ Restore state after unpickling
+
+        :param state: State of board
+        :type state: dict
+        """
+
+        self.__dict__.update(state)
+        self._dict = Dictionary([])
+        self._sampler = self._dict.sampler(0)
+        self._placer = Placer(1, 1)
+        self._rng = random.Random(self._seed)
+        self._cells = []
+        self._trie = None
+        self._listeners = []
+
+    def generate(
+        self,
+        width: int,
+        height: int,
+        dict: list[str]|Dictionary,
+        words: int,
+        overlap: bool = False,
+        compact: bool = False,
+        filler: Filler|None = None,
+        seed: int|random.Random|None = None,
+        check_fill: bool|None = None,
+        unique: bool = False
+    ) -> None:
         """
         generate Generate a new board
 
@@ -37,122 +138,555 @@ class Board:
         :type width: int
         :param height: Height of board
         :type height: int
-        :param dict: Dictionary to use for words
-        :type dict: list[str]
+        :param dict: Dictionary to use for words. A list is left
+            unmodified
+        :type dict: list[str]|wordsearch.Game.Dictionary
         :param words: Number of words to put in puzzle
         :type words: int
+        :param overlap: Allow words to cross where their letters match,
+            defaults to False
+        :type overlap: bool, optional
+        :param compact: Store the board in a CompactGrid rather than
+            one Char per cell. Recommended for large boards, defaults
+            to False
+        :type compact: bool, optional
+        :param filler: Filler used for empty cells, defaults to one
+            matching the letter frequencies of the dictionary
+        :type filler: wordsearch.Game.Filler|None, optional
+        :param seed: Seed for the board or a random number generator to
+            draw the seed from, defaults to a random seed
+        :type seed: int|random.Random|None, optional
+        :param check_fill: Redraw filler letters that would spell
+            another copy of a placed word, defaults to only checking
+            boards with at most CHECK_FILL_LIMIT cells
+        :type check_fill: bool|None, optional
+        :param unique: Guarantee every word appears exactly once in any
+            direction, repairing the board until it does, defaults to
+            False
+        :type unique: bool, optional
+        :raises wordsearch.Game.Errors.RetriesExceededError: Board
+            could not be made unique
         """
 
+        # Every random choice comes from a generator owned by this board
+        # so boards can be reproduced and generated concurrently.
+        if seed is None:
+            seed = random.getrandbits(64)
+        elif isinstance(seed, random.Random):
+            seed = seed.getrandbits(64)
+        self._seed = seed
+        self._rng = random.Random(seed)
+
         self._width = width
         self._height = height
         self._word_count = words
+        if not isinstance(dict, Dictionary):
+            dict = Dictionary(dict)
         self._dict = dict
+        self._dict_digest = dict.digest()
+        self._overlap = overlap
+        self._compact = compact
+        if check_fill is None:
+            check_fill = width*height <= CHECK_FILL_LIMIT
+        self._check_fill = check_fill
+        self._unique = unique
+        self._repair_rounds = 0
+        self._fill_conflicts = 0
+
+        if filler is None:
+            filler = dict.filler()
+        self._build(filler)
+        if unique:
+            self._makeUnique(filler)
+            # Every copy was repaired
+            self._fill_conflicts = 0
+        # The placement index costs far more than the grid and is only
+        # needed while generating
+        self._placer = Placer(1, 1)
+        self._cells = []
+        self._trie = None
+        self._selection = []
+        self._found = []
+        self._journal = []
+        self._journal_size = 0
+        self._file = None
+        self._revision += 1
+
+        self.path = ""
+        self.loaded = True
+        self._notify(BOARD, [])
+
+    def _build(self, filler: Filler) -> None:
+        """
+        _build Place words and fill the board
+
+        :param filler: Filler to draw letters from
+        :type filler: wordsearch.Game.Filler
+        """
+
+        # Words longer than the board can never be placed
+        self._sampler = self._dict.sampler(max(self._width, self._height))
         self._word_list = []
+        self._shared_cells = 0
+
+        if self._compact:
+            self._board = CompactGrid(self._width, self._height)
+        else:
+            self._board = [[None]*self._width for i in range(self._height)]
+        self._placer = Placer(self._width, self._height)
 
-        self._board = [[None]*self._width for i in range(self._height)]        
-        
         # Place words
         for i in range(self._word_count):
             self._placeWord()
 
-        # Fill empty spaces
-        for i in range(len(self._board)):
-            for j in range(len(self._board[i])):
-                if self._board[i][j] is None:
-                    self._board[i][j] = Char(self._getChar())
-
-        self.path = ""
-        self.loaded = True
+        # Fill empty spaces. A flat copy of the letters and a list of
+        # the empty cells are only needed to check the filler, and cost
+        # more than a compact grid on large boards
+        if self._check_fill:
+            self._cells = self._placer.cells()
+            self._fill(filler, [i for i in range(len(self._cells)) if self._cells[i] == "\0"])
+        else:
+            self._fillAll(filler)
 
     def _placeWord(self) -> None:
         """
         _placeWord Place a word on the board
 
-        Chooses a random word from the dictionary and then places the
-        word on the board
+        Chooses a random word from the dictionary and then places it on
+        the board. If overlap is enabled, positions crossing the most
+        existing letters are tried first. Otherwise the word is chosen
+        to fit in the longest free run and placed at one of the free
+        positions.
+
+        :raises wordsearch.Game.Errors.PuzzleSizeError: No space left
+            on board for any remaining word
         """
-        retries = 0
-        
-        while retries < RETRIES:
-            retries += 1
-
-            x = random.randint(0, self._width-1)
-            y = random.randint(0, self._height-1)
-            # True if vertical, false if horizontal
-            direction = bool(random.getrandbits(1))
-            word = Word(self._chooseWord())
-            length = word.length()
-
-            # Make sure end of word is on board
-            if direction:
-                try:
-                    self._board[y+length][x]
-                except IndexError:
-                    continue
-            else:
-                try:
-                    self._board[y][x+length]
-                except IndexError:
-                    continue
-            
-            # Make sure we dont overlap any other words
-            overlap = False
-            if direction:
-                for i in range(length):
-                    if self._board[y+i][x] is not None:
-                        overlap = True
-                        break
-            else:
-                for i in range(length):
-                    if self._board[y][x+i] is not None:
-                        overlap = True
-                        break
-            if overlap:
-                continue
 
-            # Board must be good to populate
-            for i in range(length):
-                if direction:
-                    self._board[y+i][x] = Char(word.word[i])
-                else:
-                    self._board[y][x+i] = Char(word.word[i])
-            
-            self._word_list.append(word)
-            return
-        raise wordsearch.Game.Errors.RetriesExceededError
+        longest = self._placer.longest()
+        position = None
+
+        if self._overlap:
+            for i in range(RETRIES):
+                word = Word(self._chooseWord(max(self._width, self._height)))
+                position = self._placer.chooseCrossing(word.word, self._rng)
+                if position is None and word.length() <= longest:
+                    position = self._placer.choose(word.length(), self._rng)
+                if position is not None:
+                    break
+                # Words that did not fit may still be drawn later
+                self._sampler.putBack(word.word)
+
+        if position is None:
+            if self._sampler.remaining(longest) < 1 and self._sampler.remaining(max(self._width, self._height)) > 0:
+                # There are words left but none of them fit
+                raise wordsearch.Game.Errors.PuzzleSizeError
+            word = Word(self._chooseWord(longest))
+            position = self._placer.choose(word.length(), self._rng)
+
+        x, y, direction = position
+        self._shared_cells += self._placer.place(word.word, x, y, direction)
 
-    def _chooseWord(self) -> str:
+        dx, dy = direction
+        for i in range(word.length()):
+            self._board[y + i*dy][x + i*dx] = Char(word.word[i])
+
+        word.place(x, y, direction)
+        self._word_list.append(word)
+
+    def _chooseWord(self, max_length: int) -> str:
         """
         _chooseWord Chooses a random word from list
 
-        Chooses a random word from the list and then deletes it.
+        Chooses a random word no longer than max_length that has not
+        yet been used on this board.
 
+        :param max_length: Maximum length of word
+        :type max_length: int
         :return: Chosen word
         :rtype: str
         """ 
 
-        if len(self._dict) < 1:
-            raise wordsearch.Game.Errors.OutOfWordsError
+        return self._sampler.pick(max_length, self._rng)
+
+    def _fill(self, filler: Filler, empty: list[int]) -> None:
+        """
+        _fill Fill cells of the board
 
-        index = random.randint(0, len(self._dict)-1)
-        return self._dict.pop(index)
+        Draws the letters for every cell in one batch. If checking is
+        enabled, each letter is then tested in turn against the lines
+        through its cell and redrawn if it would complete a copy of a
+        placed word. A letter that still completes a copy after RETRIES
+        redraws is kept and counted in fill_conflicts.
 
-    @staticmethod
-    def _getChar() -> str:
+        :param filler: Filler to draw letters from
+        :type filler: wordsearch.Game.Filler
+        :param empty: Indices of cells to fill in row major order
+        :type empty: list[int]
         """
-        _getChar Get a random character
 
-        Gets a random character
+        cells = self._cells
+        letters = filler.sample(len(empty), self._rng)
 
-        :return: A random character
-        :rtype: str
+        if self._check_fill and len(self._word_list) > 0:
+            # Cells not yet filled hold NUL while checking so lines can
+            # be sliced and joined. No word contains NUL so no copy can
+            # pass through them.
+            for i in empty:
+                cells[i] = "\0"
+            words = set()
+            for word in self._word_list:
+                upper = word.word.upper()
+                words.add(upper)
+                words.add(upper[::-1])
+            size = min(3, min(len(i) for i in words))
+            prefixes: dict[str, set[int]] = {}
+            for word in words:
+                prefixes.setdefault(word[:size], set()).add(len(word))
+            reach = max(len(i) for i in words) - 1
+            for i in range(len(empty)):
+                cells[empty[i]] = letters[i]
+                retries = 0
+                while self._completesWord(words, prefixes, size, reach, cells, empty[i]):
+                    if retries == RETRIES:
+                        self._fill_conflicts += 1
+                        break
+                    retries += 1
+                    cells[empty[i]] = filler.sample(1, self._rng)[0]
+                letters[i] = cells[empty[i]]
+        elif self._check_fill:
+            for index, letter in zip(empty, letters):
+                cells[index] = letter
+
+        if isinstance(self._board, CompactGrid) and self._board.emptyCount() == len(empty):
+            self._board.fillEmpty(letters)
+            return
+
+        for index, letter in zip(empty, letters):
+            self._board[index // self._width][index % self._width] = Char(letter)
+
+    def _fillAll(self, filler: Filler) -> None:
+        """
+        _fillAll Fill every empty cell without checking the letters
+
+        :param filler: Filler to draw letters from
+        :type filler: wordsearch.Game.Filler
+        """
+
+        if isinstance(self._board, CompactGrid):
+            self._board.fillEmpty(filler.sample(self._board.emptyCount(), self._rng))
+            return
+
+        letters = iter(filler.sample(sum(row.count(None) for row in self._board), self._rng))
+        for row in self._board:
+            for x in range(self._width):
+                if row[x] is None:
+                    row[x] = Char(next(letters))
+
+    def _completesWord(
+        self,
+        words: set[str],
+        prefixes: dict[str, set[int]],
+        size: int,
+        reach: int,
+        cells: list[str],
+        index: int
+    ) -> bool:
+        """
+        _completesWord Check if a cell is part of any word
+
+        Only the cells within one word length of the cell along each
+        axis are read, as one slice of the flat list per axis. A word
+        can only start where the line matches the start of some word, so
+        only those positions are looked up in full.
+
+        :param words: Placed words and their reverses in upper case
+        :type words: set[str]
+        :param prefixes: First size letters of each word mapped to the
+            lengths of words starting with them
+        :type prefixes: dict[str, set[int]]
+        :param size: Length of prefixes
+        :type size: int
+        :param reach: Length of the longest word less one
+        :type reach: int
+        :param cells: Flat list of letters of the board, with NUL in
+            cells not yet filled
+        :type cells: list[str]
+        :param index: Index of cell to check
+        :type index: int
+        :return: True if a word passes through the cell
+        :rtype: bool
+        """
+
+        width = self._width
+        x = index % width
+        y = index // width
+
+        for dx, dy in AXES:
+            # Lines are read towards increasing indices. Words are
+            # matched in both directions so the direction is irrelevant.
+            if dy < 0:
+                dx, dy = -dx, -dy
+            step = dy*width + dx
+            if step == 0:
+                # Anti-diagonal of a board one cell wide, which is just
+                # the cell itself
+                continue
+            before = min(
+                reach,
+                x if dx > 0 else width - 1 - x if dx < 0 else reach,
+                y if dy > 0 else reach
+            )
+            after = min(
+                reach,
+                width - 1 - x if dx > 0 else x if dx < 0 else reach,
+                self._height - 1 - y if dy > 0 else reach
+            )
+
+            line = "".join(cells[index - before*step:index + after*step + 1:step]).upper()
+            end = len(line)
+            for start in range(before + 1):
+                lengths = prefixes.get(line[start:start + size])
+                if lengths is None:
+                    continue
+                for length in lengths:
+                    if start + length > before and start + length <= end and line[start:start + length] in words:
+                        return True
+        return False
+
+    def _makeUnique(self, filler: Filler) -> None:
         """
+        _makeUnique Repair the board until every word appears once
 
-        # TODO: Make this return chars based on frequency in english
-        # language. I.e e more frequent than z
+        Each round finds every copy of every word other than the one
+        that was placed, and only the cells of those copies are
+        changed. Filler cells of a copy are refilled. A copy made only
+        of placed letters can not be fixed by refilling, so the word it
+        copies is swapped for another dictionary word of the same
+        length in the same place or, if none fits, moved elsewhere.
 
-        return random.choice(ALPHABET)
+        :param filler: Filler to draw letters from
+        :type filler: wordsearch.Game.Filler
+        :raises wordsearch.Game.Errors.RetriesExceededError: Board
+            could not be made unique
+        """
+
+        while True:
+            copies = self._extraCopies()
+            if len(copies) == 0:
+                return
+
+            self._repair_rounds += 1
+            if self._repair_rounds > RETRIES:
+                raise wordsearch.Game.Errors.RetriesExceededError
+
+            placed = self._placedCells()
+            refill: set[int] = set()
+            replace: set[str] = set()
+            for copy in copies:
+                dx, dy = copy.direction
+                cells = [
+                    (copy.y + i*dy)*self._width + copy.x + i*dx
+                    for i in range(len(copy.word))
+                ]
+                free = [i for i in cells if i not in placed]
+                if len(free) > 0:
+                    refill.update(free)
+                else:
+                    replace.add(copy.word)
 
+            if len(replace) > 0:
+                lines = "\n".join(i[0] for i in gridLines(gridRows(self._board)))
+                for word in replace:
+                    if not self._replaceWord(word, lines):
+                        refill.update(self._moveWord(word))
+                placed = self._placedCells()
+
+            self._fill(filler, sorted(i for i in refill if i not in placed))
+
+    def _placedCells(self) -> set[int]:
+        """
+        _placedCells Cells covered by placed words
+
+        :return: Set of cell indices
+        :rtype: set[int]
+        """
+
+        return {
+            y*self._width + x for word in self._word_list
+            for x, y in word.cells()
+        }
+
+    def _extraCopies(self) -> list:
+        """
+        _extraCopies Find copies of words other than the placed ones
+
+        :return: List of occurrences that were not placed. If the same
+            word was placed twice, the second is included.
+        :rtype: list[wordsearch.Game.Solver.Occurrence]
+        """
+
+        placed: dict[str, frozenset] = {}
+        for word in self._word_list:
+            cells = word.cells()
+            placed.setdefault(word.word, frozenset((cells[0], cells[-1])))
+
+        copies = []
+        for copy in Verifier(placed).occurrences(self._board):
+            dx, dy = copy.direction
+            length = len(copy.word)
+            ends = frozenset((
+                (copy.x, copy.y),
+                (copy.x + (length-1)*dx, copy.y + (length-1)*dy)
+            ))
+            if placed[copy.word] != ends:
+                copies.append(copy)
+        return copies
+
+    def _replaceWord(self, text: str, lines: str) -> bool:
+        """
+        _replaceWord Swap a placed word for another in the same place
+
+        The new word is chosen from the dictionary words of the same
+        length that agree with any letters shared with other words and
+        do not already appear on the board.
+
+        :param text: Text of placed word to replace
+        :type text: str
+        :param lines: Every line of the board in upper case, separated
+            by new lines
+        :type lines: str
+        :return: True if the word was replaced
+        :rtype: bool
+        """
+
+        index = [i.word for i in self._word_list].index(text)
+        old = self._word_list[index]
+        x, y, direction = old.position
+        dx, dy = direction
+
+        # Cells also used by other words must keep their letters
+        shared = set()
+        for word in self._word_list:
+            if word is not old:
+                shared.update(word.cells())
+        fixed = [
+            j for j in range(old.length()) if (x + j*dx, y + j*dy) in shared
+        ]
+
+        used = {i.word for i in self._word_list}
+        candidates = [
+            i for i in self._dict.bucket(old.length())
+            if i not in used and all(i[j] == old.word[j] for j in fixed)
+        ]
+        self._rng.shuffle(candidates)
+        for text in candidates:
+            upper = text.upper()
+            if upper not in lines and upper[::-1] not in lines:
+                break
+        else:
+            return False
+
+        word = Word(text)
+        word.place(x, y, direction)
+        self._word_list[index] = word
+        self._placer.place(text, x, y, direction)
+        for j in range(word.length()):
+            if self._check_fill:
+                self._cells[(y + j*dy)*self._width + x + j*dx] = text[j]
+            self._board[y + j*dy][x + j*dx] = Char(text[j])
+        return True
+
+    def _moveWord(self, text: str) -> list[int]:
+        """
+        _moveWord Remove a placed word and place a new one
+
+        Cells only used by the removed word are freed in the placer,
+        so the new word may be placed over them or any other filler.
+
+        :param text: Text of placed word to remove
+        :type text: str
+        :return: Indices of freed cells that need refilling
+        :rtype: list[int]
+        """
+
+        index = [i.word for i in self._word_list].index(text)
+        old = self._word_list.pop(index)
+
+        others = set()
+        for word in self._word_list:
+            others.update(word.cells())
+        freed = [i for i in old.cells() if i not in others]
+        for x, y in freed:
+            self._placer.clear(x, y)
+
+        self._placeWord()
+        word = self._word_list[-1]
+        if self._check_fill:
+            for i, (x, y) in enumerate(word.cells()):
+                self._cells[y*self._width + x] = word.word[i]
+
+        taken = set(word.cells())
+        return [y*self._width + x for x, y in freed if (x, y) not in taken]
+
+    def reference(self) -> dict|None:
+        """
+        reference Reference from which the board can be regenerated
+
+        The reference holds the seed and generation settings along with
+        a digest of the dictionary. Boards generated with a custom
+        filler can not be reproduced from a reference.
+
+        :return: Reference to board or None if the board was loaded
+            rather than generated
+        :rtype: dict|None
+        """
+
+        if self._seed is None:
+            return None
+        return {
+            "seed": self._seed,
+            "width": self._width,
+            "height": self._height,
+            "words": self._word_count,
+            "overlap": self._overlap,
+            "compact": self._compact,
+            "check_fill": self._check_fill,
+            "unique": self._unique,
+            "dictionary": self._dict_digest
+        }
+
+    @classmethod
+    def fromReference(cls, reference: dict, dict: list[str]|Dictionary) -> "Board":
+        """
+        fromReference Regenerate a board from a reference
+
+        :param reference: Reference returned by Board.reference
+        :type reference: dict
+        :param dict: Dictionary the board was generated from
+        :type dict: list[str]|wordsearch.Game.Dictionary
+        :raises ValueError: Dictionary does not match reference
+        :return: Regenerated board
+        :rtype: Board
+        """
+
+        if not isinstance(dict, Dictionary):
+            dict = Dictionary(dict)
+        if dict.digest() != reference["dictionary"]:
+            raise ValueError("Dictionary does not match the one used to generate the board")
+
+        board = cls()
+        board.generate(
+            reference["width"],
+            reference["height"],
+            dict,
+            reference["words"],
+            overlap=reference["overlap"],
+            compact=reference["compact"],
+            seed=reference["seed"],
+            check_fill=reference.get("check_fill", True),
+            unique=reference.get("unique", False)
+        )
+        return board
 
     def printBoard(self) -> None:
         """
@@ -173,40 +707,372 @@ class Board:
         """
         save Save the board to disk
 
-        Saves the board and wordlist to disk
+        Saves the board and wordlist to disk in the puzzle file format.
+        If the board was loaded from or last saved to the same file,
+        only the progress made since is appended to its journal. Once
+        the journal holds JOURNAL_LIMIT records the puzzle file is
+        rewritten and the journal emptied.
 
         :param path: Path to save to
         :type path: str
         """
 
-        self.path = str(path)
-        data = [self._board, self._word_list, self._width, self._height]
-        with open(path, "wb") as f:
-            pickle.dump(data, f)
+        job = self.prepareSave(path)
+        try:
+            job.write()
+        except BaseException as e:
+            self.finishSave(job, e)
+            raise
+        if not self.finishSave(job):
+            # The file was changed by something else so is rewritten
+            job = self.prepareSave(path)
+            job.write()
+            self.finishSave(job)
+
+    def prepareSave(self, path: str) -> SaveJob:
+        """
+        prepareSave Take a snapshot of the board to save
+
+        Nothing is read from or written to disk so this is cheap enough
+        to call from the GUI. The returned job can be written from
+        another thread and must then be passed to finishSave. Progress
+        in the job is no longer pending until finishSave is told the
+        save failed.
 
-    def load(self, path: str) -> None:
+        :param path: Path to save to
+        :type path: str
+        :return: Snapshot to write
+        :rtype: wordsearch.Game.SaveJob.SaveJob
+        """
+
+        path = str(path)
+        records = self._journal
+        self._journal = []
+        if (
+            path == self.path
+            and self._file is not None
+            and self._journal_size + len(records) <= JOURNAL_LIMIT
+        ):
+            return SaveJob(path, records, file=self._file, revision=self._revision)
+        return SaveJob(path, records, self.dumps(), revision=self._revision)
+
+    def finishSave(self, job: SaveJob, error: BaseException|None = None) -> bool:
+        """
+        finishSave Record the result of writing a job from prepareSave
+
+        If the save failed, its progress is kept to be saved again. If
+        the puzzle file had been changed by something else, the next
+        save rewrites it in full.
+
+        :param job: Job returned by prepareSave
+        :type job: wordsearch.Game.SaveJob.SaveJob
+        :param error: Exception raised while writing, defaults to None
+        :type error: BaseException|None, optional
+        :return: Was the board saved?
+        :rtype: bool
+        """
+
+        # A new board was generated or loaded while the job was written
+        if job.revision != self._revision:
+            return error is None and not job.stale
+
+        if error is not None or job.stale:
+            self._journal = job.records + self._journal
+            if job.stale:
+                self._file = None
+            return False
+
+        if job.full:
+            self._journal_size = 0
+        else:
+            self._journal_size += len(job.records)
+        self._file = job.file
+        self.path = job.path
+        return True
+
+    def dumps(self) -> bytes:
+        """
+        dumps Encode the board in the puzzle file format
+
+        :return: Encoded board
+        :rtype: bytes
+        """
+
+        grid = CompactGrid.fromBoard(self._board, self._width, self._height)
+        selection = [y*self._width + x for x, y in self._selection]
+        return wordsearch.Game.PuzzleFile.dumps(grid, self._word_list, selection)
+
+    def load(self, path: str, legacy: bool = False) -> None:
         """
         load Load puzzle from disk
 
         Load the puzzle data from disk and parse it before storing it.
+        Progress recorded in the journal of the file is replayed over
+        the board. The board is always loaded into a CompactGrid.
+
+        Files pickled by older versions are refused unless legacy is
+        set, as unpickling can run arbitrary code. Convert trusted files
+        with python -m wordsearch convert instead.
 
-        :param path: _description_
+        :param path: Path to puzzle
         :type path: str
+        :param legacy: Also load files pickled by older versions. Only
+            use for files that are trusted, defaults to False
+        :type legacy: bool, optional
+        :raises wordsearch.Game.Errors.PuzzleFileError: File is not a
+            puzzle
         """
-        with open(path,"rb") as f:
-            data = pickle.load(f)
+
         # Load to local variables first to check for exceptions.
         # Prevents partial load of board
-        board = data[0]
-        word_list = data[1]
-        width = data[2]
-        height = data[3]
+        file = None
+        records = []
+        if wordsearch.Game.PuzzleFile.isPuzzle(path):
+            board, word_list, selection = wordsearch.Game.PuzzleFile.load(path)
+            stat = os.stat(path)
+            size, checksum = wordsearch.Game.PuzzleFile.checksum(path)
+            file = (stat.st_size, stat.st_mtime_ns, checksum)
+            records = Journal.read(Journal.journalPath(path), size, checksum) or []
+        elif legacy:
+            board, word_list, selection = wordsearch.Game.PuzzleFile.loadLegacy(path)
+        else:
+            raise wordsearch.Game.Errors.PuzzleFileError(
+                "Not a puzzle file. Puzzles saved by older versions must be "
+                f"converted first with: python -m wordsearch convert {path}"
+            )
+
+        # The journal is replayed over a separate board so a journal
+        # that does not match leaves this one untouched
+        loaded = Board()
+        loaded._setPuzzle(board, word_list, selection)
+        loaded._replay(records)
+        width = loaded._width
+        self._setPuzzle(loaded._board, loaded._word_list, [y*width + x for x, y in loaded._selection])
+        self._found = loaded._found
+        self._journal_size = len(records)
+        self._file = file
+        self.path = str(path)
+        self._notify(BOARD, [])
+
+    def _replay(self, records: list[Journal.Record]) -> None:
+        """
+        _replay Apply progress from a journal
+
+        :param records: Records to apply
+        :type records: list[wordsearch.Game.Journal.Record]
+        :raises wordsearch.Game.Errors.PuzzleFileError: Journal does not
+            match the board
+        """
+
+        self._replaying = True
+        try:
+            for record in records:
+                if record.action == Journal.SELECT:
+                    self.select(record.x, record.y)
+                elif record.action == Journal.UNDO:
+                    self.undoSelect()
+                elif record.action == Journal.CLEAR:
+                    self.clearSelection()
+                elif record.action == Journal.CONFIRM:
+                    self.confirmSelection()
+                elif record.action == Journal.FOUND:
+                    self.markFound(record.x)
+        except IndexError:
+            raise wordsearch.Game.Errors.PuzzleFileError("Journal does not match puzzle")
+        finally:
+            self._replaying = False
+
+    def loads(self, data: bytes|memoryview) -> None:
+        """
+        loads Load a puzzle encoded by dumps
+
+        :param data: Encoded puzzle
+        :type data: bytes|memoryview
+        :raises wordsearch.Game.Errors.PuzzleFileError: Data is not a
+            puzzle
+        """
+
+        self._setPuzzle(*wordsearch.Game.PuzzleFile.loads(data))
+        self._journal_size = 0
+        self._file = None
+        self.path = ""
+        self._notify(BOARD, [])
+
+    def _setPuzzle(self, board: CompactGrid, word_list: list[Word], selection: list[int]) -> None:
+        """
+        _setPuzzle Replace the board with a loaded puzzle
+
+        :param board: Letters and state of the board
+        :type board: wordsearch.Game.CompactGrid.CompactGrid
+        :param word_list: Words to find
+        :type word_list: list[wordsearch.Game.Word.Word]
+        :param selection: Flat indices of the selected cells in the
+            order they were selected
+        :type selection: list[int]
+        """
+
+        width = board.width
+        height = board.height
         self._board = board
         self._word_list = word_list
         self._width = width
         self._height = height
+        self._compact = True
+        self._trie = None
+        self._selection = [(i % width, i // width) for i in selection]
+        self._found = [i for i, word in enumerate(word_list) if word.found]
+        self._journal = []
+        self._revision += 1
         self.loaded = True
 
+        # Settings of the last generated board do not describe this one
+        self._seed = None
+        self._dict_digest = ""
+        self._word_count = len(word_list)
+        self._overlap = False
+        self._check_fill = True
+        self._unique = False
+        self._repair_rounds = 0
+        self._fill_conflicts = 0
+        self._shared_cells = 0
+
+    def listen(self, listener: Callable[[str, list[Any]], None]) -> None:
+        """
+        listen Be told about changes to the board
+
+        The listener is called with BOARD, CELLS or WORDS and a list of
+        what changed.
+
+        :param listener: Function to call on each change
+        :type listener: Callable[[str, list[Any]], None]
+        """
+
+        self._listeners.append(listener)
+
+    def _notify(self, change: str, items: list[Any]) -> None:
+        """
+        _notify Tell listeners about a change
+
+        :param change: What changed. One of BOARD, CELLS or WORDS
+        :type change: str
+        :param items: Items that changed
+        :type items: list[Any]
+        """
+
+        for listener in self._listeners:
+            listener(change, items)
+
+    def _record(self, action: int, x: int = 0, y: int = 0) -> None:
+        """
+        _record Keep a change to write to the journal on the next save
+
+        :param action: Action from wordsearch.Game.Journal
+        :type action: int
+        :param x: First argument of action, defaults to 0
+        :type x: int, optional
+        :param y: Second argument of action, defaults to 0
+        :type y: int, optional
+        """
+
+        if not self._replaying:
+            self._journal.append(Journal.Record(action, time.time(), x, y))
+
+    def select(self, x: int, y: int) -> None:
+        """
+        select Add a character to the selection
+
+        :param x: X coordinate of character
+        :type x: int
+        :param y: Y coordinate of character
+        :type y: int
+        """
+
+        self._board[y][x].select()
+        self._selection.append((x, y))
+        self._record(Journal.SELECT, x, y)
+        self._notify(CELLS, [(x, y)])
+
+    def undoSelect(self) -> tuple[int, int]|None:
+        """
+        undoSelect Remove the last character from the selection
+
+        :return: Coordinates of the deselected character or None if
+            nothing was selected
+        :rtype: tuple[int, int]|None
+        """
+
+        if not self._selection:
+            return None
+        x, y = self._selection.pop()
+        self._board[y][x].deselect()
+        self._record(Journal.UNDO)
+        self._notify(CELLS, [(x, y)])
+        return (x, y)
+
+    def clearSelection(self) -> list[tuple[int, int]]:
+        """
+        clearSelection Deselect every selected character
+
+        :return: Coordinates of the deselected characters
+        :rtype: list[tuple[int, int]]
+        """
+
+        if self._selection:
+            self._record(Journal.CLEAR)
+        return self._deselectAll()
+
+    def _deselectAll(self) -> list[tuple[int, int]]:
+        """
+        _deselectAll Deselect every selected character without
+        recording it
+
+        :return: Coordinates of the deselected characters
+        :rtype: list[tuple[int, int]]
+        """
+
+        selection = self._selection
+        for x, y in selection:
+            self._board[y][x].deselect()
+        self._selection = []
+        if selection:
+            self._notify(CELLS, selection)
+        return selection
+
+    def confirmSelection(self) -> list[tuple[int, int]]:
+        """
+        confirmSelection Mark the selected characters as found
+
+        The characters are deselected once marked.
+
+        :return: Coordinates of the found characters
+        :rtype: list[tuple[int, int]]
+        """
+
+        if self._selection:
+            self._record(Journal.CONFIRM)
+        for x, y in self._selection:
+            self._board[y][x].found = True
+        return self._deselectAll()
+
+    def markFound(self, index: int) -> bool:
+        """
+        markFound Mark a word as found
+
+        :param index: Index of word in the word list
+        :type index: int
+        :return: False if the word had already been found
+        :rtype: bool
+        """
+
+        word = self._word_list[index]
+        if word.found:
+            return False
+        word.found = True
+        self._found.append(index)
+        self._record(Journal.FOUND, index)
+        self._notify(WORDS, [index])
+        return True
+
     def checkWin(self) -> bool:
         """
         checkWin Check if player has won
@@ -218,10 +1084,7 @@ class Board:
         :rtype: bool
         """
         
-        for i in self._word_list:
-            if not i.found:
-                return False
-        return True
+        return len(self._found) == len(self._word_list)
 
     @property
     def width(self) -> int:
@@ -266,12 +1129,12 @@ class Board:
         raise wordsearch.Game.Errors.OperationNotPermittedError
 
     @property
-    def board(self) -> list[list[(Word, int)]]:
+    def board(self) -> list[list[Char]]|CompactGrid:
         """
         board 2D array of board
 
         :return: Board
-        :rtype: list[list[tuple(Word, int)|None]]
+        :rtype: list[list[Char]]|wordsearch.Game.CompactGrid.CompactGrid
         """
 
         return self._board
@@ -286,6 +1149,54 @@ class Board:
         """
         raise wordsearch.Game.Errors.OperationNotPermittedError
 
+    @property
+    def seed(self) -> int|None:
+        """
+        seed Seed the board was generated from
+
+        :return: Seed or None if the board was not generated
+        :rtype: int|None
+        """
+
+        return self._seed
+
+    @property
+    def repair_rounds(self) -> int:
+        """
+        repair_rounds Rounds of repair needed to make the board unique
+
+        :return: Number of rounds
+        :rtype: int
+        """
+
+        return self._repair_rounds
+
+    @property
+    def fill_conflicts(self) -> int:
+        """
+        fill_conflicts Number of filler letters kept even though they
+        spell another copy of a word
+
+        Happens when every redraw of a letter also spells a copy. Always
+        0 for unique boards, which are repaired instead.
+
+        :return: Number of letters
+        :rtype: int
+        """
+
+        return self._fill_conflicts
+
+    @property
+    def shared_cells(self) -> int:
+        """
+        shared_cells Number of cells shared by more than one word
+
+        :return: Number of shared cells
+        :rtype: int
+        """
+
+        return self._shared_cells
+
     @property
     def word_list(self) -> list[Word]:
         """
@@ -306,4 +1217,46 @@ class Board:
             not permitted
         """
         raise wordsearch.Game.Errors.OperationNotPermittedError
-    
\ No newline at end of file
+    
+    @property
+    def selection(self) -> list[tuple[int, int]]:
+        """
+        selection Coordinates of selected characters in the order they
+        were selected
+
+        :return: Selected coordinates. Must not be modified
+        :rtype: list[tuple[int, int]]
+        """
+
+        return self._selection
+
+    @property
+    def found_words(self) -> list[int]:
+        """
+        found_words Indices in the word list of found words in the order
+        they were found
+
+        :return: Indices of found words. Must not be modified
+        :rtype: list[int]
+        """
+
+        return self._found
+
+    @property
+    def trie(self) -> Trie:
+        """
+        trie Prefix trie over the word list
+
+        Built the first time it is needed after a board is generated or
+        loaded. Each word ends on a node holding its index in the word
+        list.
+
+        :return: Trie of words to find
+        :rtype: wordsearch.Game.Trie.Trie
+        """
+
+        if self._trie is None:
+            self._trie = Trie()
+            for i, word in enumerate(self._word_list):
+                self._trie.insert(word.word, i)
+        return self._trie
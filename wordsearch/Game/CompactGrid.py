@@ -0,0 +1,464 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from array import array, typecodes
+from itertools import chain
+from typing import Any, Iterator
+
+import wordsearch.Game.Errors
+
+# 'u' is deprecated from python 3.13 in favour of 'w'
+_TYPECODE = "w" if "w" in typecodes else "u"
+_EMPTY = "\0"
+
+
+class CompactGrid:
+    def __init__(self, width: int, height: int) -> None:
+        """
+        __init__ Create instance of CompactGrid
+
+        CompactGrid stores the letters of a board in a single array and
+        the selected and found state of each cell in bitsets, rather
+        than using one Char object per cell. Indexing with grid[y][x]
+        returns lightweight views that behave like Char so code written
+        for a list of lists of Char keeps working. Empty cells read as
+        None.
+
+        :param width: Width of grid
+        :type width: int
+        :param height: Height of grid
+        :type height: int
+        """
+
+        self._width = width
+        self._height = height
+        self._letters = array(_TYPECODE, _EMPTY*(width*height))
+        self._selected = bytearray((width*height + 7) // 8)
+        self._found = bytearray((width*height + 7) // 8)
+
+    @classmethod
+    def fromBuffers(
+        cls,
+        width: int,
+        height: int,
+        letters: str,
+        selected: bytes,
+        found: bytes
+    ) -> "CompactGrid":
+        """
+        fromBuffers Create a grid from its raw contents
+
+        The buffers are copied without looking at individual cells.
+
+        :param width: Width of grid
+        :type width: int
+        :param height: Height of grid
+        :type height: int
+        :param letters: Letters in row major order with empty cells as
+            NUL
+        :type letters: str
+        :param selected: Bitset of selected cells
+        :type selected: bytes
+        :param found: Bitset of found cells
+        :type found: bytes
+        :raises ValueError: Buffer sizes do not match grid size
+        :return: Grid
+        :rtype: CompactGrid
+        """
+
+        size = (width*height + 7) // 8
+        if len(letters) != width*height or len(selected) != size or len(found) != size:
+            raise ValueError("Buffer sizes do not match grid size")
+
+        grid = cls.__new__(cls)
+        grid._width = width
+        grid._height = height
+        grid._letters = array(_TYPECODE, letters)
+        grid._selected = bytearray(selected)
+        grid._found = bytearray(found)
+        return grid
+
+    @classmethod
+    def fromBoard(cls, board: list[list[Any]], width: int, height: int) -> "CompactGrid":
+        """
+        fromBoard Create a grid from a list of lists of Char
+
+        :param board: Board to copy. Empty cells are None
+        :type board: list[list[wordsearch.Game.Char.Char|None]]
+        :param width: Width of board
+        :type width: int
+        :param height: Height of board
+        :type height: int
+        :return: Grid
+        :rtype: CompactGrid
+        """
+
+        if isinstance(board, CompactGrid):
+            return board
+
+        grid = cls(width, height)
+        for y, row in enumerate(board):
+            for x, char in enumerate(row):
+                if char is None:
+                    continue
+                index = y*width + x
+                grid._letters[index] = str(char)
+                if char.selected:
+                    grid.setBit(grid._selected, index, True)
+                if char.found:
+                    grid.setBit(grid._found, index, True)
+        return grid
+
+    def buffers(self) -> tuple[str, bytes, bytes]:
+        """
+        buffers Raw contents of the grid
+
+        :return: Letters in row major order with empty cells as NUL, and
+            the bitsets of selected and found cells
+        :rtype: tuple[str, bytes, bytes]
+        """
+
+        return (self._letters.tounicode(), bytes(self._selected), bytes(self._found))
+
+    def __len__(self) -> int:
+        return self._height
+
+    def __getitem__(self, y: int) -> "RowView":
+        if y < 0:
+            y += self._height
+        if not 0 <= y < self._height:
+            raise IndexError("Row index out of range")
+        return RowView(self, y)
+
+    def __iter__(self) -> Iterator["RowView"]:
+        for y in range(self._height):
+            yield RowView(self, y)
+
+    @property
+    def width(self) -> int:
+        """
+        width Width of grid
+
+        :return: Width
+        :rtype: int
+        """
+
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """
+        height Height of grid
+
+        :return: Height
+        :rtype: int
+        """
+
+        return self._height
+
+    def letter(self, index: int) -> str|None:
+        """
+        letter Letter at flat index
+
+        :param index: Index of cell, y*width + x
+        :type index: int
+        :return: Letter or None if cell is empty
+        :rtype: str|None
+        """
+
+        letter = self._letters[index]
+        return None if letter == _EMPTY else letter
+
+    def setLetter(self, index: int, letter: str|None) -> None:
+        """
+        setLetter Set letter at flat index
+
+        :param index: Index of cell, y*width + x
+        :type index: int
+        :param letter: Letter to set or None to empty the cell
+        :type letter: str|None
+        """
+
+        self._letters[index] = _EMPTY if letter is None else letter
+
+    def emptyCount(self) -> int:
+        """
+        emptyCount Number of empty cells
+
+        :return: Number of empty cells
+        :rtype: int
+        """
+
+        return self._letters.count(_EMPTY)
+
+    def fillEmpty(self, letters: list[str]) -> None:
+        """
+        fillEmpty Fill every empty cell
+
+        Fills the empty cells in row major order in a single pass over
+        the letter array. Rows are filled one at a time so nothing the
+        size of the whole board is built other than the new array.
+
+        :param letters: Letters to use. Must have one letter per empty
+            cell
+        :type letters: list[str]
+        :raises ValueError: Wrong number of letters
+        """
+
+        text = self._letters.tounicode()
+        if text.count(_EMPTY) != len(letters):
+            raise ValueError("Number of letters does not match number of empty cells")
+
+        rows = []
+        used = 0
+        for start in range(0, len(text), max(self._width, 1)):
+            parts = text[start:start + self._width].split(_EMPTY)
+            count = len(parts) - 1
+            row = chain.from_iterable(zip(parts, letters[used:used + count]))
+            rows.append("".join(row) + parts[-1])
+            used += count
+        self._letters = array(_TYPECODE, "".join(rows))
+
+    def getBit(self, bits: bytearray, index: int) -> bool:
+        """
+        getBit Read a bit from one of the bitsets
+
+        :param bits: Bitset to read
+        :type bits: bytearray
+        :param index: Index of cell
+        :type index: int
+        :return: Value of bit
+        :rtype: bool
+        """
+
+        return bool(bits[index >> 3] & (1 << (index & 7)))
+
+    def setBit(self, bits: bytearray, index: int, value: bool) -> None:
+        """
+        setBit Write a bit in one of the bitsets
+
+        :param bits: Bitset to write
+        :type bits: bytearray
+        :param index: Index of cell
+        :type index: int
+        :param value: Value of bit
+        :type value: bool
+        """
+
+        if value:
+            bits[index >> 3] |= 1 << (index & 7)
+        else:
+            bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def selectedCells(self) -> list[int]:
+        """
+        selectedCells Indices of selected cells
+
+        :return: Flat indices of selected cells in row major order
+        :rtype: list[int]
+        """
+
+        cells = []
+        for i, byte in enumerate(self._selected):
+            if byte:
+                cells.extend(i*8 + j for j in range(8) if byte >> j & 1)
+        return cells
+
+    def rowString(self, y: int) -> str:
+        """
+        rowString Letters of a row as a string
+
+        :param y: Row index
+        :type y: int
+        :return: Letters of the row with empty cells as NUL
+        :rtype: str
+        """
+
+        return self._letters[y*self._width:(y+1)*self._width].tounicode()
+
+
+class RowView:
+    __slots__ = ("_grid", "_y")
+
+    def __init__(self, grid: CompactGrid, y: int) -> None:
+        """
+        __init__ Create instance of RowView
+
+        View over a single row of a CompactGrid
+
+        :param grid: Grid the row belongs to
+        :type grid: CompactGrid
+        :param y: Row index
+        :type y: int
+        """
+
+        self._grid = grid
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def _index(self, x: int) -> int:
+        if x < 0:
+            x += self._grid.width
+        if not 0 <= x < self._grid.width:
+            raise IndexError("Column index out of range")
+        return self._y*self._grid.width + x
+
+    def __getitem__(self, x: int) -> "CellView|None":
+        index = self._index(x)
+        if self._grid.letter(index) is None:
+            return None
+        return CellView(self._grid, index)
+
+    def __setitem__(self, x: int, value: str|None) -> None:
+        index = self._index(x)
+        if value is None:
+            self._grid.setLetter(index, None)
+            return
+        if len(value) != 1:
+            raise ValueError("Invalid length. Length of char should be 1.")
+        self._grid.setLetter(index, str(value))
+        # Keep state when a Char or another view is assigned
+        self._grid.setBit(self._grid._selected, index, getattr(value, "selected", False))
+        self._grid.setBit(self._grid._found, index, getattr(value, "found", False))
+
+    def __iter__(self) -> Iterator["CellView|None"]:
+        for x in range(self._grid.width):
+            yield self[x]
+
+
+class CellView:
+    __slots__ = ("_grid", "_index")
+
+    def __init__(self, grid: CompactGrid, index: int) -> None:
+        """
+        __init__ Create instance of CellView
+
+        View over a single cell of a CompactGrid. Provides the same
+        interface as Char.
+
+        :param grid: Grid the cell belongs to
+        :type grid: CompactGrid
+        :param index: Flat index of cell
+        :type index: int
+        """
+
+        self._grid = grid
+        self._index = index
+
+    def __str__(self) -> str:
+        return self._grid.letter(self._index) or ""
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __len__(self) -> int:
+        return 1
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, CellView)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __add__(self, other: str) -> str:
+        return str(self) + other
+
+    def __radd__(self, other: str) -> str:
+        return other + str(self)
+
+    def upper(self) -> str:
+        """
+        upper Upper case letter
+
+        :return: Letter in upper case
+        :rtype: str
+        """
+
+        return str(self).upper()
+
+    def lower(self) -> str:
+        """
+        lower Lower case letter
+
+        :return: Letter in lower case
+        :rtype: str
+        """
+
+        return str(self).lower()
+
+    def select(self) -> None:
+        """
+        select Set the char to selected
+        """
+
+        self._grid.setBit(self._grid._selected, self._index, True)
+
+    def deselect(self) -> None:
+        """
+        deselect Set the char to not be selected
+        """
+
+        self._grid.setBit(self._grid._selected, self._index, False)
+
+    def toggleSelect(self) -> bool:
+        """
+        toggleSelect Toggle the select status
+
+        Toggles the selected status and returns the new value
+
+        :return: New value of selected
+        :rtype: bool
+        """
+
+        value = not self.selected
+        self._grid.setBit(self._grid._selected, self._index, value)
+        return value
+
+    @property
+    def selected(self) -> bool:
+        """
+        selected Is the char selected?
+
+        :return: Is the char selected?
+        :rtype: bool
+        """
+
+        return self._grid.getBit(self._grid._selected, self._index)
+
+    @selected.setter
+    def selected(self, value: Any) -> None:
+        """
+        selected Setter for selected
+
+        :raises wordsearch.Game.Errors.OperationNotPermittedError: Settings
+            selected is not permitted
+        """
+        raise wordsearch.Game.Errors.OperationNotPermittedError(
+            "Operation not permitted. You should use the `select`, `deselect` or `toggleSelect` methods instead"
+        )
+
+    @property
+    def found(self) -> bool:
+        """
+        found Has the char been found?
+
+        :return: Is this char marked as found?
+        :rtype: bool
+        """
+
+        return self._grid.getBit(self._grid._found, self._index)
+
+    @found.setter
+    def found(self, value: bool) -> None:
+        """
+        found Setter for found
+
+        :param value: Value to set
+        :type value: bool
+        """
+
+        self._grid.setBit(self._grid._found, self._index, bool(value))
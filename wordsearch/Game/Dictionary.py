@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+
+import wordsearch.Game.Errors
+from wordsearch.Game.Filler import Filler
+
+
+class Dictionary:
+    def __init__(self, words: list[str]) -> None:
+        """
+        __init__ Create instance of Dictionary
+
+        Dictionary holds the words available for generation bucketed by
+        length. The source list is never modified so one dictionary can
+        be used for any number of boards.
+
+        :param words: Words to use
+        :type words: list[str]
+        """
+
+        self._buckets: dict[int, list[str]] = {}
+        self._filler: Filler|None = None
+        self._digest = ""
+        for word in words:
+            if len(word) > 0:
+                self._buckets.setdefault(len(word), []).append(word)
+
+    @classmethod
+    def fromBuckets(cls, buckets: dict[int, list[str]]) -> "Dictionary":
+        """
+        fromBuckets Create a dictionary from words already bucketed by
+        length
+
+        :param buckets: Non empty lists of words keyed by their length.
+            The lists are used directly rather than copied
+        :type buckets: dict[int, list[str]]
+        :return: Dictionary
+        :rtype: Dictionary
+        """
+
+        dictionary = cls([])
+        dictionary._buckets = buckets
+        return dictionary
+
+    def __len__(self) -> int:
+        return sum(len(i) for i in self._buckets.values())
+
+    def lengths(self) -> list[int]:
+        """
+        lengths Word lengths present in dictionary
+
+        :return: Sorted list of lengths
+        :rtype: list[int]
+        """
+
+        return sorted(self._buckets)
+
+    def bucket(self, length: int) -> list[str]:
+        """
+        bucket Words of a given length
+
+        :param length: Length of words
+        :type length: int
+        :return: Words of that length. Must not be modified
+        :rtype: list[str]
+        """
+
+        return self._buckets.get(length, [])
+
+    def digest(self) -> str:
+        """
+        digest Hash of the dictionary contents
+
+        Two dictionaries with the same digest produce the same boards
+        from the same seed. The digest depends on the order of words as
+        that affects which word a draw picks.
+
+        :return: Hex encoded SHA-256 digest
+        :rtype: str
+        """
+
+        if self._digest == "":
+            # hashlib loads OpenSSL so is only imported when needed
+            import hashlib
+
+            digest = hashlib.sha256()
+            for length in self.lengths():
+                digest.update("\n".join(self._buckets[length]).encode("utf-8"))
+                digest.update(b"\0")
+            self._digest = digest.hexdigest()
+        return self._digest
+
+    def filler(self) -> Filler:
+        """
+        filler Filler matching the letter frequencies of the dictionary
+
+        The profile is counted the first time it is needed and then
+        reused. An empty dictionary falls back to english frequencies.
+
+        :return: Filler
+        :rtype: wordsearch.Game.Filler
+        """
+
+        if self._filler is None:
+            if len(self) == 0:
+                self._filler = Filler.english()
+            else:
+                self._filler = Filler.fromWords(
+                    ["".join(self._buckets[i]) for i in self.lengths()]
+                )
+        return self._filler
+
+    def sampler(self, max_length: int) -> "Sampler":
+        """
+        sampler Create a sampler over this dictionary
+
+        :param max_length: Length of longest word that can be drawn.
+            Usually the largest dimension of the board.
+        :type max_length: int
+        :return: Sampler drawing words without replacement
+        :rtype: Sampler
+        """
+
+        return Sampler(self, max_length)
+
+
+class Sampler:
+    def __init__(self, dictionary: Dictionary, max_length: int) -> None:
+        """
+        __init__ Create instance of Sampler
+
+        Sampler draws words from a dictionary without replacement. Each
+        length bucket is treated as a lazily built permutation: drawn
+        positions are swapped with the last remaining one and the swaps
+        are recorded in a dict, so no copy of the bucket is made and
+        each draw is O(1).
+
+        :param dictionary: Dictionary to draw from
+        :type dictionary: Dictionary
+        :param max_length: Length of longest word that can be drawn
+        :type max_length: int
+        """
+
+        self._dictionary = dictionary
+        self._lengths = [i for i in dictionary.lengths() if i <= max_length]
+        self._remaining: dict[int, int] = {
+            i: len(dictionary.bucket(i)) for i in self._lengths
+        }
+        self._swaps: dict[int, dict[int, int]] = {i: {} for i in self._lengths}
+        # Position in its bucket of every word drawn so far
+        self._drawn: dict[str, int] = {}
+
+    def longest(self) -> int:
+        """
+        longest Length of the longest word that can be drawn
+
+        :return: Length of word or 0 if there are none
+        :rtype: int
+        """
+
+        return max(self._lengths, default=0)
+
+    def remaining(self, max_length: int) -> int:
+        """
+        remaining Number of words left that are not too long
+
+        :param max_length: Maximum length of word
+        :type max_length: int
+        :return: Number of words
+        :rtype: int
+        """
+
+        return sum(self._remaining[i] for i in self._lengths if i <= max_length)
+
+    def pick(self, max_length: int, rng: random.Random = random, min_length: int = 1) -> str:
+        """
+        pick Draw a random word
+
+        Draws a word uniformly from the remaining words with a length
+        between min_length and max_length.
+
+        :param max_length: Maximum length of word
+        :type max_length: int
+        :param rng: Random number generator, defaults to random
+        :type rng: random.Random, optional
+        :param min_length: Minimum length of word, defaults to 1
+        :type min_length: int, optional
+        :raises wordsearch.Game.Errors.OutOfWordsError: No words left
+            that fit
+        :return: Chosen word
+        :rtype: str
+        """
+
+        lengths = [i for i in self._lengths if min_length <= i <= max_length]
+        total = sum(self._remaining[i] for i in lengths)
+        if total < 1:
+            raise wordsearch.Game.Errors.OutOfWordsError
+
+        index = rng.randrange(total)
+        for length in lengths:
+            count = self._remaining[length]
+            if index < count:
+                break
+            index -= count
+
+        swaps = self._swaps[length]
+        last = count - 1
+        position = swaps.get(index, index)
+        swaps[index] = swaps.pop(last, last)
+        self._remaining[length] = last
+        word = self._dictionary.bucket(length)[position]
+        self._drawn[word] = position
+        return word
+
+    def putBack(self, word: str) -> None:
+        """
+        putBack Return a drawn word so it can be drawn again
+
+        :param word: Word returned by pick that was not used
+        :type word: str
+        """
+
+        position = self._drawn.pop(word)
+        length = len(word)
+        count = self._remaining[length]
+        swaps = self._swaps[length]
+        if position == count:
+            swaps.pop(count, None)
+        else:
+            swaps[count] = position
+        self._remaining[length] = count + 1
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from wordsearch.Game.Dictionary import Dictionary
+
+# Word lists are cached after they are normalised. A cache file is laid
+# out as
+#
+#   header       magic, version, size and modification time of the word
+#                list, number of buckets, byte length of path
+#   path         absolute path of the word list, UTF-8
+#   offsets      per bucket: word length, index one past its last word
+#   blob         every word, grouped by length, UTF-8, separated by new
+#                lines
+#
+# All integers are little endian. A cache whose path, size or
+# modification time does not match the word list is rebuilt.
+
+MAGIC = b"WSDC"
+"""First bytes of every dictionary cache"""
+
+VERSION = 1
+"""Version of the cache format written by this module"""
+
+SUFFIX = ".dict"
+"""Extension of cache files"""
+
+_HEADER = struct.Struct("<4sHQqIH")
+
+# White space removed from inside lines
+_SPACES = str.maketrans("", "", " \t\r\f\v\u00a0")
+
+
+def normalise(text: str) -> list[str]:
+    """
+    normalise Extract the words from a word list
+
+    Words are one per line with any white space inside a line removed.
+    Text is converted to NFC and lower case so the same word is always
+    spelt the same way. Lines containing anything other than letters are
+    skipped, as are repeated words. The whole text is processed at once
+    rather than line by line.
+
+    :param text: Contents of word list
+    :type text: str
+    :return: Words in the order they first appear
+    :rtype: list[str]
+    """
+
+    # unicodedata is only needed when a word list is not cached
+    import unicodedata
+
+    text = unicodedata.normalize("NFC", text).lower().translate(_SPACES)
+    return list(dict.fromkeys(i for i in text.split("\n") if i.isalpha()))
+
+
+def cachePath(path: str, directory: str) -> str:
+    """
+    cachePath Path of the cache of a word list
+
+    :param path: Absolute path to word list
+    :type path: str
+    :param directory: Directory holding caches
+    :type directory: str
+    :return: Path to cache
+    :rtype: str
+    """
+
+    return os.path.join(directory, f"{zlib.crc32(path.encode('utf-8')):08x}{SUFFIX}")
+
+
+def dumps(path: str, size: int, mtime: int, dictionary: Dictionary) -> bytes:
+    """
+    dumps Encode the cache of a word list
+
+    :param path: Absolute path to word list
+    :type path: str
+    :param size: Size of word list in bytes
+    :type size: int
+    :param mtime: Modification time of word list in nanoseconds
+    :type mtime: int
+    :param dictionary: Words of word list
+    :type dictionary: wordsearch.Game.Dictionary
+    :return: Encoded cache
+    :rtype: bytes
+    """
+
+    offsets = array("I")
+    words: list[str] = []
+    for length in dictionary.lengths():
+        words.extend(dictionary.bucket(length))
+        offsets.extend((length, len(words)))
+    if sys.byteorder == "big":
+        offsets.byteswap()
+
+    raw = path.encode("utf-8")
+    return b"".join([
+        _HEADER.pack(MAGIC, VERSION, size, mtime, len(offsets) // 2, len(raw)),
+        raw,
+        offsets.tobytes(),
+        "\n".join(words).encode("utf-8")
+    ])
+
+
+def loads(data: bytes, path: str, size: int, mtime: int) -> Dictionary|None:
+    """
+    loads Decode the cache of a word list
+
+    :param data: Encoded cache
+    :type data: bytes
+    :param path: Absolute path to word list
+    :type path: str
+    :param size: Size of word list in bytes
+    :type size: int
+    :param mtime: Modification time of word list in nanoseconds
+    :type mtime: int
+    :return: Words of word list or None if the cache is for another
+        version of the file or is invalid
+    :rtype: wordsearch.Game.Dictionary|None
+    """
+
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, cache_size, cache_mtime, count, length = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or (cache_size, cache_mtime) != (size, mtime):
+        return None
+    start = _HEADER.size
+    if data[start:start + length] != path.encode("utf-8"):
+        return None
+
+    start += length
+    end = start + count*8
+    if len(data) < end:
+        return None
+    offsets = array("I", data[start:end])
+    if sys.byteorder == "big":
+        offsets.byteswap()
+
+    words = data[end:].decode("utf-8").split("\n") if count > 0 else []
+    if count > 0 and offsets[-1] != len(words):
+        return None
+    buckets: dict[int, list[str]] = {}
+    first = 0
+    for i in range(0, len(offsets), 2):
+        buckets[offsets[i]] = words[first:offsets[i + 1]]
+        first = offsets[i + 1]
+    return Dictionary.fromBuckets(buckets)
+
+
+def load(path: str, directory: str) -> Dictionary:
+    """
+    load Load a word list, using its cache if it is up to date
+
+    The word list is only read and normalised if it has changed since
+    it was cached. Failing to write the cache is not an error.
+
+    :param path: Path to word list
+    :type path: str
+    :param directory: Directory holding caches
+    :type directory: str
+    :raises OSError: Failed to read word list
+    :return: Words of word list
+    :rtype: wordsearch.Game.Dictionary
+    """
+
+    path = os.path.abspath(path)
+    cache = cachePath(path, directory)
+    stat = os.stat(path)
+    try:
+        with open(cache, "rb") as f:
+            dictionary = loads(f.read(), path, stat.st_size, stat.st_mtime_ns)
+    except (OSError, UnicodeDecodeError):
+        dictionary = None
+    if dictionary is not None:
+        return dictionary
+
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    dictionary = Dictionary(normalise(data.decode("utf-8-sig", errors="replace")))
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        temp = f"{cache}.tmp"
+        with open(temp, "wb") as f:
+            f.write(dumps(path, stat.st_size, stat.st_mtime_ns, dictionary))
+        os.replace(temp, cache)
+    except OSError:
+        pass
+    return dictionary
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+
+class PuzzleFileError(Exception):
+    def __init__(
+        self,
+        message: str = "Puzzle file is invalid"
+    ) -> None:
+        """
+        __init__ The puzzle file is not valid
+
+        :param message: Message to output, defaults to "Puzzle file is
+            invalid"
+        :type message: str, optional
+        """
+        
+        super().__init__(message)
@@ -5,3 +5,4 @@ from wordsearch.Game.Errors.OutOfWordsError import OutOfWordsError
 from wordsearch.Game.Errors.PuzzleSizeError import PuzzleSizeError
 from wordsearch.Game.Errors.RetriesExceededError import RetriesExceededError
 from wordsearch.Game.Errors.OperationNotPermittedError import OperationNotPermittedError
+from wordsearch.Game.Errors.PuzzleFileError import PuzzleFileError
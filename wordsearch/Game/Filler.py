@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from collections import Counter
+import random
+
+from wordsearch.constants import ALPHABET, LETTER_FREQUENCIES
+
+
+class Filler:
+    def __init__(self, frequencies: dict[str, float]) -> None:
+        """
+        __init__ Create instance of Filler
+
+        Filler draws the letters used to fill the empty cells of a
+        board. Letters are drawn according to their relative frequency
+        using an alias table (Vose's method) so each draw costs a single
+        random number regardless of the size of the alphabet.
+
+        :param frequencies: Relative frequency of each letter. Values
+            do not need to sum to 1. The order of letters does not
+            affect the letters drawn.
+        :type frequencies: dict[str, float]
+        :raises ValueError: No letters with a positive frequency
+        """
+
+        # Sorted so the same profile always builds the same table
+        letters = sorted(i for i in frequencies if frequencies[i] > 0)
+        if len(letters) == 0:
+            raise ValueError("Frequency profile has no letters")
+        total = sum(frequencies[i] for i in letters)
+        count = len(letters)
+
+        # Scale so the average column is exactly full
+        scaled = [frequencies[i]*count/total for i in letters]
+        small = [i for i in range(count) if scaled[i] < 1]
+        large = [i for i in range(count) if scaled[i] >= 1]
+        prob = [1.0]*count
+        alias = list(range(count))
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        self._letters = letters
+        self._prob = prob
+        self._alias = [letters[i] for i in alias]
+
+    @classmethod
+    def english(cls) -> "Filler":
+        """
+        english Filler using english letter frequencies
+
+        :return: Filler
+        :rtype: Filler
+        """
+
+        return cls({i: LETTER_FREQUENCIES.get(i, 0) for i in ALPHABET})
+
+    @classmethod
+    def fromWords(cls, words: list[str]) -> "Filler":
+        """
+        fromWords Filler matching the letters of a word list
+
+        Derives the frequency profile from the words themselves so the
+        filler looks like the words hidden amongst it.
+
+        :param words: Words to count letters of
+        :type words: list[str]
+        :return: Filler
+        :rtype: Filler
+        """
+
+        return cls(Counter("".join(words)))
+
+    def sample(self, count: int, rng: random.Random = random) -> list[str]:
+        """
+        sample Draw a batch of letters
+
+        :param count: Number of letters to draw
+        :type count: int
+        :param rng: Random number generator, defaults to random
+        :type rng: random.Random, optional
+        :return: List of letters
+        :rtype: list[str]
+        """
+
+        letters = self._letters
+        prob = self._prob
+        alias = self._alias
+        size = len(letters)
+        rand = rng.random
+
+        result = []
+        append = result.append
+        for i in range(count):
+            u = rand()*size
+            column = int(u)
+            append(letters[column] if u - column < prob[column] else alias[column])
+        return result
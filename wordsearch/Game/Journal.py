@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import struct
+from collections import namedtuple
+
+# A journal is kept next to a puzzle file and records progress made
+# since the puzzle file was written. It is laid out as
+#
+#   header       magic, version, size and CRC-32 of the puzzle file
+#   records      per record: action, time, two arguments
+#
+# All integers are little endian. A journal whose header does not match
+# the puzzle file is ignored, as is a partly written last record.
+
+MAGIC = b"WSJN"
+"""First bytes of every journal"""
+
+VERSION = 1
+"""Version of the journal format written by this module"""
+
+SUFFIX = ".journal"
+"""Added to the path of a puzzle file to get the path of its journal"""
+
+SELECT = 1
+"""Record of a character being selected at (x, y)"""
+
+UNDO = 2
+"""Record of the last selected character being deselected"""
+
+CLEAR = 3
+"""Record of the selection being cleared"""
+
+CONFIRM = 4
+"""Record of the selected characters being marked as found"""
+
+FOUND = 5
+"""Record of the word at index x being found"""
+
+Record = namedtuple("Record", ["action", "time", "x", "y"])
+"""A change to a board at a time in seconds since the epoch"""
+
+_HEADER = struct.Struct("<4sHQI")
+_RECORD = struct.Struct("<BdII")
+
+
+def journalPath(path: str) -> str:
+    """
+    journalPath Path of the journal of a puzzle file
+
+    :param path: Path to puzzle file
+    :type path: str
+    :return: Path to journal
+    :rtype: str
+    """
+
+    return f"{path}{SUFFIX}"
+
+
+def header(size: int, checksum: int) -> bytes:
+    """
+    header Contents of an empty journal
+
+    :param size: Size of puzzle file in bytes
+    :type size: int
+    :param checksum: CRC-32 of puzzle file
+    :type checksum: int
+    :return: Journal header
+    :rtype: bytes
+    """
+
+    return _HEADER.pack(MAGIC, VERSION, size, checksum)
+
+
+def append(path: str, records: list[Record], size: int, checksum: int) -> None:
+    """
+    append Add records to the end of a journal
+
+    Each record is the same size so the cost only depends on the number
+    of records. The journal is started on the first append, and started
+    again if it belongs to another version of the puzzle file. The
+    records are on disk when this returns.
+
+    :param path: Path to journal
+    :type path: str
+    :param records: Records to add
+    :type records: list[Record]
+    :param size: Size of puzzle file in bytes
+    :type size: int
+    :param checksum: CRC-32 of puzzle file
+    :type checksum: int
+    """
+
+    data = b"".join(_RECORD.pack(*i) for i in records)
+    start = header(size, checksum)
+    try:
+        with open(path, "rb") as f:
+            current = f.read(len(start))
+    except FileNotFoundError:
+        current = b""
+
+    with open(path, "ab" if current == start else "wb") as f:
+        if current != start:
+            f.write(start)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read(path: str, size: int, checksum: int) -> list[Record]|None:
+    """
+    read Read the records of a journal
+
+    :param path: Path to journal
+    :type path: str
+    :param size: Size of puzzle file in bytes
+    :type size: int
+    :param checksum: CRC-32 of puzzle file
+    :type checksum: int
+    :return: Records in the order they were written or None if there is
+        no journal for this puzzle file
+    :rtype: list[Record]|None
+    """
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, journal_size, journal_checksum = _HEADER.unpack_from(data)
+    if magic != MAGIC or version > VERSION:
+        return None
+    if (journal_size, journal_checksum) != (size, checksum):
+        return None
+
+    # A crash while appending can leave part of a record at the end. It
+    # is removed so later records line up.
+    end = len(data) - (len(data) - _HEADER.size) % _RECORD.size
+    if end != len(data):
+        with open(path, "r+b") as f:
+            f.truncate(end)
+    return [Record._make(i) for i in _RECORD.iter_unpack(data[_HEADER.size:end])]
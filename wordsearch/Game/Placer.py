@@ -0,0 +1,514 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import random
+from bisect import bisect_right, insort
+from operator import mul
+
+from wordsearch.constants import CROSSING_SAMPLES, DIRECTIONS
+from wordsearch.Game.CompactGrid import CompactGrid
+
+
+class _IndexedSet:
+    def __init__(self) -> None:
+        """
+        __init__ Create instance of _IndexedSet
+
+        Set of integers supporting O(1) insertion, removal and random
+        choice. Items are kept in a list with a reverse index so that a
+        removal can swap the last item into the freed slot.
+        """
+
+        self._items: list[int] = []
+        self._index: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: int) -> None:
+        """
+        add Add item to set
+
+        :param item: Item to add
+        :type item: int
+        """
+
+        if item in self._index:
+            return
+        self._index[item] = len(self._items)
+        self._items.append(item)
+
+    def remove(self, item: int) -> None:
+        """
+        remove Remove item from set
+
+        :param item: Item to remove
+        :type item: int
+        """
+
+        pos = self._index.pop(item)
+        last = self._items.pop()
+        if pos < len(self._items):
+            self._items[pos] = last
+            self._index[last] = pos
+
+    def get(self, pos: int) -> int:
+        """
+        get Get item at position
+
+        :param pos: Position in the internal list
+        :type pos: int
+        :return: Item
+        :rtype: int
+        """
+
+        return self._items[pos]
+
+
+class Placer:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        directions: list[tuple[int, int]] = DIRECTIONS
+    ) -> None:
+        """
+        __init__ Create instance of Placer
+
+        Placer keeps track of which cells of the board are free and
+        picks positions for words. For every direction it stores the
+        free runs, the stretches of empty cells along each line of the
+        board in that direction. A word fits at any of the first
+        run - length + 1 cells of a run at least as long as it. Runs are
+        bucketed by length so that every valid spot for a word can be
+        chosen from directly. An empty board has one run per line, so
+        nothing is stored per cell other than its letter.
+
+        :param width: Width of board
+        :type width: int
+        :param height: Height of board
+        :type height: int
+        :param directions: Directions words may run in as (dx, dy)
+            steps, defaults to DIRECTIONS
+        :type directions: list[tuple[int, int]], optional
+        """
+
+        self._width = width
+        self._height = height
+        self._directions = list(directions)
+        self._longest = max(width, height)
+        self._grid = CompactGrid(width, height)
+        self._letters: dict[str, _IndexedSet] = {}
+        # Per direction: the length of each run keyed by its first cell,
+        # the sorted positions along each line at which its runs start
+        # keyed by the first cell of the line, the first cells of runs
+        # bucketed by length and the number of runs of each length
+        self._runs: list[dict[int, int]] = []
+        self._starts: list[dict[int, list[int]]] = []
+        self._buckets: list[list[_IndexedSet]] = []
+        self._counts: list[list[int]] = []
+
+        for d, (dx, dy) in enumerate(self._directions):
+            self._runs.append({})
+            self._starts.append({})
+            self._buckets.append([_IndexedSet() for i in range(self._longest+1)])
+            self._counts.append([0]*(self._longest+1))
+            for line in self._lineStarts(dx, dy):
+                self._starts[d][line] = [0]
+                self._addRun(d, line, self._edgeDistance(line % width, line // width, dx, dy))
+
+    def _lineStarts(self, dx: int, dy: int) -> list[int]:
+        """
+        _lineStarts First cells of the lines running in a direction
+
+        :param dx: X step
+        :type dx: int
+        :param dy: Y step
+        :type dy: int
+        :return: Sorted indices of cells whose previous cell in the
+            direction is off the board
+        :rtype: list[int]
+        """
+
+        width = self._width
+        height = self._height
+        cells = set()
+        if dx > 0:
+            cells.update(range(0, width*height, width))
+        elif dx < 0:
+            cells.update(range(width - 1, width*height, width))
+        if dy > 0:
+            cells.update(range(width))
+        elif dy < 0:
+            cells.update(range((height - 1)*width, width*height))
+        return sorted(cells)
+
+    def _edgeDistance(self, x: int, y: int, dx: int, dy: int) -> int:
+        """
+        _edgeDistance Number of cells before the edge of the board
+
+        :param x: X coordinate
+        :type x: int
+        :param y: Y coordinate
+        :type y: int
+        :param dx: X step
+        :type dx: int
+        :param dy: Y step
+        :type dy: int
+        :return: Number of cells from (x, y) to the edge inclusive
+        :rtype: int
+        """
+
+        distance = self._longest
+        if dx > 0:
+            distance = min(distance, self._width - x)
+        elif dx < 0:
+            distance = min(distance, x + 1)
+        if dy > 0:
+            distance = min(distance, self._height - y)
+        elif dy < 0:
+            distance = min(distance, y + 1)
+        return distance
+
+    def _locate(self, index: int, d: int) -> tuple[int, int]:
+        """
+        _locate Find the line through a cell in a direction
+
+        :param index: Index of cell
+        :type index: int
+        :param d: Index of direction
+        :type d: int
+        :return: Tuple of (first cell of line, position of cell along
+            line)
+        :rtype: tuple[int, int]
+        """
+
+        dx, dy = self._directions[d]
+        x = index % self._width
+        y = index // self._width
+        position = self._longest
+        if dx > 0:
+            position = min(position, x)
+        elif dx < 0:
+            position = min(position, self._width - 1 - x)
+        if dy > 0:
+            position = min(position, y)
+        elif dy < 0:
+            position = min(position, self._height - 1 - y)
+        return (index - position*(dy*self._width + dx), position)
+
+    def _addRun(self, d: int, first: int, length: int) -> None:
+        """
+        _addRun Add a free run to the index
+
+        :param d: Index of direction
+        :type d: int
+        :param first: Index of first cell of run
+        :type first: int
+        :param length: Length of run
+        :type length: int
+        """
+
+        self._runs[d][first] = length
+        self._buckets[d][length].add(first)
+        self._counts[d][length] += 1
+
+    def _removeRun(self, d: int, first: int) -> int:
+        """
+        _removeRun Remove a free run from the index
+
+        :param d: Index of direction
+        :type d: int
+        :param first: Index of first cell of run
+        :type first: int
+        :return: Length of run
+        :rtype: int
+        """
+
+        length = self._runs[d].pop(first)
+        self._buckets[d][length].remove(first)
+        self._counts[d][length] -= 1
+        return length
+
+    def cells(self) -> list[str]:
+        """
+        cells Letters placed so far
+
+        :return: Copy of the letters in row major order, NUL where a
+            cell is empty
+        :rtype: list[str]
+        """
+
+        return list(self._grid.buffers()[0])
+
+    def runs(self, d: int) -> dict[int, int]:
+        """
+        runs Free runs in a direction
+
+        :param d: Index of direction in directions
+        :type d: int
+        :return: Length of each run keyed by the index of its first
+            cell. Must not be modified
+        :rtype: dict[int, int]
+        """
+
+        return self._runs[d]
+
+    def longest(self) -> int:
+        """
+        longest Length of the longest free run
+
+        :return: Length of the longest word that can still be placed
+        :rtype: int
+        """
+
+        longest = 0
+        for counts in self._counts:
+            for run in range(self._longest, longest, -1):
+                if counts[run] > 0:
+                    longest = run
+                    break
+        return longest
+
+    def choose(self, length: int, rng: random.Random = random) -> tuple[int, int, tuple[int, int]]|None:
+        """
+        choose Choose a position for a word
+
+        Chooses uniformly from every position and direction where a word
+        of the given length fits without touching another letter.
+
+        :param length: Length of word
+        :type length: int
+        :param rng: Random number generator, defaults to random
+        :type rng: random.Random, optional
+        :return: Tuple of (x, y, direction) or None if word does not
+            fit anywhere
+        :rtype: tuple[int, int, tuple[int, int]]|None
+        """
+
+        if length < 1 or length > self._longest:
+            return None
+
+        # A run of length run has run - length + 1 spots
+        totals = [
+            sum(map(mul, counts[length:], range(1, self._longest - length + 2)))
+            for counts in self._counts
+        ]
+        if sum(totals) == 0:
+            return None
+
+        pick = rng.randrange(sum(totals))
+        for d, counts in enumerate(self._counts):
+            if pick >= totals[d]:
+                pick -= totals[d]
+                continue
+            for run in range(length, self._longest+1):
+                spots = run - length + 1
+                size = counts[run]*spots
+                if pick < size:
+                    dx, dy = self._directions[d]
+                    cell = self._buckets[d][run].get(pick // spots) + (pick % spots)*(dy*self._width + dx)
+                    return (cell % self._width, cell // self._width, (dx, dy))
+                pick -= size
+
+    def fill(self, x: int, y: int, letter: str) -> None:
+        """
+        fill Mark a cell as filled
+
+        Sets the letter of a cell and splits the free run holding it in
+        each direction.
+
+        :param x: X coordinate
+        :type x: int
+        :param y: Y coordinate
+        :type y: int
+        :param letter: Letter placed in the cell
+        :type letter: str
+        """
+
+        index = y*self._width + x
+        previous = self._grid.letter(index)
+        if previous is not None:
+            self._letters[previous].remove(index)
+        self._grid.setLetter(index, letter)
+        self._letters.setdefault(letter, _IndexedSet()).add(index)
+        if previous is not None:
+            # Free runs only change when an empty cell is filled
+            return
+
+        for d, (dx, dy) in enumerate(self._directions):
+            step = dy*self._width + dx
+            line, position = self._locate(index, d)
+            starts = self._starts[d][line]
+            i = bisect_right(starts, position) - 1
+            start = starts[i]
+            length = self._removeRun(d, line + start*step)
+
+            if position > start:
+                self._addRun(d, line + start*step, position - start)
+            else:
+                del starts[i]
+            if start + length > position + 1:
+                insort(starts, position + 1)
+                self._addRun(d, index + step, start + length - position - 1)
+
+    def clear(self, x: int, y: int) -> None:
+        """
+        clear Mark a cell as empty
+
+        Removes the letter from a cell and joins it with the free runs
+        either side of it in each direction.
+
+        :param x: X coordinate
+        :type x: int
+        :param y: Y coordinate
+        :type y: int
+        """
+
+        index = y*self._width + x
+        previous = self._grid.letter(index)
+        if previous is None:
+            return
+        self._letters[previous].remove(index)
+        self._grid.setLetter(index, None)
+
+        for d, (dx, dy) in enumerate(self._directions):
+            step = dy*self._width + dx
+            line, position = self._locate(index, d)
+            starts = self._starts[d][line]
+            runs = self._runs[d]
+            i = bisect_right(starts, position)
+            start = position
+            length = 1
+
+            # Run ending just before the cell
+            if i > 0 and starts[i-1] + runs[line + starts[i-1]*step] == position:
+                i -= 1
+                start = starts.pop(i)
+                length += self._removeRun(d, line + start*step)
+            # Run starting just after the cell
+            if i < len(starts) and starts[i] == position + 1:
+                del starts[i]
+                length += self._removeRun(d, index + step)
+
+            starts.insert(i, start)
+            self._addRun(d, line + start*step, length)
+
+    def chooseCrossing(self, word: str, rng: random.Random = random) -> tuple[int, int, tuple[int, int]]|None:
+        """
+        chooseCrossing Choose a position where a word crosses others
+
+        Candidate positions are found by looking up where each letter of
+        the word already appears on the board. At most CROSSING_SAMPLES
+        of the cells holding each letter are tried, chosen at random, so
+        the cost does not grow with the number of filled cells. A
+        candidate is valid if every cell it covers is either empty or
+        holds the same letter. Of the valid candidates, one sharing the
+        most cells is chosen. Candidates that would lie entirely on
+        existing letters are rejected as the word would already be on
+        the board.
+
+        :param word: Word to place
+        :type word: str
+        :param rng: Random number generator, defaults to random
+        :type rng: random.Random, optional
+        :return: Tuple of (x, y, direction) or None if the word can not
+            cross any of the cells tried
+        :rtype: tuple[int, int, tuple[int, int]]|None
+        """
+
+        length = len(word)
+        checked: set[tuple[int, int]] = set()
+        best: list[tuple[int, int, tuple[int, int]]] = []
+        best_shared = 0
+
+        for i in range(length):
+            cells = self._letters.get(word[i])
+            if cells is None:
+                continue
+            anchors = range(len(cells))
+            if len(cells) > CROSSING_SAMPLES:
+                anchors = rng.sample(anchors, CROSSING_SAMPLES)
+            for anchor in anchors:
+                cell = cells.get(anchor)
+                cx = cell % self._width
+                cy = cell // self._width
+                for d, (dx, dy) in enumerate(self._directions):
+                    x = cx - i*dx
+                    y = cy - i*dy
+                    if (y*self._width + x, d) in checked:
+                        continue
+                    checked.add((y*self._width + x, d))
+
+                    shared = self.shared(word, x, y, (dx, dy))
+                    if shared is None or shared == length:
+                        continue
+                    if shared > best_shared:
+                        best_shared = shared
+                        best = []
+                    if shared == best_shared:
+                        best.append((x, y, (dx, dy)))
+
+        if len(best) == 0:
+            return None
+        return rng.choice(best)
+
+    def shared(self, word: str, x: int, y: int, direction: tuple[int, int]) -> int|None:
+        """
+        shared Number of cells a word would share with the board
+
+        :param word: Word to check
+        :type word: str
+        :param x: X coordinate of first letter
+        :type x: int
+        :param y: Y coordinate of first letter
+        :type y: int
+        :param direction: Direction of word as (dx, dy)
+        :type direction: tuple[int, int]
+        :return: Number of cells already holding the right letter or
+            None if the word does not fit
+        :rtype: int|None
+        """
+
+        dx, dy = direction
+        length = len(word)
+        end_x = x + (length-1)*dx
+        end_y = y + (length-1)*dy
+        if not (0 <= x < self._width and 0 <= end_x < self._width):
+            return None
+        if not (0 <= y < self._height and 0 <= end_y < self._height):
+            return None
+
+        shared = 0
+        for i in range(length):
+            cell = self._grid.letter((y + i*dy)*self._width + x + i*dx)
+            if cell is None:
+                continue
+            if cell != word[i]:
+                return None
+            shared += 1
+        return shared
+
+    def place(self, word: str, x: int, y: int, direction: tuple[int, int]) -> int:
+        """
+        place Mark the cells of a word as filled
+
+        :param word: Word being placed
+        :type word: str
+        :param x: X coordinate of first letter
+        :type x: int
+        :param y: Y coordinate of first letter
+        :type y: int
+        :param direction: Direction of word as (dx, dy)
+        :type direction: tuple[int, int]
+        :return: Number of cells shared with words already placed
+        :rtype: int
+        """
+
+        dx, dy = direction
+        shared = 0
+        for i in range(len(word)):
+            if self._grid.letter((y + i*dy)*self._width + x + i*dx) is not None:
+                shared += 1
+            self.fill(x + i*dx, y + i*dy, word[i])
+        return shared
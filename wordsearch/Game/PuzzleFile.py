@@ -0,0 +1,293 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import mmap
+import os
+import struct
+import zlib
+
+from wordsearch.Game.CompactGrid import CompactGrid
+from wordsearch.Game.Errors import PuzzleFileError
+from wordsearch.Game.Word import Word
+
+# A puzzle file is laid out as
+#
+#   header       magic, version, flags, width, height, word count
+#   letters      one byte per cell, or four with FLAG_WIDE, row major
+#   selected     bitset, one bit per cell
+#   found        bitset, one bit per cell
+#   words        per word: x, y, dx, dy, found, byte length, UTF-8 text
+#   selection    count, then the index of each selected cell in the
+#                order it was selected. Added in version 2
+#
+# All integers are little endian. Empty cells are stored as NUL and
+# unplaced words have a position of (-1, -1) and a direction of (0, 0).
+# Files of version 1 have no selection order so selected cells are
+# taken in row major order.
+
+MAGIC = b"WSPZ"
+"""First bytes of every puzzle file"""
+
+VERSION = 2
+"""Version of the puzzle format written by this module"""
+
+FLAG_WIDE = 0x1
+"""Letters are stored as UTF-32 rather than Latin-1"""
+
+_HEADER = struct.Struct("<4sHHIII")
+_WORD = struct.Struct("<iibbBH")
+_COUNT = struct.Struct("<I")
+
+
+def dumps(grid: CompactGrid, words: list[Word], selection: list[int]|None = None) -> bytes:
+    """
+    dumps Encode a puzzle
+
+    :param grid: Letters and state of the board
+    :type grid: wordsearch.Game.CompactGrid.CompactGrid
+    :param words: Words to find
+    :type words: list[wordsearch.Game.Word.Word]
+    :param selection: Flat indices of the selected cells in the order
+        they were selected, defaults to row major order
+    :type selection: list[int]|None, optional
+    :return: Encoded puzzle
+    :rtype: bytes
+    """
+
+    letters, selected, found = grid.buffers()
+    flags = 0
+    try:
+        raw = letters.encode("latin-1")
+    except UnicodeEncodeError:
+        raw = letters.encode("utf-32-le")
+        flags |= FLAG_WIDE
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, flags, grid.width, grid.height, len(words)),
+        raw,
+        selected,
+        found
+    ]
+    for word in words:
+        text = word.word.encode("utf-8")
+        if word.position is None:
+            x, y, (dx, dy) = -1, -1, (0, 0)
+        else:
+            x, y, (dx, dy) = word.position
+        parts.append(_WORD.pack(x, y, dx, dy, word.found, len(text)))
+        parts.append(text)
+
+    if selection is None:
+        selection = grid.selectedCells()
+    parts.append(_COUNT.pack(len(selection)))
+    parts.append(struct.pack(f"<{len(selection)}I", *selection))
+    return b"".join(parts)
+
+
+def loads(data: bytes|memoryview|mmap.mmap) -> tuple[CompactGrid, list[Word], list[int]]:
+    """
+    loads Decode a puzzle
+
+    The letters and bitsets are copied into the grid as whole buffers so
+    the cost does not depend on the number of cells.
+
+    :param data: Encoded puzzle
+    :type data: bytes|memoryview|mmap.mmap
+    :raises wordsearch.Game.Errors.PuzzleFileError: Data is not a
+        puzzle or is from a newer version
+    :return: Grid, words and selection order of puzzle
+    :rtype: tuple[wordsearch.Game.CompactGrid.CompactGrid, list[wordsearch.Game.Word.Word], list[int]]
+    """
+
+    view = memoryview(data)
+    try:
+        return _decode(view)
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise PuzzleFileError(f"Puzzle file is corrupt: {e}")
+    finally:
+        view.release()
+
+
+def _decode(view: memoryview) -> tuple[CompactGrid, list[Word], list[int]]:
+    """
+    _decode Decode a puzzle without handling errors
+
+    :param view: Encoded puzzle
+    :type view: memoryview
+    :return: Grid, words and selection order of puzzle
+    :rtype: tuple[wordsearch.Game.CompactGrid.CompactGrid, list[wordsearch.Game.Word.Word], list[int]]
+    """
+
+    magic, version, flags, width, height, count = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise PuzzleFileError("Not a puzzle file")
+    if version > VERSION:
+        raise PuzzleFileError(f"Puzzle file version {version} is not supported")
+
+    cells = width*height
+    bits = (cells + 7) // 8
+    wide = flags & FLAG_WIDE
+    start = _HEADER.size
+    end = start + cells*(4 if wide else 1)
+    if len(view) < end + 2*bits:
+        raise PuzzleFileError("Puzzle file is truncated")
+    letters = str(view[start:end], "utf-32-le" if wide else "latin-1")
+    selected = bytes(view[end:end + bits])
+    found = bytes(view[end + bits:end + 2*bits])
+    grid = CompactGrid.fromBuffers(width, height, letters, selected, found)
+
+    offset = end + 2*bits
+    words: list[Word] = []
+    for _ in range(count):
+        x, y, dx, dy, word_found, length = _WORD.unpack_from(view, offset)
+        offset += _WORD.size
+        if offset + length > len(view):
+            raise PuzzleFileError("Puzzle file is truncated")
+        word = Word(str(view[offset:offset + length], "utf-8"))
+        offset += length
+        if x >= 0:
+            word.place(x, y, (dx, dy))
+        word.found = word_found
+        words.append(word)
+
+    if version < 2:
+        return (grid, words, grid.selectedCells())
+    count, = _COUNT.unpack_from(view, offset)
+    offset += _COUNT.size
+    selection = list(struct.unpack_from(f"<{count}I", view, offset))
+    if sorted(selection) != grid.selectedCells():
+        raise PuzzleFileError("Puzzle file selection does not match selected cells")
+    return (grid, words, selection)
+
+
+def isPuzzle(path: str) -> bool:
+    """
+    isPuzzle Check if a file is in this format
+
+    :param path: Path to file
+    :type path: str
+    :return: Does the file start with MAGIC?
+    :rtype: bool
+    """
+
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def checksum(path: str) -> tuple[int, int]:
+    """
+    checksum Size and CRC-32 of a file
+
+    :param path: Path to file
+    :type path: str
+    :return: Size in bytes and CRC-32
+    :rtype: tuple[int, int]
+    """
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return (0, zlib.crc32(b""))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return (size, zlib.crc32(data))
+
+
+def save(path: str, grid: CompactGrid, words: list[Word], selection: list[int]|None = None) -> None:
+    """
+    save Write a puzzle file
+
+    :param path: Path to write to
+    :type path: str
+    :param grid: Letters and state of the board
+    :type grid: wordsearch.Game.CompactGrid.CompactGrid
+    :param words: Words to find
+    :type words: list[wordsearch.Game.Word.Word]
+    :param selection: Flat indices of the selected cells in the order
+        they were selected, defaults to row major order
+    :type selection: list[int]|None, optional
+    """
+
+    with open(path, "wb") as f:
+        f.write(dumps(grid, words, selection))
+
+
+def load(path: str) -> tuple[CompactGrid, list[Word], list[int]]:
+    """
+    load Read a puzzle file
+
+    The file is memory mapped rather than read into memory first.
+
+    :param path: Path to file
+    :type path: str
+    :raises wordsearch.Game.Errors.PuzzleFileError: File is not a
+        puzzle or is from a newer version
+    :return: Grid, words and selection order of puzzle
+    :rtype: tuple[wordsearch.Game.CompactGrid.CompactGrid, list[wordsearch.Game.Word.Word], list[int]]
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise PuzzleFileError("Not a puzzle file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data)
+
+
+def loadLegacy(path: str) -> tuple[CompactGrid, list[Word], list[int]]:
+    """
+    loadLegacy Read a puzzle saved with pickle by older versions
+
+    Unpickling can run arbitrary code so only load files that are
+    trusted.
+
+    :param path: Path to file
+    :type path: str
+    :raises wordsearch.Game.Errors.PuzzleFileError: File is not a
+        pickled puzzle
+    :return: Grid, words and selection order of puzzle
+    :rtype: tuple[wordsearch.Game.CompactGrid.CompactGrid, list[wordsearch.Game.Word.Word], list[int]]
+    """
+
+    # pickle is slow to import and only needed here
+    import pickle
+
+    with open(path, "rb") as f:
+        try:
+            board, old_words, width, height = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, TypeError, ValueError) as e:
+            raise PuzzleFileError(f"Not a puzzle file: {e}")
+
+    # Words pickled by older versions lack attributes added since, so
+    # only their text and found flag are kept
+    words = []
+    for old in old_words:
+        word = Word(old.word)
+        word.found = old.found
+        words.append(word)
+    grid = CompactGrid.fromBoard(board, width, height)
+    # The order cells were selected in was not saved
+    return (grid, words, grid.selectedCells())
+
+
+def convert(path: str, output: str|None = None) -> bool:
+    """
+    convert Convert a pickled puzzle to this format
+
+    :param path: Path to pickled puzzle
+    :type path: str
+    :param output: Path to write to, defaults to replacing the original
+    :type output: str|None, optional
+    :return: False if the file was already in this format
+    :rtype: bool
+    """
+
+    if output is None:
+        output = path
+    if isPuzzle(path):
+        if output != path:
+            save(output, *load(path))
+        return False
+
+    temp = f"{output}.tmp"
+    save(temp, *loadLegacy(path))
+    os.replace(temp, output)
+    return True
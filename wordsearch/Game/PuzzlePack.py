@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterator
+
+from wordsearch.Game.Board import Board
+from wordsearch.Game.Errors import PuzzleFileError
+
+# A puzzle pack is laid out as
+#
+#   header       magic, version
+#   entries      puzzles in the puzzle file format, one after another,
+#                each optionally compressed
+#   index        per entry: offset, length, compression
+#   trailer      offset of index, number of entries, magic
+#
+# All integers are little endian. The trailer has a fixed size so the
+# index can be found from the end of the file without reading entries.
+#
+# Appending writes new entries, then a new index and trailer for every
+# entry, after the old trailer. The old index and trailer are left in
+# place, so if an append is interrupted the pack is read as it was
+# before it.
+
+MAGIC = b"WSPK"
+"""First and last bytes of every puzzle pack"""
+
+VERSION = 1
+"""Version of the pack format written by this module"""
+
+COMPRESSION = {
+    None: 0,
+    "zlib": 1,
+    "lzma": 2
+}
+"""Supported compression of entries and their ids in the index"""
+
+_HEADER = struct.Struct("<4sH")
+_ENTRY = struct.Struct("<QIB")
+_TRAILER = struct.Struct("<QI4s")
+
+
+def _compress(data: bytes, compression: int) -> bytes:
+    """
+    _compress Compress an entry
+
+    :param data: Entry to compress
+    :type data: bytes
+    :param compression: Id of compression to use
+    :type compression: int
+    :return: Compressed entry
+    :rtype: bytes
+    """
+
+    # Compression modules are only imported if a pack uses them
+    if compression == COMPRESSION["zlib"]:
+        import zlib
+        return zlib.compress(data)
+    if compression == COMPRESSION["lzma"]:
+        import lzma
+        return lzma.compress(data)
+    return data
+
+
+def _decompress(data: bytes|memoryview, compression: int) -> bytes|memoryview:
+    """
+    _decompress Decompress an entry
+
+    :param data: Entry to decompress
+    :type data: bytes|memoryview
+    :param compression: Id of compression used
+    :type compression: int
+    :raises wordsearch.Game.Errors.PuzzleFileError: Unknown compression
+    :return: Decompressed entry
+    :rtype: bytes|memoryview
+    """
+
+    if compression == COMPRESSION["zlib"]:
+        import zlib
+        return zlib.decompress(data)
+    if compression == COMPRESSION["lzma"]:
+        import lzma
+        return lzma.decompress(data)
+    if compression != COMPRESSION[None]:
+        raise PuzzleFileError(f"Unknown compression {compression}")
+    return data
+
+
+class PackWriter:
+    def __init__(self, path: str, compression: str|None = None, append: bool = False) -> None:
+        """
+        __init__ Create instance of PackWriter
+
+        PackWriter writes puzzles to a puzzle pack one at a time. Only
+        the index is kept in memory. A new pack is not readable until
+        the writer is closed. When appending, the pack keeps its old
+        puzzles until the writer is closed.
+
+        :param path: Path to pack
+        :type path: str
+        :param compression: Compression of new entries. One of the keys
+            of COMPRESSION, defaults to None
+        :type compression: str|None, optional
+        :param append: Add to an existing pack rather than replacing it,
+            defaults to False
+        :type append: bool, optional
+        :raises ValueError: Unknown compression
+        :raises wordsearch.Game.Errors.PuzzleFileError: Existing pack is
+            invalid
+        """
+
+        if compression not in COMPRESSION:
+            raise ValueError(f"Unknown compression {compression}")
+        self._compression = COMPRESSION[compression]
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._compressions = bytearray()
+
+        if append and os.path.exists(path):
+            with PuzzlePack(path) as pack:
+                for i in range(len(pack)):
+                    offset, length, entry_compression = pack.entry(i)
+                    self._offsets.append(offset)
+                    self._lengths.append(length)
+                    self._compressions.append(entry_compression)
+                end = pack.end
+            self._file = open(path, "r+b")
+            # New entries follow the old trailer so it stays valid until
+            # the new one is written. Anything after it is left over
+            # from an interrupted append.
+            self._file.seek(end)
+            self._file.truncate()
+        else:
+            self._file = open(path, "wb")
+            self._file.write(_HEADER.pack(MAGIC, VERSION))
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add(self, board: Board) -> int:
+        """
+        add Append a puzzle
+
+        :param board: Puzzle to add
+        :type board: wordsearch.Game.Board
+        :return: Number of the puzzle in the pack
+        :rtype: int
+        """
+
+        data = _compress(board.dumps(), self._compression)
+        self._offsets.append(self._file.tell())
+        self._lengths.append(len(data))
+        self._compressions.append(self._compression)
+        self._file.write(data)
+        return len(self._offsets) - 1
+
+    def close(self) -> None:
+        """
+        close Write the index and close the pack
+        """
+
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        for entry in zip(self._offsets, self._lengths, self._compressions):
+            self._file.write(_ENTRY.pack(*entry))
+        # The entries and index must be on disk before the trailer
+        # pointing at them
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.write(_TRAILER.pack(index_offset, len(self._offsets), MAGIC))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+
+class PuzzlePack:
+    def __init__(self, path: str) -> None:
+        """
+        __init__ Create instance of PuzzlePack
+
+        PuzzlePack reads puzzles from a puzzle pack. The file is memory
+        mapped and only the trailer is read when it is opened, so
+        opening a pack and reading any one puzzle does not depend on
+        the number of puzzles in it. If an append to the pack was
+        interrupted, the trailer written before it is used.
+
+        :param path: Path to pack
+        :type path: str
+        :raises wordsearch.Game.Errors.PuzzleFileError: File is not a
+            puzzle pack
+        """
+
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size + _TRAILER.size:
+                raise PuzzleFileError("Not a puzzle pack")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._file.close()
+            raise
+
+        magic, version = _HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            self.close()
+            raise PuzzleFileError("Not a puzzle pack")
+        if version > VERSION:
+            self.close()
+            raise PuzzleFileError(f"Puzzle pack version {version} is not supported")
+
+        end = size
+        while True:
+            index_offset, count, end_magic = _TRAILER.unpack_from(self._data, end - _TRAILER.size)
+            if (
+                end_magic == MAGIC
+                and index_offset >= _HEADER.size
+                and index_offset + count*_ENTRY.size == end - _TRAILER.size
+            ):
+                break
+            # Part of an interrupted append, so look for the trailer
+            # before it
+            found = self._data.rfind(MAGIC, _HEADER.size + _TRAILER.size - len(MAGIC), end - 1)
+            if found < 0:
+                self.close()
+                raise PuzzleFileError("Puzzle pack index is corrupt")
+            end = found + len(MAGIC)
+
+        self._index_offset = index_offset
+        self._count = count
+        self._end = end
+
+    def __enter__(self) -> "PuzzlePack":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Board:
+        """
+        __getitem__ Read one puzzle
+
+        :param index: Number of puzzle
+        :type index: int
+        :raises IndexError: No puzzle with that number
+        :return: Puzzle
+        :rtype: wordsearch.Game.Board
+        """
+
+        offset, length, compression = self.entry(index)
+        board = Board()
+        with memoryview(self._data) as view:
+            board.loads(_decompress(view[offset:offset + length], compression))
+        return board
+
+    def __iter__(self) -> Iterator[Board]:
+        """
+        __iter__ Read every puzzle in order
+
+        Puzzles are read one at a time so memory use does not grow with
+        the size of the pack.
+
+        :return: Iterator over puzzles
+        :rtype: Iterator[wordsearch.Game.Board]
+        """
+
+        for i in range(self._count):
+            yield self[i]
+
+    def entry(self, index: int) -> tuple[int, int, int]:
+        """
+        entry Position of a puzzle in the pack
+
+        :param index: Number of puzzle
+        :type index: int
+        :raises IndexError: No puzzle with that number
+        :return: Offset, length and compression id of entry
+        :rtype: tuple[int, int, int]
+        """
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Puzzle index out of range")
+        return _ENTRY.unpack_from(self._data, self._index_offset + index*_ENTRY.size)
+
+    @property
+    def index_offset(self) -> int:
+        """
+        index_offset Offset of the index, which is also the end of the
+        last entry
+
+        :return: Offset in bytes
+        :rtype: int
+        """
+
+        return self._index_offset
+
+    @property
+    def end(self) -> int:
+        """
+        end Offset just past the trailer in use. Normally the size of
+        the pack
+
+        :return: Offset in bytes
+        :rtype: int
+        """
+
+        return self._end
+
+    def close(self) -> None:
+        """
+        close Close the pack
+        """
+
+        self._data.close()
+        self._file.close()
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import os
+import zlib
+
+from wordsearch.Game import Journal
+
+
+def atomicWrite(path: str, data: bytes) -> None:
+    """
+    atomicWrite Replace a file so it is never left partly written
+
+    The data is written to a temporary file and flushed to disk before
+    it is renamed over the original.
+
+    :param path: Path to write to
+    :type path: str
+    :param data: New contents of file
+    :type data: bytes
+    """
+
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+
+    # Make the rename itself durable where directories can be synced
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveJob:
+    def __init__(
+        self,
+        path: str,
+        records: list[Journal.Record],
+        data: bytes|None = None,
+        file: tuple[int, int, int]|None = None,
+        revision: int = 0
+    ) -> None:
+        """
+        __init__ Create instance of SaveJob
+
+        SaveJob holds a snapshot of everything needed to save a board
+        so it can be written from another thread while the board keeps
+        changing. Either the whole puzzle is written or the records are
+        appended to the journal of a puzzle file already on disk.
+
+        :param path: Path to puzzle file
+        :type path: str
+        :param records: Progress to append to the journal
+        :type records: list[wordsearch.Game.Journal.Record]
+        :param data: Encoded puzzle to write in full, defaults to None
+            to append to the journal
+        :type data: bytes|None, optional
+        :param file: Size, modification time and CRC-32 the puzzle file
+            is expected to have when appending, defaults to None
+        :type file: tuple[int, int, int]|None, optional
+        :param revision: Revision of the board the snapshot was taken
+            from, defaults to 0
+        :type revision: int, optional
+        """
+
+        self.path = path
+        self.records = records
+        self.data = data
+        self.file = file
+        self.revision = revision
+        self.stale = False
+
+    @property
+    def full(self) -> bool:
+        """
+        full Is the whole puzzle written?
+
+        :return: True if the puzzle is written in full
+        :rtype: bool
+        """
+
+        return self.data is not None
+
+    def write(self) -> None:
+        """
+        write Write the snapshot to disk
+
+        Only touches the job itself so is safe to call from a worker
+        thread. If the puzzle file is not the one the records were
+        expected to be appended for, nothing is written and stale is
+        set. Writing the whole puzzle removes its journal. Afterwards
+        file holds the size, modification time and CRC-32 of the puzzle
+        file.
+
+        :raises OSError: Failed to write
+        """
+
+        journal = Journal.journalPath(self.path)
+        if self.data is None:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                stat = None
+            if (
+                stat is None
+                or self.file is None
+                or self.file[:2] != (stat.st_size, stat.st_mtime_ns)
+            ):
+                self.stale = True
+                return
+            if self.records:
+                Journal.append(journal, self.records, self.file[0], self.file[2])
+            return
+
+        checksum = zlib.crc32(self.data)
+        atomicWrite(self.path, self.data)
+        # The progress in the old journal is now in the puzzle file. A
+        # journal left behind by a crash is ignored as its header does
+        # not match.
+        try:
+            os.remove(journal)
+        except FileNotFoundError:
+            pass
+        stat = os.stat(self.path)
+        self.file = (stat.st_size, stat.st_mtime_ns, checksum)
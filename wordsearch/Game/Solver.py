@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from collections import deque, namedtuple
+from typing import Any, Iterable
+
+from wordsearch.Game.Trie import ROOT, Trie
+
+Occurrence = namedtuple("Occurrence", ["word", "x", "y", "direction"])
+"""A word found on a board, starting at (x, y) running in direction"""
+
+AXES = [(1, 0), (0, 1), (1, 1), (1, -1)]
+"""Directions lines are scanned in. Reverses are found by the automaton"""
+
+
+def gridRows(grid: Any) -> list[str]:
+    """
+    gridRows Rows of a grid as upper case strings
+
+    Accepts Board.board, a CompactGrid or any list of rows whose cells
+    convert to a single letter with str. Empty cells become NUL so no
+    word can match across them.
+
+    :param grid: Grid to convert
+    :type grid: Any
+    :return: One string per row
+    :rtype: list[str]
+    """
+
+    if hasattr(grid, "rowString"):
+        return [grid.rowString(y).upper() for y in range(len(grid))]
+    return [
+        "".join("\0" if i is None else str(i) for i in row).upper()
+        for row in grid
+    ]
+
+
+def gridLines(rows: list[str]) -> Iterable[tuple[str, int, int, tuple[int, int]]]:
+    """
+    gridLines Every line of a grid along each axis
+
+    :param rows: Rows of grid
+    :type rows: list[str]
+    :return: Iterator of (line, x, y, direction) where (x, y) is the
+        first cell of the line
+    :rtype: Iterable[tuple[str, int, int, tuple[int, int]]]
+    """
+
+    height = len(rows)
+    width = len(rows[0]) if height > 0 else 0
+
+    for y in range(height):
+        yield rows[y], 0, y, (1, 0)
+    for x in range(width):
+        yield "".join(rows[y][x] for y in range(height)), x, 0, (0, 1)
+
+    # Diagonals start on the top row or left column
+    for start in range(-(height-1), width):
+        x = max(start, 0)
+        y = x - start
+        length = min(width - x, height - y)
+        yield "".join(rows[y+i][x+i] for i in range(length)), x, y, (1, 1)
+
+    # Anti diagonals start on the left column or bottom row
+    for start in range(width + height - 1):
+        x = max(start - (height-1), 0)
+        y = start - x
+        length = min(width - x, y + 1)
+        yield "".join(rows[y-i][x+i] for i in range(length)), x, y, (1, -1)
+
+
+class Solver:
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        __init__ Create instance of Solver
+
+        Solver finds every occurrence of a set of words in a grid. An
+        Aho-Corasick automaton is built once over the words and their
+        reverses, so each row, column and diagonal is scanned a single
+        time to find words in all eight directions. Matching ignores
+        case. Palindromes are only reported once, in the forward
+        direction.
+
+        :param words: Words to look for
+        :type words: Iterable[str]
+        """
+
+        self._trie = Trie()
+        for word in set(words):
+            if len(word) == 0:
+                continue
+            upper = word.upper()
+            self._trie.insert(upper, (word, len(upper), False))
+            if upper[::-1] != upper:
+                self._trie.insert(upper[::-1], (word, len(upper), True))
+
+        # Failure links and outputs, built breadth first. A node that
+        # ends no word shares the outputs of its failure node.
+        size = len(self._trie)
+        self._goto = [self._trie.children(i) for i in range(size)]
+        self._fail = [ROOT]*size
+        self._output = [self._trie.values(i) for i in range(size)]
+        queue = deque(self._goto[ROOT].values())
+        while queue:
+            node = queue.popleft()
+            for letter, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail != ROOT and letter not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(letter, ROOT)
+                if target == child:
+                    target = ROOT
+                self._fail[child] = target
+                if len(self._output[target]) > 0:
+                    if len(self._output[child]) > 0:
+                        self._output[child] = self._output[child] + self._output[target]
+                    else:
+                        self._output[child] = self._output[target]
+                queue.append(child)
+
+    def scan(self, line: str) -> list[tuple[int, str, int, bool]]:
+        """
+        scan Find words in a single line
+
+        :param line: Upper case line of letters
+        :type line: str
+        :return: List of (end index, word, length, reversed)
+        :rtype: list[tuple[int, str, int, bool]]
+        """
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matches = []
+        node = ROOT
+
+        for i, letter in enumerate(line):
+            while True:
+                child = goto[node].get(letter)
+                if child is not None:
+                    node = child
+                    break
+                if node == ROOT:
+                    break
+                node = fail[node]
+            for word, length, reverse in output[node]:
+                matches.append((i, word, length, reverse))
+        return matches
+
+    def solve(self, grid: Any) -> list[Occurrence]:
+        """
+        solve Find every occurrence of every word in a grid
+
+        :param grid: Board.board, a CompactGrid or any list of rows
+        :type grid: Any
+        :return: List of occurrences
+        :rtype: list[Occurrence]
+        """
+
+        occurrences = []
+        for line, x, y, (dx, dy) in gridLines(gridRows(grid)):
+            for end, word, length, reverse in self.scan(line):
+                if length == 1 and (dx, dy) != AXES[0]:
+                    # Single letters lie on every axis but are one word
+                    continue
+                if reverse:
+                    # Word is read backwards from the end of the match
+                    occurrences.append(Occurrence(word, x + end*dx, y + end*dy, (-dx, -dy)))
+                else:
+                    start = end - length + 1
+                    occurrences.append(Occurrence(word, x + start*dx, y + start*dy, (dx, dy)))
+        return occurrences
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from typing import Any
+
+ROOT = 0
+"""Node id of the root of every trie"""
+
+
+class Trie:
+    def __init__(self) -> None:
+        """
+        __init__ Create instance of Trie
+
+        Trie is a prefix tree over words. Nodes are referred to by
+        integer ids, starting at ROOT, with the children and values of
+        each node stored in flat lists. Each node can hold any number
+        of values which are returned when a walk ends on that node.
+        """
+
+        self._children: list[dict[str, int]] = [{}]
+        self._values: list[list[Any]] = [[]]
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def insert(self, word: str, value: Any) -> int:
+        """
+        insert Insert a word
+
+        :param word: Word to insert
+        :type word: str
+        :param value: Value to store at the end of the word
+        :type value: Any
+        :return: Id of node the word ends on
+        :rtype: int
+        """
+
+        node = ROOT
+        for letter in word:
+            child = self._children[node].get(letter)
+            if child is None:
+                child = len(self._children)
+                self._children[node][letter] = child
+                self._children.append({})
+                self._values.append([])
+            node = child
+        self._values[node].append(value)
+        return node
+
+    def child(self, node: int, letter: str) -> int|None:
+        """
+        child Follow one letter from a node
+
+        :param node: Id of node
+        :type node: int
+        :param letter: Letter to follow
+        :type letter: str
+        :return: Id of child or None if no word continues with letter
+        :rtype: int|None
+        """
+
+        return self._children[node].get(letter)
+
+    def children(self, node: int) -> dict[str, int]:
+        """
+        children Children of a node
+
+        :param node: Id of node
+        :type node: int
+        :return: Mapping of letter to child id. Must not be modified
+        :rtype: dict[str, int]
+        """
+
+        return self._children[node]
+
+    def values(self, node: int) -> list[Any]:
+        """
+        values Values of words ending on a node
+
+        :param node: Id of node
+        :type node: int
+        :return: List of values. Must not be modified
+        :rtype: list[Any]
+        """
+
+        return self._values[node]
+
+    def find(self, word: str) -> int|None:
+        """
+        find Find the node a word or prefix ends on
+
+        :param word: Word or prefix
+        :type word: str
+        :return: Id of node or None if no word starts with it
+        :rtype: int|None
+        """
+
+        node = ROOT
+        for letter in word:
+            node = self._children[node].get(letter)
+            if node is None:
+                return None
+        return node
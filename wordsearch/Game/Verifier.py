@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+from typing import Any, Iterable
+
+from wordsearch.Game.Solver import AXES, Occurrence, gridLines, gridRows
+
+_BASE = 131
+_MOD = (1 << 61) - 1
+
+
+class Verifier:
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        __init__ Create instance of Verifier
+
+        Verifier counts occurrences of words in a grid using rolling
+        (Rabin-Karp) hashes. Words and their reverses are hashed once
+        and grouped by length. Each line of the grid is then hashed
+        once as a prefix array, after which the hash of every window
+        of a given length is a single subtraction. Hash hits are
+        confirmed by comparing strings. Matching ignores case and
+        palindromes are only reported once.
+
+        :param words: Words to look for
+        :type words: Iterable[str]
+        """
+
+        self._tables: dict[int, dict[int, list[tuple[str, str, bool]]]] = {}
+        for word in set(words):
+            if len(word) == 0:
+                continue
+            upper = word.upper()
+            table = self._tables.setdefault(len(upper), {})
+            table.setdefault(self._hash(upper), []).append((word, upper, False))
+            if upper[::-1] != upper:
+                table.setdefault(self._hash(upper[::-1]), []).append((word, upper[::-1], True))
+
+        self._powers = {i: pow(_BASE, i, _MOD) for i in self._tables}
+
+    @staticmethod
+    def _hash(text: str) -> int:
+        """
+        _hash Hash a string
+
+        :param text: String to hash
+        :type text: str
+        :return: Polynomial hash of the string
+        :rtype: int
+        """
+
+        value = 0
+        for letter in text:
+            value = (value*_BASE + ord(letter)) % _MOD
+        return value
+
+    def scan(self, line: str) -> list[tuple[int, str, int, bool]]:
+        """
+        scan Find words in a single line
+
+        :param line: Upper case line of letters
+        :type line: str
+        :return: List of (start index, word, length, reversed)
+        :rtype: list[tuple[int, str, int, bool]]
+        """
+
+        prefix = [0]
+        value = 0
+        for letter in line:
+            value = (value*_BASE + ord(letter)) % _MOD
+            prefix.append(value)
+
+        matches = []
+        for length, table in self._tables.items():
+            power = self._powers[length]
+            for start in range(len(line) - length + 1):
+                window = (prefix[start+length] - prefix[start]*power) % _MOD
+                candidates = table.get(window)
+                if candidates is None:
+                    continue
+                for word, text, reverse in candidates:
+                    if line[start:start+length] == text:
+                        matches.append((start, word, length, reverse))
+        return matches
+
+    def occurrences(self, grid: Any) -> list[Occurrence]:
+        """
+        occurrences Find every occurrence of every word in a grid
+
+        :param grid: Board.board, a CompactGrid or any list of rows
+        :type grid: Any
+        :return: List of occurrences
+        :rtype: list[wordsearch.Game.Solver.Occurrence]
+        """
+
+        occurrences = []
+        for line, x, y, (dx, dy) in gridLines(gridRows(grid)):
+            for start, word, length, reverse in self.scan(line):
+                if length == 1 and (dx, dy) != AXES[0]:
+                    # Single letters lie on every axis but are one word
+                    continue
+                if reverse:
+                    end = start + length - 1
+                    occurrences.append(Occurrence(word, x + end*dx, y + end*dy, (-dx, -dy)))
+                else:
+                    occurrences.append(Occurrence(word, x + start*dx, y + start*dy, (dx, dy)))
+        return occurrences
@@ -19,6 +19,7 @@ class Word:
         
         self._word = word
         self._found = False
+        self._position: tuple[int, int, tuple[int, int]]|None = None
 
     def length(self) -> int:
         """
@@ -30,6 +31,34 @@ class Word:
 
         return len(self._word)
 
+    def place(self, x: int, y: int, direction: tuple[int, int]) -> None:
+        """
+        place Record where the word is on the board
+
+        :param x: X coordinate of first letter
+        :type x: int
+        :param y: Y coordinate of first letter
+        :type y: int
+        :param direction: Direction of word as (dx, dy)
+        :type direction: tuple[int, int]
+        """
+
+        self._position = (x, y, direction)
+
+    def cells(self) -> list[tuple[int, int]]:
+        """
+        cells Coordinates of each letter of the word
+
+        :return: List of (x, y) coordinates or an empty list if the word
+            has not been placed
+        :rtype: list[tuple[int, int]]
+        """
+
+        if self._position is None:
+            return []
+        x, y, (dx, dy) = self._position
+        return [(x + i*dx, y + i*dy) for i in range(len(self._word))]
+
     @property
     def word(self) -> str:
         """
@@ -50,6 +79,17 @@ class Word:
         """
         raise wordsearch.Game.Errors.OperationNotPermittedError
 
+    @property
+    def position(self) -> tuple[int, int, tuple[int, int]]|None:
+        """
+        position Position of the word on the board
+
+        :return: Tuple of (x, y, direction) or None if not placed
+        :rtype: tuple[int, int, tuple[int, int]]|None
+        """
+
+        return self._position
+
     @property
     def found(self) -> bool:
         """
@@ -1,4 +1,23 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
+import importlib
+
 from wordsearch.Game.Board import Board
+from wordsearch.Game.Dictionary import Dictionary
+from wordsearch.Game.Filler import Filler
+from wordsearch.Game.Solver import Solver
+from wordsearch.Game.PuzzlePack import PackWriter, PuzzlePack
+
+# Exports that pull in heavy dependencies and are imported on first use
+_LAZY = {
+    "Batch": "wordsearch.Game.BatchRunner"
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,11 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
-from wordsearch.App import App
+
+def __getattr__(name: str) -> object:
+    # App pulls in tkinter so is only imported when asked for. This
+    # lets the game engine and command line run without a display.
+    if name == "App":
+        from wordsearch.App import App
+        return App
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,9 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
-from wordsearch.App import App
+import sys
+
+from wordsearch.cli import main
 
 assert len( __package__ ) > 0, """
 The '__main__' module does not seem to have been run in the context of a
@@ -9,9 +11,5 @@ runnable package ... did you forget to add the '-m' flag?
 Usage: python3 -m wordsearch
 """
 
-def main() -> None:
-    app = App()
-    app.run()
-
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
+# SPDX-License-Identifier: MIT
+
+import argparse
+import json
+import os
+import sys
+
+from wordsearch.__version__ import __description__, __version__
+from wordsearch.Game import Board, PackWriter
+from wordsearch.Game.PuzzlePack import COMPRESSION
+import wordsearch.Game.Errors
+import wordsearch.Game.PuzzleFile
+from wordsearch.utils import loadFile
+
+FORMATS = ["puzzle", "pack", "txt", "json"]
+"""Output formats supported by the generate command"""
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    _parser Create the argument parser
+
+    :return: Argument parser
+    :rtype: argparse.ArgumentParser
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m wordsearch",
+        description=__description__
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    commands.add_parser("gui", help="Start the graphical interface (default)")
+
+    generate = commands.add_parser(
+        "generate",
+        help="Generate puzzles without starting the graphical interface"
+    )
+    generate.add_argument("dictionary", help="Word list file, one word per line")
+    generate.add_argument("-W", "--width", type=int, default=15, help="Width of each board (default: %(default)s)")
+    generate.add_argument("-H", "--height", type=int, default=15, help="Height of each board (default: %(default)s)")
+    generate.add_argument("-w", "--words", type=int, default=10, help="Number of words in each puzzle (default: %(default)s)")
+    generate.add_argument("-n", "--count", type=int, default=1, help="Number of puzzles to generate (default: %(default)s)")
+    generate.add_argument("-f", "--format", choices=FORMATS, default="puzzle", help="Output format (default: %(default)s)")
+    generate.add_argument("-o", "--output", default=".", help="Directory to write puzzles to (default: current directory)")
+    generate.add_argument("--compression", choices=[i for i in COMPRESSION if i is not None], help="Compress each puzzle in a pack")
+    generate.add_argument("-s", "--seed", type=int, help="Seed for the batch")
+    generate.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: number of CPUs)")
+    generate.add_argument("--overlap", action="store_true", help="Allow words to cross")
+    generate.add_argument("--compact", action="store_true", help="Use the compact grid representation")
+    generate.add_argument("--unique", action="store_true", help="Make every word appear exactly once")
+
+    convert = commands.add_parser(
+        "convert",
+        help="Convert puzzles saved by older versions to the current format"
+    )
+    convert.add_argument("puzzles", nargs="+", help="Puzzle files to convert in place")
+
+    return parser
+
+
+def _writeText(board: Board, path: str) -> None:
+    """
+    _writeText Write a puzzle as plain text
+
+    Writes the grid, one row per line, followed by a blank line and the
+    words to find.
+
+    :param board: Board to write
+    :type board: wordsearch.Game.Board
+    :param path: Path to write to
+    :type path: str
+    """
+
+    with open(path, "w") as f:
+        for row in board.board:
+            f.write(" ".join(str(i).upper() for i in row))
+            f.write("\n")
+        f.write("\n")
+        for word in board.word_list:
+            f.write(word.word.upper())
+            f.write("\n")
+
+
+def _writeJson(board: Board, path: str) -> None:
+    """
+    _writeJson Write a puzzle as JSON
+
+    :param board: Board to write
+    :type board: wordsearch.Game.Board
+    :param path: Path to write to
+    :type path: str
+    """
+
+    words = []
+    for word in board.word_list:
+        x, y, direction = word.position
+        words.append({
+            "word": word.word,
+            "x": x,
+            "y": y,
+            "direction": list(direction)
+        })
+
+    data = {
+        "reference": board.reference(),
+        "grid": ["".join(str(i) for i in row) for row in board.board],
+        "words": words
+    }
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def _warnConflicts(board: Board, name: str) -> None:
+    """
+    _warnConflicts Warn if a puzzle has more than one copy of a word
+
+    Use --unique to guarantee a single copy of every word.
+
+    :param board: Generated board
+    :type board: wordsearch.Game.Board
+    :param name: Name of puzzle in the warning
+    :type name: str
+    """
+
+    if board.fill_conflicts > 0:
+        print(
+            f"{name}: {board.fill_conflicts} filler letters spell another copy of a word",
+            file=sys.stderr
+        )
+
+
+def _writePack(batch: "wordsearch.Game.Batch", args: argparse.Namespace) -> None:
+    """
+    _writePack Write a batch to a puzzle pack
+
+    Puzzles finish out of order so are held back until the ones before
+    them have been written. At most the number of puzzles the batch has
+    in flight are held.
+
+    :param batch: Batch to write
+    :type batch: wordsearch.Game.Batch
+    :param args: Parsed arguments
+    :type args: argparse.Namespace
+    """
+
+    path = os.path.join(args.output, "puzzles.pack")
+    pending: dict[int, Board] = {}
+    with PackWriter(path, args.compression) as pack:
+        for index, board in batch.run(args.workers):
+            _warnConflicts(board, f"{path}[{index}]")
+            pending[index] = board
+            while len(pack) in pending:
+                pack.add(pending.pop(len(pack)))
+    print(path, flush=True)
+
+
+def generate(args: argparse.Namespace) -> int:
+    """
+    generate Run the generate command
+
+    Puzzles are written to disk as soon as each one is generated. With
+    the pack format every puzzle is written to puzzles.pack in the
+    output directory, in order.
+
+    :param args: Parsed arguments
+    :type args: argparse.Namespace
+    :return: Exit status
+    :rtype: int
+    """
+
+    # Batch loads multiprocessing so is only imported when generating
+    from wordsearch.Game import Batch
+
+    try:
+        words = loadFile(args.dictionary)
+    except OSError as e:
+        print(f"Failed to read word list: {e}", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.output, exist_ok=True)
+    batch = Batch(
+        args.width,
+        args.height,
+        words,
+        args.words,
+        args.count,
+        seed=args.seed,
+        overlap=args.overlap,
+        compact=args.compact,
+        unique=args.unique
+    )
+    digits = len(str(max(args.count - 1, 0)))
+
+    try:
+        if args.format == "pack":
+            _writePack(batch, args)
+            return 0
+        for index, board in batch.run(args.workers):
+            path = os.path.join(args.output, f"puzzle-{index:0{digits}d}.{args.format}")
+            if args.format == "txt":
+                _writeText(board, path)
+            elif args.format == "json":
+                _writeJson(board, path)
+            else:
+                # Nothing has been played so there is no journal to keep
+                with open(path, "wb") as f:
+                    f.write(board.dumps())
+            _warnConflicts(board, path)
+            print(path, flush=True)
+    except wordsearch.Game.Errors.PuzzleSizeError:
+        print("Puzzle is too small for selected words", file=sys.stderr)
+        return 1
+    except wordsearch.Game.Errors.OutOfWordsError:
+        print("Ran out of words in dictionary", file=sys.stderr)
+        return 1
+    except wordsearch.Game.Errors.RetriesExceededError:
+        print("Failed to place words", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def convert(args: argparse.Namespace) -> int:
+    """
+    convert Run the convert command
+
+    Only convert puzzles from trusted sources as older puzzles are
+    loaded with pickle.
+
+    :param args: Parsed arguments
+    :type args: argparse.Namespace
+    :return: Exit status
+    :rtype: int
+    """
+
+    status = 0
+    for path in args.puzzles:
+        try:
+            converted = wordsearch.Game.PuzzleFile.convert(path)
+        except (OSError, wordsearch.Game.Errors.PuzzleFileError) as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            status = 1
+        else:
+            print(f"{path}: {'converted' if converted else 'already current'}")
+    return status
+
+
+def main(argv: list[str]|None = None) -> int:
+    """
+    main Command line entry point
+
+    Without a command the graphical interface is started. The GUI is
+    only imported when it is needed so headless commands never load
+    tkinter.
+
+    :param argv: Arguments excluding program name, defaults to
+        sys.argv[1:]
+    :type argv: list[str]|None, optional
+    :return: Exit status
+    :rtype: int
+    """
+
+    args = _parser().parse_args(argv)
+
+    if args.command == "generate":
+        return generate(args)
+    if args.command == "convert":
+        return convert(args)
+
+    from wordsearch.App import App
+    app = App()
+    app.run()
+    return 0
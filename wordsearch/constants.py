@@ -1,18 +1,16 @@
 # SPDX-FileCopyrightText: 2022 Matthew Nickson <mnickson@sidingsmedia.com>
 # SPDX-License-Identifier: MIT
 
-import json
 import os
-import pkgutil
-import platform
+import sys
 
-MAC = platform.system() == "Darwin"
+MAC = sys.platform == "darwin"
 """Is the current system running macOS?"""
 
-WIN32 = platform.system() == "Windows"
+WIN32 = sys.platform == "win32"
 """Is the current system running windows?"""
 
-LINUX = platform.system() == "Linux"
+LINUX = sys.platform.startswith("linux")
 """Is the current system running linux?"""
 
 HOME = os.path.expanduser("~")
@@ -36,12 +34,18 @@ else:
 SETTINGS_NAME = "settings.json"
 """Settings filename"""
 
-_data = pkgutil.get_data(__name__, "schemas/settings.json")
-SETTINGS_SCHEMA = json.loads(_data)
-"""Settings schema"""
+DICTIONARY_CACHE = os.path.join(BASE_PATH, "dictionaries")
+"""Directory holding normalised copies of word lists"""
 
 RETRIES = 5
-"""Number of attempts made to place a word"""
+"""Number of attempts made to place a word or draw a filler letter"""
+
+DIRECTIONS = [(1, 0), (0, 1)]
+"""Directions words are placed in as (dx, dy) steps"""
+
+CROSSING_SAMPLES = 8
+"""Number of cells holding each letter of a word that are tried when
+looking for a place for it to cross other words"""
 
 ALPHABET = [
     "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M",
@@ -49,3 +53,53 @@ ALPHABET = [
 
 ]
 """Upper case alphabet"""
+
+LETTER_FREQUENCIES = {
+    "A": 8.2, "B": 1.5, "C": 2.8, "D": 4.3, "E": 12.7, "F": 2.2,
+    "G": 2.0, "H": 6.1, "I": 7.0, "J": 0.15, "K": 0.77, "L": 4.0,
+    "M": 2.4, "N": 6.7, "O": 7.5, "P": 1.9, "Q": 0.095, "R": 6.0,
+    "S": 6.3, "T": 9.1, "U": 2.8, "V": 0.98, "W": 2.4, "X": 0.15,
+    "Y": 2.0, "Z": 0.074
+}
+"""Relative frequency of letters in english text as percentages"""
+
+JOURNAL_LIMIT = 1024
+"""Number of records a progress journal holds before the puzzle file is
+rewritten"""
+
+CHECK_FILL_LIMIT = 40000
+"""Boards with more cells than this do not check filler letters for
+copies of words unless asked to, as the check costs far more than
+filling"""
+
+COMPACT_THRESHOLD = 2500
+"""Boards with more cells than this are stored in a CompactGrid"""
+
+MIN_CELL_SIZE = 16
+"""Smallest side length in pixels a cell is drawn at before the board
+scrolls instead of shrinking"""
+
+MAX_ZOOM = 8
+"""Largest zoom factor of the board"""
+
+VIEW_MARGIN = 2
+"""Number of cells drawn beyond each edge of the visible board"""
+
+AUTOSAVE_INTERVAL = 5000
+"""Shortest time in milliseconds between autosaves"""
+
+AUTOSAVE_POLL = 50
+"""Time in milliseconds between checks for a finished save"""
+
+
+def __getattr__(name: str) -> object:
+    # The settings schema is only needed by the GUI so is read and
+    # parsed the first time it is asked for rather than on import.
+    if name == "SETTINGS_SCHEMA":
+        import json
+        import pkgutil
+
+        schema = json.loads(pkgutil.get_data(__name__, "schemas/settings.json"))
+        globals()["SETTINGS_SCHEMA"] = schema
+        return schema
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
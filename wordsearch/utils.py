@@ -2,13 +2,29 @@
 # SPDX-License-Identifier: MIT
 
 import os
-import socket
 
-from wordsearch.constants import BASE_PATH
+from wordsearch.constants import BASE_PATH, DICTIONARY_CACHE
+from wordsearch.Game import Dictionary
+import wordsearch.Game.DictionaryFile
 
 
-def loadFile(path: str) -> list[str]:
-    pass
+def loadFile(path: str) -> Dictionary:
+    """
+    loadFile Load a word list
+
+    The word list is read in one go, normalised and cached under
+    DICTIONARY_CACHE. Later loads of the same unchanged file only read
+    the cache. See wordsearch.Game.DictionaryFile.normalise for which
+    words are kept.
+
+    :param path: Path to word list, one word per line
+    :type path: str
+    :raises OSError: Failed to read word list
+    :return: Words of word list
+    :rtype: wordsearch.Game.Dictionary
+    """
+
+    return wordsearch.Game.DictionaryFile.load(path, DICTIONARY_CACHE)
 
 def getRecentFiles() -> list[str]:
     """
@@ -40,6 +56,9 @@ def getMachineIP() -> str:
     :rtype: str
     """
 
+    # socket is slow to import and only needed here
+    import socket
+
     return socket.gethostbyname(socket.gethostname())
 
 def loadDefaultsFromSchema(schema: dict) -> dict: